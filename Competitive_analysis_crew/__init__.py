@@ -6,7 +6,13 @@ This package provides a comprehensive multi-agent system for automated
 competitive intelligence gathering, analysis, and reporting.
 """
 
-from .crew import CompetitiveAnalysisCrew
-
 __version__ = "1.0.0"
-__all__ = ["CompetitiveAnalysisCrew"]
\ No newline at end of file
+__all__ = ["CompetitiveAnalysisCrew"]
+
+
+def __getattr__(name):
+    """Resolve the crew class lazily so importing the package stays cheap."""
+    if name == "CompetitiveAnalysisCrew":
+        from .crew import CompetitiveAnalysisCrew
+        return CompetitiveAnalysisCrew
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,23 +6,120 @@ role-optimized model selection for different agent types.
 """
 
 import os
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, Any, Optional, Union
+
+import httpx
 import structlog
 
 from langchain_community.chat_models import ChatOpenAI
-from pydantic import BaseModel, Field
 
-logger = structlog.get_logger()
+# Bind the component context once so every event from this module reuses the
+# same pre-bound dict instead of rebuilding it per call
+logger = structlog.get_logger().bind(component="llm_config")
+
+# Validated model names per provider, hoisted to module scope so membership
+# checks are O(1) set probes instead of rebuilding a list on every call.
+_VALID_OPENAI_MODELS = frozenset({
+    'gpt-4o', 'gpt-4o-mini', 'gpt-4-turbo', 'gpt-4',
+    'gpt-3.5-turbo', 'gpt-3.5-turbo-16k'
+})
+_VALID_ANTHROPIC_MODELS = frozenset({
+    'claude-3-5-sonnet-20241022', 'claude-3-opus-20240229',
+    'claude-3-sonnet-20240229', 'claude-3-haiku-20240307'
+})
+
+# Environment variables each provider requires, used to precompute missing
+# credentials once at init instead of probing os.getenv during validation
+_REQUIRED_VARS = MappingProxyType({
+    'openai': ('OPENAI_API_KEY',),
+    'anthropic': ('ANTHROPIC_API_KEY',),
+    'azure': ('AZURE_OPENAI_API_KEY', 'AZURE_OPENAI_ENDPOINT')
+})
+
+# Static name tuples for the init log, so no throwaway key lists are built
+_PROVIDER_NAMES = ('openai', 'anthropic', 'azure', 'local')
+_ROLE_NAMES = ('manager', 'research', 'writing', 'editing',
+               'translation', 'onboarding', 'management')
+
+# Process-wide guard so the LangChain response cache is installed exactly once
+_response_cache_enabled = False
+
+
+def _enable_response_cache() -> None:
+    """
+    Install LangChain's global LLM response cache once per process.
+
+    Identical prompts (agent backstories, tool descriptions) recur across
+    tasks; caching completions in SQLite avoids repeating those network
+    calls. The cache location can be overridden via LLM_CACHE_DB.
+    """
+    global _response_cache_enabled
+    if _response_cache_enabled:
+        return
+    _response_cache_enabled = True
+
+    try:
+        from langchain_core.globals import set_llm_cache
+        from langchain_community.cache import SQLiteCache
+    except ImportError:
+        logger.warning("LangChain cache support not available, LLM responses will not be cached")
+        return
+
+    set_llm_cache(SQLiteCache(database_path=os.getenv('LLM_CACHE_DB', '.llm_cache.db')))
+    logger.info("LLM response cache enabled")
 
 
-class LLMConfig(BaseModel):
-    """Configuration for a specific LLM."""
-    provider: str = Field(..., description="LLM provider (openai, anthropic, azure, local)")
-    model: str = Field(..., description="Model name")
-    temperature: float = Field(default=0.1, description="Temperature setting")
-    max_tokens: Optional[int] = Field(default=None, description="Maximum tokens")
-    api_key: Optional[str] = Field(default=None, description="API key")
-    base_url: Optional[str] = Field(default=None, description="Base URL for API")
+# Optional provider SDK classes, resolved lazily and memoized. Each entry is
+# attempted at most once per process; a failed import is cached as None so
+# misconfigured installs don't pay the ImportError cost on every call.
+_optional_imports: Dict[str, Any] = {}
+
+
+def _import_optional(name: str, module: str, attribute: str) -> Any:
+    """
+    Import an optional provider class once and cache the result.
+
+    Args:
+        name: Cache key for the import
+        module: Module path to import from
+        attribute: Class name to retrieve from the module
+
+    Returns:
+        The imported class, or None if the package is not installed
+    """
+    if name not in _optional_imports:
+        try:
+            imported_module = __import__(module, fromlist=[attribute])
+            _optional_imports[name] = getattr(imported_module, attribute)
+        except ImportError:
+            _optional_imports[name] = None
+    return _optional_imports[name]
+
+
+@dataclass(slots=True, frozen=True)
+class LLMConfig:
+    """
+    Configuration for a specific LLM.
+
+    A plain data carrier (no external input validation), so a slotted frozen
+    dataclass is cheaper to construct and store than a Pydantic model.
+
+    Attributes:
+        provider: LLM provider (openai, anthropic, azure, local)
+        model: Model name
+        temperature: Temperature setting
+        max_tokens: Maximum tokens
+        api_key: API key
+        base_url: Base URL for API
+    """
+    provider: str
+    model: str
+    temperature: float = 0.1
+    max_tokens: Optional[int] = None
+    api_key: Optional[str] = None
+    base_url: Optional[str] = None
 
 
 class LLMConfigManager:
@@ -36,12 +133,55 @@ class LLMConfigManager:
     
     def __init__(self):
         """Initialize the LLM configuration manager."""
-        self.providers = {
+        _enable_response_cache()
+
+        # Cache of live LLM clients keyed by (provider, model, temperature) so
+        # repeated role requests reuse the same instance instead of rebuilding
+        # an HTTP client for every agent.
+        self._llm_cache: Dict[tuple, Any] = {}
+
+        # Snapshot provider credentials once instead of hitting os.getenv on
+        # every client construction, and warn about the primary provider key
+        # a single time here rather than on each call.
+        self._api_keys = {
+            'openai': os.getenv('OPENAI_API_KEY'),
+            'anthropic': os.getenv('ANTHROPIC_API_KEY'),
+            'azure': os.getenv('AZURE_OPENAI_API_KEY'),
+        }
+        self._azure_endpoint = os.getenv('AZURE_OPENAI_ENDPOINT')
+        self._azure_api_version = os.getenv('AZURE_OPENAI_API_VERSION', '2024-02-15-preview')
+
+        if not self._api_keys['openai']:
+            logger.warning("OPENAI_API_KEY not found in environment variables")
+
+        # Precompute which provider credentials are missing from the snapshot
+        # so validate_configuration never touches os.getenv
+        env_snapshot = {
+            'OPENAI_API_KEY': self._api_keys['openai'],
+            'ANTHROPIC_API_KEY': self._api_keys['anthropic'],
+            'AZURE_OPENAI_API_KEY': self._api_keys['azure'],
+            'AZURE_OPENAI_ENDPOINT': os.getenv('AZURE_OPENAI_ENDPOINT'),
+        }
+        self._missing_env = {
+            provider: [var for var in vars_list if not env_snapshot.get(var)]
+            for provider, vars_list in _REQUIRED_VARS.items()
+        }
+
+        # Shared HTTP clients with connection pools so every OpenAI LLM reuses
+        # the same TCP/TLS sessions instead of opening a pool per agent. The
+        # OpenAI SDK client pair wrapping them is built lazily on first use.
+        pool_limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        self._http_client = httpx.Client(limits=pool_limits, timeout=60)
+        self._http_async_client = httpx.AsyncClient(limits=pool_limits, timeout=60)
+        self._openai_clients: Optional[tuple] = None
+
+        # Read-only view: the provider table never changes after init
+        self.providers = MappingProxyType({
             'openai': self._configure_openai,
             'anthropic': self._configure_anthropic,
             'azure': self._configure_azure,
             'local': self._configure_local
-        }
+        })
         
         # Role-optimized model configurations
         self.role_configs = {
@@ -89,9 +229,45 @@ class LLMConfigManager:
             }
         }
         
-        logger.info("LLM Configuration Manager initialized", 
-                   providers=list(self.providers.keys()),
-                   roles=list(self.role_configs.keys()))
+        # Track incomplete role configs incrementally; update_role_config is
+        # the only mutation point, so validate_configuration never has to
+        # rescan every role.
+        self._invalid_roles: set = {
+            role for role, config in self.role_configs.items()
+            if 'provider' not in config or 'model' not in config
+        }
+
+        # Flatten role configs into (config_func, provider, model, temperature)
+        # tuples so get_llm resolves a role with one dict lookup instead of a
+        # chain of .get calls.
+        self._resolved_roles: Dict[str, tuple] = {}
+        for role_name in self.role_configs:
+            self._resolve_role(role_name)
+
+        logger.info("LLM Configuration Manager initialized",
+                   providers=_PROVIDER_NAMES,
+                   roles=_ROLE_NAMES)
+
+    def _resolve_role(self, role: str) -> None:
+        """
+        Precompute the flattened lookup tuple for a role configuration.
+
+        Incomplete configurations (missing provider or model) are left
+        unresolved so get_llm falls back to its caller-supplied defaults.
+
+        Args:
+            role: Role name to resolve
+        """
+        config = self.role_configs.get(role, {})
+        provider = config.get('provider')
+        model = config.get('model')
+        config_func = self.providers.get(provider)
+
+        if config_func and model:
+            temperature = config.get('temperature', 0.1)
+            self._resolved_roles[role] = (config_func, provider, model, temperature)
+        else:
+            self._resolved_roles.pop(role, None)
     
     def get_llm(self, provider: str, model: str, role: str = "general") -> Any:
         """
@@ -105,46 +281,57 @@ class LLMConfigManager:
         Returns:
             Configured LLM instance
         """
-        try:
-            # Get role-specific configuration if available
+        # Fast path: roles with complete configs resolve in one lookup
+        resolved = self._resolved_roles.get(role)
+        if resolved is not None:
+            config_func, provider, model, temperature = resolved
+        else:
+            # Fall back to caller-supplied provider/model for unknown or
+            # incomplete roles
             role_config = self.role_configs.get(role, {})
-            
-            # Override with role-specific settings if available
-            if role_config:
-                provider = role_config.get('provider', provider)
-                model = role_config.get('model', model)
-                temperature = role_config.get('temperature', 0.1)
-            else:
-                temperature = 0.1
-            
-            # Get provider configuration function
+            provider = role_config.get('provider', provider)
+            model = role_config.get('model', model)
+            temperature = role_config.get('temperature', 0.1)
+
             config_func = self.providers.get(provider)
             if not config_func:
-                logger.warning(f"Unknown provider {provider}, falling back to OpenAI")
+                logger.warning("Unknown provider, falling back to OpenAI", provider=provider)
                 config_func = self._configure_openai
                 provider = 'openai'
                 model = 'gpt-4o-mini'
-            
-            # Configure and return LLM
-            llm = config_func(model, temperature, role)
-            
-            logger.info("LLM configured", 
-                       provider=provider, 
-                       model=model, 
-                       role=role,
-                       temperature=temperature)
-            
+
+        # Reuse a cached client when the resolved configuration matches.
+        # Role is deliberately excluded from the key: once provider, model,
+        # and temperature are resolved, distinct roles share the same client.
+        cache_key = (provider, model, temperature)
+        llm = self._llm_cache.get(cache_key)
+        if llm is not None:
             return llm
-            
-        except Exception as e:
-            logger.error("Error configuring LLM", 
-                        provider=provider, 
-                        model=model, 
-                        role=role, 
+
+        # Only the client construction can reasonably fail (missing package,
+        # rejected parameters); anything else should propagate unmasked.
+        try:
+            llm = config_func(model, temperature, role)
+        except (ImportError, KeyError, ValueError) as e:
+            logger.error("Error configuring LLM",
+                        provider=provider,
+                        model=model,
+                        role=role,
                         error=str(e))
-            
+
             # Fallback to basic OpenAI configuration
             return self._configure_openai('gpt-4o-mini', 0.1, role)
+
+        self._llm_cache[cache_key] = llm
+
+        # Debug level: this fires for every LLM build during crew init
+        logger.debug("LLM configured",
+                    provider=provider,
+                    model=model,
+                    role=role,
+                    temperature=temperature)
+
+        return llm
     
     def _configure_openai(self, model: str, temperature: float, role: str) -> ChatOpenAI:
         """
@@ -158,30 +345,50 @@ class LLMConfigManager:
         Returns:
             Configured ChatOpenAI instance
         """
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            logger.warning("OPENAI_API_KEY not found in environment variables")
-        
+        api_key = self._api_keys['openai']
+
         # Model validation and fallback
-        valid_models = [
-            'gpt-4o', 'gpt-4o-mini', 'gpt-4-turbo', 'gpt-4', 
-            'gpt-3.5-turbo', 'gpt-3.5-turbo-16k'
-        ]
-        
-        if model not in valid_models:
-            logger.warning(f"Model {model} not in validated list, using gpt-4o-mini")
+        if model not in _VALID_OPENAI_MODELS:
+            logger.warning("Model not in validated list", model=model, fallback='gpt-4o-mini')
             model = 'gpt-4o-mini'
-        
+
+        client, async_client = self._get_openai_clients()
         return ChatOpenAI(
             model=model,
             temperature=temperature,
             api_key=api_key,
-            max_tokens=None,  # Let the model decide
+            client=client,
+            async_client=async_client,
             model_kwargs={
                 'frequency_penalty': 0.1,
                 'presence_penalty': 0.1
             }
         )
+
+    def _get_openai_clients(self) -> tuple:
+        """
+        Build the shared OpenAI SDK client pair on first use.
+
+        Both clients wrap the pooled httpx clients, so every ChatOpenAI
+        instance multiplexes over the same connections. Without an API key
+        the pair is (None, None) and ChatOpenAI builds its own clients,
+        preserving the original validation error behavior.
+
+        Returns:
+            Tuple of (sync chat completions client, async chat completions client)
+        """
+        if self._openai_clients is None:
+            api_key = self._api_keys['openai']
+            if not api_key:
+                return (None, None)
+
+            import openai
+            self._openai_clients = (
+                openai.OpenAI(api_key=api_key, http_client=self._http_client).chat.completions,
+                openai.AsyncOpenAI(api_key=api_key, http_client=self._http_async_client).chat.completions
+            )
+
+        return self._openai_clients
     
     def _configure_anthropic(self, model: str, temperature: float, role: str) -> Any:
         """
@@ -195,34 +402,27 @@ class LLMConfigManager:
         Returns:
             Configured Anthropic LLM instance
         """
-        try:
-            from langchain_anthropic import ChatAnthropic
-            
-            api_key = os.getenv('ANTHROPIC_API_KEY')
-            if not api_key:
-                logger.warning("ANTHROPIC_API_KEY not found, falling back to OpenAI")
-                return self._configure_openai('gpt-4o-mini', temperature, role)
-            
-            # Model validation and fallback
-            valid_models = [
-                'claude-3-5-sonnet-20241022', 'claude-3-opus-20240229', 
-                'claude-3-sonnet-20240229', 'claude-3-haiku-20240307'
-            ]
-            
-            if model not in valid_models:
-                logger.warning(f"Model {model} not in validated list, using claude-3-5-sonnet")
-                model = 'claude-3-5-sonnet-20241022'
-            
-            return ChatAnthropic(
-                model=model,
-                temperature=temperature,
-                api_key=api_key,
-                max_tokens=4096
-            )
-            
-        except ImportError:
+        ChatAnthropic = _import_optional('anthropic', 'langchain_anthropic', 'ChatAnthropic')
+        if ChatAnthropic is None:
             logger.warning("langchain_anthropic not available, falling back to OpenAI")
             return self._configure_openai('gpt-4o-mini', temperature, role)
+
+        api_key = self._api_keys['anthropic']
+        if not api_key:
+            logger.warning("ANTHROPIC_API_KEY not found, falling back to OpenAI")
+            return self._configure_openai('gpt-4o-mini', temperature, role)
+
+        # Model validation and fallback
+        if model not in _VALID_ANTHROPIC_MODELS:
+            logger.warning("Model not in validated list", model=model, fallback='claude-3-5-sonnet-20241022')
+            model = 'claude-3-5-sonnet-20241022'
+
+        return ChatAnthropic(
+            model=model,
+            temperature=temperature,
+            api_key=api_key,
+            max_tokens=4096
+        )
     
     def _configure_azure(self, model: str, temperature: float, role: str) -> Any:
         """
@@ -236,28 +436,26 @@ class LLMConfigManager:
         Returns:
             Configured Azure OpenAI LLM instance
         """
-        try:
-            from langchain_openai import AzureChatOpenAI
-            
-            api_key = os.getenv('AZURE_OPENAI_API_KEY')
-            endpoint = os.getenv('AZURE_OPENAI_ENDPOINT')
-            api_version = os.getenv('AZURE_OPENAI_API_VERSION', '2024-02-15-preview')
-            
-            if not api_key or not endpoint:
-                logger.warning("Azure OpenAI credentials not found, falling back to OpenAI")
-                return self._configure_openai('gpt-4o-mini', temperature, role)
-            
-            return AzureChatOpenAI(
-                azure_deployment=model,
-                api_version=api_version,
-                temperature=temperature,
-                api_key=api_key,
-                azure_endpoint=endpoint
-            )
-            
-        except ImportError:
+        AzureChatOpenAI = _import_optional('azure', 'langchain_openai', 'AzureChatOpenAI')
+        if AzureChatOpenAI is None:
             logger.warning("Azure OpenAI not available, falling back to OpenAI")
             return self._configure_openai('gpt-4o-mini', temperature, role)
+
+        api_key = self._api_keys['azure']
+        endpoint = self._azure_endpoint
+        api_version = self._azure_api_version
+
+        if not api_key or not endpoint:
+            logger.warning("Azure OpenAI credentials not found, falling back to OpenAI")
+            return self._configure_openai('gpt-4o-mini', temperature, role)
+
+        return AzureChatOpenAI(
+            azure_deployment=model,
+            api_version=api_version,
+            temperature=temperature,
+            api_key=api_key,
+            azure_endpoint=endpoint
+        )
     
     def _configure_local(self, model: str, temperature: float, role: str) -> Any:
         """
@@ -271,20 +469,18 @@ class LLMConfigManager:
         Returns:
             Configured local LLM instance
         """
-        try:
-            from langchain_community.llms import Ollama
-            
-            base_url = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
-            
-            return Ollama(
-                model=model,
-                temperature=temperature,
-                base_url=base_url
-            )
-            
-        except ImportError:
+        Ollama = _import_optional('ollama', 'langchain_community.llms', 'Ollama')
+        if Ollama is None:
             logger.warning("Ollama not available, falling back to OpenAI")
             return self._configure_openai('gpt-4o-mini', temperature, role)
+
+        base_url = os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
+
+        return Ollama(
+            model=model,
+            temperature=temperature,
+            base_url=base_url
+        )
     
     def get_role_config(self, role: str) -> Dict[str, Any]:
         """
@@ -325,10 +521,18 @@ class LLMConfigManager:
         """
         if role in self.role_configs:
             self.role_configs[role].update(config)
-            logger.info(f"Updated configuration for role: {role}")
+            logger.info("Updated configuration for role", role=role)
         else:
             self.role_configs[role] = config
-            logger.info(f"Created new configuration for role: {role}")
+            logger.info("Created new configuration for role", role=role)
+
+        updated = self.role_configs[role]
+        if 'provider' not in updated or 'model' not in updated:
+            self._invalid_roles.add(role)
+        else:
+            self._invalid_roles.discard(role)
+
+        self._resolve_role(role)
     
     def validate_configuration(self) -> Dict[str, Any]:
         """
@@ -343,26 +547,19 @@ class LLMConfigManager:
             'warnings': []
         }
         
-        # Check for required environment variables
-        required_vars = {
-            'openai': ['OPENAI_API_KEY'],
-            'anthropic': ['ANTHROPIC_API_KEY'],
-            'azure': ['AZURE_OPENAI_API_KEY', 'AZURE_OPENAI_ENDPOINT']
-        }
-        
-        for provider, vars_list in required_vars.items():
-            missing_vars = [var for var in vars_list if not os.getenv(var)]
+        # Check for required environment variables using the init-time snapshot
+        for provider, missing_vars in self._missing_env.items():
             if missing_vars:
                 validation_results['warnings'].append(
                     f"Missing environment variables for {provider}: {missing_vars}"
                 )
         
-        # Check role configurations
-        for role, config in self.role_configs.items():
-            if 'provider' not in config or 'model' not in config:
-                validation_results['issues'].append(
-                    f"Incomplete configuration for role {role}"
-                )
-                validation_results['valid'] = False
-        
+        # Check role configurations via the incrementally maintained set
+        for role in sorted(self._invalid_roles):
+            validation_results['issues'].append(
+                f"Incomplete configuration for role {role}"
+            )
+        if self._invalid_roles:
+            validation_results['valid'] = False
+
         return validation_results
\ No newline at end of file
@@ -7,119 +7,189 @@ the competitive analysis crew. It serves as the primary interface for users
 to interact with the crew functionality.
 """
 
+import functools
 import sys
-import warnings
 from typing import Optional
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
 
-from Competitive_analysis_crew.crew import CompetitiveAnalysisCrew
+# Rich console, created lazily so `--help` never pays for it
+_console = None
 
-# Suppress warnings for cleaner output
-warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
-warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
-
-# Initialize Rich console for better CLI output
-console = Console()
 app = typer.Typer(help="Competitive Analysis Crew - Enterprise-grade market intelligence automation")
 
 
-@app.command()
+def _register_commands():
+    """Register every subcommand and prewarm the crew import when one is named.
+
+    All four commands are always registered: with a single command and no
+    callback, typer collapses the app so that command becomes the root,
+    and the subcommand name on argv is then parsed as the command's first
+    argument. The ``sys.argv[1]`` sniff only decides whether to start the
+    crew import in the background — once the user has committed to a real
+    command, the thread overlaps the import with typer's argument parsing
+    and console setup, and the command's own deferred import then either
+    hits sys.modules or waits on the already-running import.
+    """
+    commands = {
+        "run": run,
+        "train": train,
+        "replay": replay,
+        "test": test,
+    }
+    for func in commands.values():
+        app.command()(func)
+    if len(sys.argv) > 1 and sys.argv[1] in commands:
+        import threading
+        threading.Thread(target=_import_crew, daemon=True).start()
+
+
+def _import_crew():
+    """Load the crew class, filtering the noisy warnings its imports emit.
+
+    The filters only matter once pysbd and pydantic actually load, so they
+    are applied here rather than at module top — `--help` and argument
+    errors never touch the warnings machinery.
+    """
+    import warnings
+    warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
+    warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
+    from Competitive_analysis_crew.crew import CompetitiveAnalysisCrew
+    return CompetitiveAnalysisCrew
+
+
+@functools.lru_cache(maxsize=1)
+def _get_crew():
+    """Build the crew once per process and reuse it across commands.
+
+    Construction walks the YAML config, registers tools and initializes
+    the per-role LLM clients, so callers that invoke more than one command
+    in the same process (tests, a REPL, a future daemon) shouldn't repeat
+    it.
+    """
+    return _import_crew()().crew()
+
+
+def _get_console():
+    """Create the Rich console on first use and reuse it afterwards."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+def _handle_errors(label):
+    """Wrap a command so failures print one styled error and exit non-zero.
+
+    Replaces the try/except block each command used to carry, which also
+    forced every command to resolve the console on the happy path of its
+    own error handling.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except typer.Exit:
+                raise
+            except Exception as e:
+                _get_console().print(f"[bold red]✗ Error occurred while {label}:[/bold red] {e}")
+                raise typer.Exit(1)
+        return wrapper
+    return decorator
+
+
+@_handle_errors("running the crew")
 def run():
     """
     Run the competitive analysis crew.
-    
+
     This function initializes and executes the complete competitive analysis workflow,
     including user onboarding, research, report generation, and optional translation.
     """
-    try:
-        console.print(Panel.fit(
-            "[bold blue]Competitive Analysis Crew[/bold blue]\n"
-            "Enterprise-grade market intelligence automation",
-            border_style="blue"
-        ))
-        
-        # Initialize and run the crew
-        crew_instance = CompetitiveAnalysisCrew()
-        result = crew_instance.crew().kickoff()
-        
-        console.print("\n[bold green]✓ Analysis completed successfully![/bold green]")
-        return result
-        
-    except Exception as e:
-        console.print(f"[bold red]✗ Error occurred while running the crew:[/bold red] {e}")
-        raise typer.Exit(1)
-
-
-@app.command()
+    # Deferred imports: loading the CrewAI stack here keeps `--help` and
+    # argument errors fast
+    import asyncio
+
+    from rich.panel import Panel
+
+    console = _get_console()
+    console.print(Panel.fit(
+        "[bold blue]Competitive Analysis Crew[/bold blue]\n"
+        "Enterprise-grade market intelligence automation",
+        border_style="blue"
+    ))
+
+    # Run the crew. kickoff_async keeps an event loop available so
+    # agent tool calls can overlap their network I/O instead of
+    # serializing every HTTP round-trip.
+    crew = _get_crew()
+
+    async def _kickoff():
+        return await crew.kickoff_async()
+
+    result = asyncio.run(_kickoff())
+
+    console.print("\n[bold green]✓ Analysis completed successfully![/bold green]")
+    return result
+
+
+@_handle_errors("training the crew")
 def train(
     n_iterations: int = typer.Argument(..., help="Number of training iterations"),
     filename: str = typer.Argument(..., help="Filename to save training results")
 ):
     """
     Train the crew for a given number of iterations.
-    
+
     This command runs the crew multiple times to improve its performance
     through iterative learning and optimization.
     """
-    try:
-        console.print(f"[bold yellow]Training crew for {n_iterations} iterations...[/bold yellow]")
-        
-        crew_instance = CompetitiveAnalysisCrew()
-        crew_instance.crew().train(n_iterations=n_iterations, filename=filename)
-        
-        console.print(f"[bold green]✓ Training completed! Results saved to {filename}[/bold green]")
-        
-    except Exception as e:
-        console.print(f"[bold red]✗ Error occurred while training the crew:[/bold red] {e}")
-        raise typer.Exit(1)
-
-
-@app.command()
+    console = _get_console()
+    console.print(f"[bold yellow]Training crew for {n_iterations} iterations...[/bold yellow]")
+
+    _get_crew().train(n_iterations=n_iterations, filename=filename)
+
+    console.print(f"[bold green]✓ Training completed! Results saved to {filename}[/bold green]")
+
+
+@_handle_errors("replaying the crew")
 def replay(task_id: str = typer.Argument(..., help="Task ID to replay from")):
     """
     Replay the crew execution from a specific task.
-    
+
     This command allows you to restart the crew execution from a particular
     task, useful for debugging or continuing from a specific point.
     """
-    try:
-        console.print(f"[bold yellow]Replaying crew from task: {task_id}[/bold yellow]")
-        
-        crew_instance = CompetitiveAnalysisCrew()
-        crew_instance.crew().replay(task_id=task_id)
-        
-        console.print("[bold green]✓ Replay completed successfully![/bold green]")
-        
-    except Exception as e:
-        console.print(f"[bold red]✗ Error occurred while replaying the crew:[/bold red] {e}")
-        raise typer.Exit(1)
-
-
-@app.command()
+    console = _get_console()
+    console.print(f"[bold yellow]Replaying crew from task: {task_id}[/bold yellow]")
+
+    _get_crew().replay(task_id=task_id)
+
+    console.print("[bold green]✓ Replay completed successfully![/bold green]")
+
+
+@_handle_errors("testing the crew")
 def test(
     n_iterations: int = typer.Argument(..., help="Number of test iterations"),
     model_name: str = typer.Argument(..., help="OpenAI model name to test with")
 ):
     """
     Test the crew execution and return the results.
-    
+
     This command runs comprehensive tests on the crew to validate
     its functionality and performance with different configurations.
     """
-    try:
-        console.print(f"[bold yellow]Testing crew with {n_iterations} iterations using {model_name}...[/bold yellow]")
-        
-        crew_instance = CompetitiveAnalysisCrew()
-        crew_instance.crew().test(n_iterations=n_iterations, openai_model_name=model_name)
-        
-        console.print("[bold green]✓ Testing completed successfully![/bold green]")
-        
-    except Exception as e:
-        console.print(f"[bold red]✗ Error occurred while testing the crew:[/bold red] {e}")
-        raise typer.Exit(1)
+    console = _get_console()
+    console.print(f"[bold yellow]Testing crew with {n_iterations} iterations using {model_name}...[/bold yellow]")
+
+    _get_crew().test(n_iterations=n_iterations, openai_model_name=model_name)
+
+    console.print("[bold green]✓ Testing completed successfully![/bold green]")
+
+
+_register_commands()
 
 
 if __name__ == "__main__":
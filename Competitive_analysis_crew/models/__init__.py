@@ -5,22 +5,35 @@ This module provides comprehensive data models for the competitive analysis crew
 ensuring type safety and data validation throughout the workflow.
 """
 
-from .company import CompanyProfile, FinancialData, NewsItem
-from .analysis import CompetitiveAnalysisReport, CompetitiveLandscape, MarketAnalysis, Recommendation
-from .research import ResearchDossier, MarketContext, ResearchMetadata
-from .validation import ValidationCriteria, ValidationResult
+from importlib import import_module
 
-__all__ = [
-    "CompanyProfile",
-    "FinancialData", 
-    "NewsItem",
-    "CompetitiveAnalysisReport",
-    "CompetitiveLandscape",
-    "MarketAnalysis",
-    "Recommendation",
-    "ResearchDossier",
-    "MarketContext",
-    "ResearchMetadata",
-    "ValidationCriteria",
-    "ValidationResult",
-]
\ No newline at end of file
+# Re-exported names mapped to the submodule that defines them. Resolved
+# lazily so importing one model family doesn't compile the others.
+_EXPORTS = {
+    "CompanyProfile": "company",
+    "FinancialData": "company",
+    "NewsItem": "company",
+    "CompetitiveAnalysisReport": "analysis",
+    "CompetitiveLandscape": "analysis",
+    "MarketAnalysis": "analysis",
+    "Recommendation": "analysis",
+    "ResearchDossier": "research",
+    "MarketContext": "research",
+    "ResearchMetadata": "research",
+    "ValidationCriteria": "validation",
+    "ValidationResult": "validation",
+    "shared_now": "analysis",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Resolve re-exported models lazily on first attribute access."""
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
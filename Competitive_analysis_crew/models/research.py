@@ -5,54 +5,65 @@ This module defines data structures for research context, metadata,
 and the overall research dossier used throughout the analysis process.
 """
 
+import sys
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Set
-from pydantic import BaseModel, Field, validator
-from enum import Enum
+from functools import cached_property, lru_cache
+from typing import Annotated, ClassVar, List, Literal, Optional, Dict, Any, Set, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter, field_validator
+from pydantic.dataclasses import dataclass
 
+from .analysis import _now, shared_now
 from .company import CompanyProfile
 
+# Plain string tags typed as Literal unions: pydantic-core specializes
+# these into a precomputed lookup, skipping the enum-call round-trip a
+# (str, Enum) subclass pays on every validation. Neither type carried
+# behavior beyond its values.
 
-class ResearchScope(str, Enum):
-    """Defines the scope of research to be conducted."""
-    BASIC = "basic"
-    COMPREHENSIVE = "comprehensive"
-    DEEP_DIVE = "deep_dive"
-    COMPETITIVE_INTELLIGENCE = "competitive_intelligence"
+ResearchScope = Literal["basic", "comprehensive", "deep_dive", "competitive_intelligence"]
+"""Defines the scope of research to be conducted."""
 
+ResearchPriority = Literal["low", "medium", "high", "urgent"]
+"""Priority levels for research tasks."""
 
-class ResearchPriority(str, Enum):
-    """Priority levels for research tasks."""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    URGENT = "urgent"
+# Shared constrained aliases: one Annotated definition lets pydantic-core
+# reuse a single validator node for every field carrying the constraint,
+# instead of building a fresh float validator per field.
+Score01 = Annotated[float, Field(ge=0.0, le=1.0)]
+Score0100 = Annotated[float, Field(ge=0.0, le=100.0)]
 
 
-class DataSource(BaseModel):
+# Pydantic dataclasses with slots for the plain data carriers below:
+# they have no behavior, are created in bulk, and the slot layout drops
+# the per-instance __dict__ and __pydantic_fields_set__ that a BaseModel
+# carries, while keeping full field validation.
+@dataclass(slots=True)
+class DataSource:
     """Represents a data source for research."""
     
     name: str = Field(..., description="Data source name")
     type: str = Field(..., description="Type of data source")
     url: Optional[str] = Field(None, description="Source URL if applicable")
     access_method: str = Field(..., description="How to access this source")
-    reliability: float = Field(
+    reliability: Score01 = Field(
         ...,
-        ge=0.0,
-        le=1.0,
         description="Reliability score of the source"
     )
     cost: Optional[str] = Field(None, description="Cost to access if applicable")
     update_frequency: Optional[str] = Field(None, description="How often source is updated")
+
+    @field_validator('type', 'access_method', mode='after')
+    @classmethod
+    def intern_category_strings(cls, v):
+        # These fields hold a handful of recurring tags; interning makes
+        # duplicates share one string object across many sources.
+        return sys.intern(v)
     
-    @validator('reliability')
-    def validate_reliability(cls, v):
-        if v < 0.0 or v > 1.0:
-            raise ValueError('Reliability must be between 0.0 and 1.0')
-        return v
 
 
-class ResearchQuestion(BaseModel):
+@dataclass(slots=True)
+class ResearchQuestion:
     """Represents a specific research question to be answered."""
     
     question: str = Field(..., description="The research question")
@@ -69,6 +80,13 @@ class ResearchQuestion(BaseModel):
     assigned_agent: Optional[str] = Field(None, description="Agent assigned to this question")
     status: str = Field(default="pending", description="Current status")
 
+    @field_validator('category', 'assigned_agent', 'status', mode='after')
+    @classmethod
+    def intern_category_strings(cls, v):
+        # Recurring tag strings; interned so duplicates share memory
+        # across large question batches.
+        return sys.intern(v) if v is not None else v
+
 
 class MarketContext(BaseModel):
     """
@@ -77,12 +95,17 @@ class MarketContext(BaseModel):
     This model captures the broader market environment and conditions
     that influence the competitive landscape.
     """
+
+    # Deferred build: the core validator is compiled on first validation
+    # instead of at import, so processes that never construct research
+    # models (e.g. a report-viewing CLI) skip the schema-build cost.
+    model_config = ConfigDict(defer_build=True)
     
     # Market definition
     market_name: str = Field(..., description="Name of the market being analyzed")
     market_definition: str = Field(..., description="Clear definition of the market scope")
-    geographic_scope: List[str] = Field(
-        default_factory=list,
+    geographic_scope: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Geographic regions included in analysis"
     )
     time_period: str = Field(..., description="Time period for the analysis")
@@ -98,8 +121,8 @@ class MarketContext(BaseModel):
         None,
         description="Current economic conditions affecting the market"
     )
-    regulatory_environment: List[str] = Field(
-        default_factory=list,
+    regulatory_environment: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Key regulatory factors"
     )
     technological_trends: List[str] = Field(
@@ -140,11 +163,13 @@ class ResearchMetadata(BaseModel):
     This model tracks the research methodology, constraints,
     and quality parameters for the competitive analysis.
     """
+
+    model_config = ConfigDict(defer_build=True)  # see MarketContext
     
     # Research parameters
     research_scope: ResearchScope = Field(..., description="Scope of research")
     start_date: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="Research start date"
     )
     target_completion: Optional[datetime] = Field(
@@ -181,10 +206,8 @@ class ResearchMetadata(BaseModel):
     )
     
     # Quality parameters
-    minimum_confidence_threshold: float = Field(
+    minimum_confidence_threshold: Score01 = Field(
         default=0.7,
-        ge=0.0,
-        le=1.0,
         description="Minimum confidence threshold for findings"
     )
     required_source_count: int = Field(
@@ -209,28 +232,62 @@ class ResearchMetadata(BaseModel):
     )
     
     # Progress tracking
-    completion_percentage: float = Field(
+    completion_percentage: Score0100 = Field(
         default=0.0,
-        ge=0.0,
-        le=100.0,
         description="Research completion percentage"
     )
-    milestones: Dict[str, bool] = Field(
-        default_factory=dict,
-        description="Research milestones and completion status"
+    # Milestones are tracked as a bitmask over the fixed key set below:
+    # one int per metadata instance instead of a dict entry (~150 B) per
+    # milestone, and "everything done" is a single integer comparison.
+    milestones_mask: int = Field(
+        default=0,
+        ge=0,
+        description="Bitmask of completed research milestones"
     )
+
+    MILESTONE_KEYS: ClassVar[Tuple[str, ...]] = (
+        "scoping_complete",
+        "sources_approved",
+        "data_collection_complete",
+        "competitor_profiles_complete",
+        "findings_validated",
+        "final_review_complete",
+    )
+    _ALL_MILESTONES_MASK: ClassVar[int] = (1 << len(MILESTONE_KEYS)) - 1
+
+    def set_milestone(self, name: str, done: bool = True) -> None:
+        """Mark a milestone as done (or not) by name."""
+        bit = 1 << self.MILESTONE_KEYS.index(name)
+        if done:
+            self.milestones_mask |= bit
+        else:
+            self.milestones_mask &= ~bit
+
+    def get_milestone(self, name: str) -> bool:
+        """Return whether the named milestone is complete."""
+        return bool(self.milestones_mask & (1 << self.MILESTONE_KEYS.index(name)))
+
+    @property
+    def milestones(self) -> Dict[str, bool]:
+        """Expanded name-to-status view of the milestone bitmask."""
+        return {name: self.get_milestone(name) for name in self.MILESTONE_KEYS}
+
+    @property
+    def all_milestones_complete(self) -> bool:
+        """Whether every milestone bit is set (one integer comparison)."""
+        return self.milestones_mask == self._ALL_MILESTONES_MASK
+
+    @cached_property
+    def approved_source_names(self) -> frozenset:
+        """Frozenset of approved source names for O(1) membership checks."""
+        return frozenset(source.name for source in self.approved_sources)
+
+    @cached_property
+    def excluded_sources_set(self) -> frozenset:
+        """Frozenset of excluded sources for O(1) membership checks."""
+        return frozenset(self.excluded_sources)
     
-    @validator('minimum_confidence_threshold')
-    def validate_confidence_threshold(cls, v):
-        if v < 0.0 or v > 1.0:
-            raise ValueError('Confidence threshold must be between 0.0 and 1.0')
-        return v
     
-    @validator('completion_percentage')
-    def validate_completion_percentage(cls, v):
-        if v < 0.0 or v > 100.0:
-            raise ValueError('Completion percentage must be between 0.0 and 100.0')
-        return v
 
 
 class ResearchDossier(BaseModel):
@@ -246,11 +303,11 @@ class ResearchDossier(BaseModel):
     dossier_id: str = Field(..., description="Unique identifier for this dossier")
     project_name: str = Field(..., description="Name of the research project")
     created_at: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="Dossier creation timestamp"
     )
     last_updated: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="Last update timestamp"
     )
     
@@ -297,10 +354,8 @@ class ResearchDossier(BaseModel):
         default_factory=list,
         description="Validation notes and checks performed"
     )
-    confidence_assessment: Optional[float] = Field(
+    confidence_assessment: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Overall confidence in research quality"
     )
     
@@ -317,17 +372,92 @@ class ResearchDossier(BaseModel):
         default=False,
         description="Whether approval is required before proceeding"
     )
+
+    # Batch-update state: while a batch_updates() block is open, mutators
+    # skip the per-call timestamp write and the exit coalesces them into
+    # one wall-clock read.
+    _in_batch: bool = PrivateAttr(default=False)
+    _batch_dirty: bool = PrivateAttr(default=False)
+
+    @field_validator('review_status', mode='after')
+    @classmethod
+    def intern_review_status(cls, v):
+        # A small closed set of workflow states; interned for identity
+        # comparisons and shared storage across dossiers.
+        return sys.intern(v)
     
-    @validator('confidence_assessment')
-    def validate_confidence_assessment(cls, v):
-        if v is not None and (v < 0.0 or v > 1.0):
-            raise ValueError('Confidence assessment must be between 0.0 and 1.0')
-        return v
     
+    model_config = ConfigDict(
+        defer_build=True,  # see MarketContext
+        json_schema_extra={
+            "example": {
+                "dossier_id": "CA-2024-001",
+                "project_name": "Cloud Analytics Competitive Analysis",
+                "target_companies": ["TechCorp", "DataSoft", "AnalyticsPro"],
+                "review_status": "in_progress",
+                "confidence_assessment": 0.85
+            }
+        }
+    )
+
+    @classmethod
+    def json_schema_cached(cls) -> Dict[str, Any]:
+        """Return the model's JSON schema, generated once per process.
+
+        Schema generation walks the whole nested model graph and costs
+        hundreds of microseconds; the models are static, so repeat callers
+        share one frozen result.
+        """
+        return _dossier_json_schema()
+
+    @classmethod
+    def build_trusted(cls, **data) -> "ResearchDossier":
+        """Build a dossier from trusted in-process data without validation.
+
+        Intended for the crew's own assembly paths, where nested models
+        (CompanyProfile, MarketContext, ResearchMetadata) are already
+        validated instances; the caller guarantees field types. Skips the
+        per-field validation loop entirely via model_construct.
+        """
+        return cls.model_construct(**data)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the dossier to JSON bytes for bulk export.
+
+        orjson encodes the nested datetimes and dataclasses in C, which is
+        several times faster than the stdlib json path for dossiers with
+        large competitor and question lists.
+        """
+        import orjson
+
+        return orjson.dumps(self.model_dump(mode="python"))
+
     def update_timestamp(self):
         """Update the last_updated timestamp."""
-        self.last_updated = datetime.now()
-    
+        if self._in_batch:
+            self._batch_dirty = True
+        else:
+            self.last_updated = _now()
+
+    @contextmanager
+    def batch_updates(self):
+        """Coalesce timestamp writes across a block of mutations.
+
+        Inside the block add_finding/add_competitor only mark the dossier
+        dirty; last_updated is written once on exit if anything changed,
+        so adding fifty findings costs one clock read instead of fifty.
+        """
+        self._in_batch = True
+        self._batch_dirty = False
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            if self._batch_dirty:
+                self._batch_dirty = False
+                self.last_updated = _now()
+
     def add_finding(self, finding: str):
         """Add a new key finding."""
         self.key_findings.append(finding)
@@ -337,18 +467,24 @@ class ResearchDossier(BaseModel):
         """Add a new competitor profile."""
         self.competitors.append(competitor)
         self.update_timestamp()
-    
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        schema_extra = {
-            "example": {
-                "dossier_id": "CA-2024-001",
-                "project_name": "Cloud Analytics Competitive Analysis",
-                "target_companies": ["TechCorp", "DataSoft", "AnalyticsPro"],
-                "review_status": "in_progress",
-                "confidence_assessment": 0.85
-            }
-        }
\ No newline at end of file
+
+
+@lru_cache(maxsize=1)
+def _dossier_json_schema() -> Dict[str, Any]:
+    return ResearchDossier.model_json_schema()
+
+
+# Module-level list adapters for bulk ingestion of competitor profiles
+# and research questions; see validation.py for the same pattern.
+COMPANY_PROFILE_LIST_ADAPTER = TypeAdapter(List[CompanyProfile])
+RESEARCH_QUESTION_LIST_ADAPTER = TypeAdapter(List[ResearchQuestion])
+
+
+def validate_competitors(raw: List[Any]) -> List[CompanyProfile]:
+    """Validate a raw batch of competitor profiles in one adapter call."""
+    return COMPANY_PROFILE_LIST_ADAPTER.validate_python(raw)
+
+
+def validate_research_questions(raw: List[Any]) -> List[ResearchQuestion]:
+    """Validate a raw batch of research questions in one adapter call."""
+    return RESEARCH_QUESTION_LIST_ADAPTER.validate_python(raw)
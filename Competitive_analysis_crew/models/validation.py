@@ -6,30 +6,35 @@ ensuring enterprise-grade output standards.
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
-from enum import Enum
+from functools import cached_property, lru_cache
+from itertools import chain
+from typing import Annotated, List, Literal, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
+from pydantic.dataclasses import dataclass
 
+from .analysis import _now
 
-class ValidationStatus(str, Enum):
-    """Status of validation checks."""
-    PENDING = "pending"
-    PASSED = "passed"
-    FAILED = "failed"
-    WARNING = "warning"
-    SKIPPED = "skipped"
+# Plain string tags typed as Literal unions; see research.py for the
+# rationale (specialized core lookup instead of enum dispatch).
 
+ValidationStatus = Literal["pending", "passed", "failed", "warning", "skipped"]
+"""Status of validation checks."""
 
-class ValidationSeverity(str, Enum):
-    """Severity levels for validation issues."""
-    INFO = "info"
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+ValidationSeverity = Literal["info", "low", "medium", "high", "critical"]
+"""Severity levels for validation issues."""
 
+# Shared constrained aliases; see research.py — one Annotated definition
+# is reused as a single validator node across every constrained field.
+Score01 = Annotated[float, Field(ge=0.0, le=1.0)]
+Score0100 = Annotated[float, Field(ge=0.0, le=100.0)]
 
-class ValidationCheck(BaseModel):
+
+# Slotted pydantic dataclasses for the check carriers: a single
+# ValidationResult can hold hundreds of checks, and the slot layout
+# removes the per-instance __dict__ and fields-set bookkeeping while
+# keeping field validation intact.
+@dataclass(slots=True)
+class ValidationCheck:
     """Represents a single validation check."""
     
     check_name: str = Field(..., description="Name of the validation check")
@@ -39,10 +44,8 @@ class ValidationCheck(BaseModel):
     
     # Check results
     passed: bool = Field(..., description="Whether the check passed")
-    score: Optional[float] = Field(
+    score: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Numeric score for this check (0.0 to 1.0)"
     )
     message: Optional[str] = Field(None, description="Detailed message about the check")
@@ -59,27 +62,21 @@ class ValidationCheck(BaseModel):
     
     # Metadata
     checked_at: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="When this check was performed"
     )
     checker_version: Optional[str] = Field(None, description="Version of the checker used")
     
-    @validator('score')
-    def validate_score(cls, v):
-        if v is not None and (v < 0.0 or v > 1.0):
-            raise ValueError('Score must be between 0.0 and 1.0')
-        return v
 
 
+@dataclass(slots=True)
 class ContentQualityCheck(ValidationCheck):
     """Specific validation check for content quality."""
     
     # Content-specific metrics
     word_count: Optional[int] = Field(None, ge=0, description="Word count")
-    readability_score: Optional[float] = Field(
+    readability_score: Optional[Score0100] = Field(
         None,
-        ge=0.0,
-        le=100.0,
         description="Readability score"
     )
     grammar_issues: int = Field(default=0, ge=0, description="Number of grammar issues")
@@ -91,21 +88,15 @@ class ContentQualityCheck(ValidationCheck):
     has_methodology: bool = Field(default=False, description="Has methodology section")
     section_count: int = Field(default=0, ge=0, description="Number of sections")
     
-    @validator('readability_score')
-    def validate_readability_score(cls, v):
-        if v is not None and (v < 0.0 or v > 100.0):
-            raise ValueError('Readability score must be between 0.0 and 100.0')
-        return v
 
 
+@dataclass(slots=True)
 class DataQualityCheck(ValidationCheck):
     """Specific validation check for data quality."""
     
     # Data completeness
-    completeness_score: Optional[float] = Field(
+    completeness_score: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Data completeness score"
     )
     missing_fields: List[str] = Field(
@@ -114,10 +105,8 @@ class DataQualityCheck(ValidationCheck):
     )
     
     # Data accuracy
-    accuracy_score: Optional[float] = Field(
+    accuracy_score: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Data accuracy score"
     )
     inconsistencies: List[str] = Field(
@@ -128,18 +117,11 @@ class DataQualityCheck(ValidationCheck):
     # Source validation
     source_count: int = Field(default=0, ge=0, description="Number of sources")
     verified_sources: int = Field(default=0, ge=0, description="Number of verified sources")
-    source_reliability: Optional[float] = Field(
+    source_reliability: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Average source reliability"
     )
     
-    @validator('completeness_score', 'accuracy_score', 'source_reliability')
-    def validate_scores(cls, v):
-        if v is not None and (v < 0.0 or v > 1.0):
-            raise ValueError('Score must be between 0.0 and 1.0')
-        return v
 
 
 class ValidationCriteria(BaseModel):
@@ -149,12 +131,14 @@ class ValidationCriteria(BaseModel):
     This model specifies what constitutes acceptable quality
     for different aspects of the competitive analysis.
     """
+
+    # Deferred build: compile the core validator on first use rather
+    # than at import; see the research models for the same tradeoff.
+    model_config = ConfigDict(defer_build=True)
     
     # Overall quality thresholds
-    minimum_overall_score: float = Field(
+    minimum_overall_score: Score01 = Field(
         default=0.7,
-        ge=0.0,
-        le=1.0,
         description="Minimum overall quality score required"
     )
     critical_issues_allowed: int = Field(
@@ -174,24 +158,18 @@ class ValidationCriteria(BaseModel):
         ge=0,
         description="Maximum grammar errors allowed"
     )
-    minimum_readability_score: float = Field(
+    minimum_readability_score: Score0100 = Field(
         default=60.0,
-        ge=0.0,
-        le=100.0,
         description="Minimum readability score"
     )
     
     # Data quality criteria
-    minimum_completeness: float = Field(
+    minimum_completeness: Score01 = Field(
         default=0.8,
-        ge=0.0,
-        le=1.0,
         description="Minimum data completeness required"
     )
-    minimum_accuracy: float = Field(
+    minimum_accuracy: Score01 = Field(
         default=0.85,
-        ge=0.0,
-        le=1.0,
         description="Minimum data accuracy required"
     )
     minimum_source_count: int = Field(
@@ -199,21 +177,22 @@ class ValidationCriteria(BaseModel):
         ge=1,
         description="Minimum number of sources required"
     )
-    minimum_source_reliability: float = Field(
+    minimum_source_reliability: Score01 = Field(
         default=0.7,
-        ge=0.0,
-        le=1.0,
         description="Minimum average source reliability"
     )
     
     # Structure requirements
-    required_sections: List[str] = Field(
-        default_factory=lambda: [
+    # Tuple rather than list: the section set is config-like and never
+    # mutated, the tuple validator is shorter, and hashability lets
+    # downstream caches key on it.
+    required_sections: Tuple[str, ...] = Field(
+        default_factory=lambda: (
             "executive_summary",
             "methodology",
             "competitive_landscape",
             "recommendations"
-        ],
+        ),
         description="Required sections in the report"
     )
     
@@ -228,18 +207,18 @@ class ValidationCriteria(BaseModel):
         ge=1,
         description="Minimum number of recommendations"
     )
+
+    @cached_property
+    def required_sections_set(self) -> frozenset:
+        """Frozenset of required sections for O(1) membership checks.
+
+        Consumers testing report sections against the criteria should use
+        this instead of scanning the tuple. Plain cached_property rather
+        than computed_field so it stays out of serialized output.
+        """
+        return frozenset(self.required_sections)
     
-    @validator('minimum_overall_score', 'minimum_completeness', 'minimum_accuracy', 'minimum_source_reliability')
-    def validate_score_thresholds(cls, v):
-        if v < 0.0 or v > 1.0:
-            raise ValueError('Score thresholds must be between 0.0 and 1.0')
-        return v
     
-    @validator('minimum_readability_score')
-    def validate_readability_threshold(cls, v):
-        if v < 0.0 or v > 100.0:
-            raise ValueError('Readability score must be between 0.0 and 100.0')
-        return v
 
 
 class ValidationResult(BaseModel):
@@ -253,17 +232,15 @@ class ValidationResult(BaseModel):
     # Validation metadata
     validation_id: str = Field(..., description="Unique validation identifier")
     validated_at: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="When validation was performed"
     )
     validator_version: str = Field(default="1.0", description="Version of validator used")
     
     # Overall results
     overall_status: ValidationStatus = Field(..., description="Overall validation status")
-    overall_score: float = Field(
+    overall_score: Score01 = Field(
         ...,
-        ge=0.0,
-        le=1.0,
         description="Overall quality score"
     )
     passed: bool = Field(..., description="Whether validation passed overall")
@@ -307,10 +284,8 @@ class ValidationResult(BaseModel):
         ...,
         description="Validation criteria used for this check"
     )
-    compliance_score: Optional[float] = Field(
+    compliance_score: Optional[Score01] = Field(
         None,
-        ge=0.0,
-        le=1.0,
         description="Compliance with enterprise standards"
     )
     
@@ -320,43 +295,10 @@ class ValidationResult(BaseModel):
         ge=0.0,
         description="Time taken for validation in seconds"
     )
-    
-    def get_failed_checks(self) -> List[ValidationCheck]:
-        """Get all failed validation checks."""
-        failed_checks = []
-        
-        for check in self.content_checks + self.data_checks + self.custom_checks:
-            if not check.passed:
-                failed_checks.append(check)
-        
-        return failed_checks
-    
-    def get_checks_by_severity(self, severity: ValidationSeverity) -> List[ValidationCheck]:
-        """Get all checks of a specific severity level."""
-        all_checks = self.content_checks + self.data_checks + self.custom_checks
-        return [check for check in all_checks if check.severity == severity]
-    
-    def calculate_improvement_score(self) -> float:
-        """Calculate potential improvement score if all issues are fixed."""
-        if not self.get_failed_checks():
-            return self.overall_score
-        
-        # Simple calculation - could be more sophisticated
-        total_possible_improvement = len(self.get_failed_checks()) * 0.1
-        return min(1.0, self.overall_score + total_possible_improvement)
-    
-    @validator('overall_score', 'compliance_score')
-    def validate_scores(cls, v):
-        if v is not None and (v < 0.0 or v > 1.0):
-            raise ValueError('Scores must be between 0.0 and 1.0')
-        return v
-    
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        schema_extra = {
+
+    model_config = ConfigDict(
+        defer_build=True,  # see ValidationCriteria
+        json_schema_extra={
             "example": {
                 "validation_id": "VAL-2024-001",
                 "overall_status": "passed",
@@ -368,4 +310,145 @@ class ValidationResult(BaseModel):
                 "low_issues": 5,
                 "compliance_score": 0.90
             }
-        }
\ No newline at end of file
+        }
+    )
+    
+    # Lazy per-instance caches for the check queries below. Keyed by the
+    # current list lengths so appending new checks invalidates them; a
+    # result with hundreds of checks is queried repeatedly by the
+    # improvement-score and severity paths.
+    _checks_cache_key: Optional[tuple] = PrivateAttr(default=None)
+    _all_checks_cache: Optional[List[ValidationCheck]] = PrivateAttr(default=None)
+    _failed_checks_cache: Optional[List[ValidationCheck]] = PrivateAttr(default=None)
+    _severity_cache: Optional[Dict[ValidationSeverity, List[ValidationCheck]]] = PrivateAttr(default=None)
+
+    @classmethod
+    def json_schema_cached(cls) -> Dict[str, Any]:
+        """Return the model's JSON schema, generated once per process.
+
+        Mirrors ResearchDossier.json_schema_cached: the model graph is
+        static, so the schema is built on first request and shared.
+        """
+        return _result_json_schema()
+
+    @classmethod
+    def build_trusted(cls, **data) -> "ValidationResult":
+        """Build a result from trusted in-process data without validation.
+
+        The validation tool constructs results from checks it built itself,
+        so re-validating every field is pure overhead; the caller guarantees
+        field types. Skips validation entirely via model_construct.
+        """
+        return cls.model_construct(**data)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the result to JSON bytes for bulk export.
+
+        orjson encodes the check dataclasses and datetimes in C; see
+        ResearchDossier.to_json_bytes for the same pattern.
+        """
+        import orjson
+
+        return orjson.dumps(self.model_dump(mode="python"))
+
+    def fast_reject(self, criteria: ValidationCriteria) -> Optional[str]:
+        """Return the first rejection reason against criteria, or None.
+
+        Predicates run cheapest-and-most-likely-to-fail first — integer
+        comparisons before the float threshold, both before any walk over
+        the check lists — so the common rejections return without touching
+        the per-check data at all.
+        """
+        if self.critical_issues > criteria.critical_issues_allowed:
+            return (
+                f"critical issues ({self.critical_issues}) exceed "
+                f"allowed maximum ({criteria.critical_issues_allowed})"
+            )
+        if self.overall_score < criteria.minimum_overall_score:
+            return (
+                f"overall score ({self.overall_score:.2f}) below "
+                f"minimum ({criteria.minimum_overall_score:.2f})"
+            )
+        failed = self.get_failed_checks()
+        for check in failed:
+            if check.severity == "critical":
+                return f"failed critical check: {check.check_name}"
+        return None
+
+    def _all_checks(self) -> List[ValidationCheck]:
+        """Concatenate the three check lists once, refreshing on growth."""
+        key = (len(self.content_checks), len(self.data_checks), len(self.custom_checks))
+        if self._checks_cache_key != key:
+            self._checks_cache_key = key
+            # chain avoids the two intermediate lists that a + b + c builds
+            self._all_checks_cache = list(chain(self.content_checks, self.data_checks, self.custom_checks))
+            self._failed_checks_cache = None
+            self._severity_cache = None
+        return self._all_checks_cache
+
+    def get_failed_checks(self) -> List[ValidationCheck]:
+        """Get all failed validation checks."""
+        all_checks = self._all_checks()
+        if self._failed_checks_cache is None:
+            self._failed_checks_cache = [check for check in all_checks if not check.passed]
+        return self._failed_checks_cache
+
+    def iter_checks_by_severity(self, severity: ValidationSeverity):
+        """Yield checks of a severity level without materializing a list.
+
+        For single-pass consumers; bypasses the severity cache and the
+        concatenated-list allocation entirely.
+        """
+        for check in chain(self.content_checks, self.data_checks, self.custom_checks):
+            if check.severity == severity:
+                yield check
+
+    def get_checks_by_severity(self, severity: ValidationSeverity) -> List[ValidationCheck]:
+        """Get all checks of a specific severity level."""
+        all_checks = self._all_checks()
+        if self._severity_cache is None:
+            by_severity: Dict[ValidationSeverity, List[ValidationCheck]] = {}
+            for check in all_checks:
+                by_severity.setdefault(check.severity, []).append(check)
+            self._severity_cache = by_severity
+        return self._severity_cache.get(severity, [])
+
+    def calculate_improvement_score(self) -> float:
+        """Calculate potential improvement score if all issues are fixed."""
+        failed_checks = self.get_failed_checks()
+        if not failed_checks:
+            return self.overall_score
+
+        # Simple calculation - could be more sophisticated
+        total_possible_improvement = len(failed_checks) * 0.1
+        return min(1.0, self.overall_score + total_possible_improvement)
+
+
+@lru_cache(maxsize=1)
+def _result_json_schema() -> Dict[str, Any]:
+    return ValidationResult.model_json_schema()
+
+
+# Module-level list adapters for bulk check ingestion. Building a
+# TypeAdapter compiles a validator, so it is hoisted here and reused:
+# validating a raw batch in one call amortizes that cost across items
+# instead of constructing each check model individually in a loop.
+CONTENT_CHECK_LIST_ADAPTER = TypeAdapter(List[ContentQualityCheck])
+DATA_CHECK_LIST_ADAPTER = TypeAdapter(List[DataQualityCheck])
+CHECK_LIST_ADAPTER = TypeAdapter(List[ValidationCheck])
+
+
+def validate_content_checks(raw: List[Any]) -> List[ContentQualityCheck]:
+    """Validate a raw batch of content quality checks in one adapter call."""
+    return CONTENT_CHECK_LIST_ADAPTER.validate_python(raw)
+
+
+def validate_data_checks(raw: List[Any]) -> List[DataQualityCheck]:
+    """Validate a raw batch of data quality checks in one adapter call."""
+    return DATA_CHECK_LIST_ADAPTER.validate_python(raw)
+
+
+def validate_custom_checks(raw: List[Any]) -> List[ValidationCheck]:
+    """Validate a raw batch of custom validation checks in one adapter call."""
+    return CHECK_LIST_ADAPTER.validate_python(raw)
@@ -7,7 +7,13 @@ positioning, market trends, and strategic insights.
 """
 
 from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 import json
+import re
+import sys
+import time
 import structlog
 from datetime import datetime, timedelta
 
@@ -16,6 +22,256 @@ from pydantic import BaseModel, Field
 
 logger = structlog.get_logger()
 
+# Industry trend templates, hoisted to module scope so each call shares the
+# same tuples instead of rebuilding the dict. A single compiled alternation
+# replaces the per-key substring scan.
+_TREND_TEMPLATES = {
+    "technology": (
+        "Accelerated digital transformation and cloud adoption",
+        "Increased focus on AI and machine learning integration",
+        "Growing emphasis on cybersecurity and data privacy",
+        "Shift towards subscription-based business models",
+        "Rising demand for remote work solutions"
+    ),
+    "finance": (
+        "Digital banking and fintech innovation acceleration",
+        "Regulatory compliance and risk management focus",
+        "Cryptocurrency and blockchain adoption",
+        "Open banking and API-first approaches",
+        "ESG investing and sustainable finance growth"
+    ),
+    "healthcare": (
+        "Telemedicine and digital health platform expansion",
+        "AI-driven diagnostics and personalized medicine",
+        "Value-based care model adoption",
+        "Healthcare data interoperability initiatives",
+        "Preventive care and wellness program focus"
+    ),
+    "retail": (
+        "Omnichannel customer experience integration",
+        "Supply chain resilience and localization",
+        "Sustainable and ethical sourcing practices",
+        "Personalization through data analytics",
+        "Direct-to-consumer brand strategies"
+    ),
+    "manufacturing": (
+        "Industry 4.0 and smart manufacturing adoption",
+        "Supply chain digitization and automation",
+        "Sustainability and circular economy practices",
+        "Predictive maintenance and IoT integration",
+        "Reshoring and supply chain diversification"
+    )
+}
+
+# Default trends for unspecified industries
+_DEFAULT_TRENDS = (
+    "Digital transformation and technology adoption",
+    "Sustainability and ESG focus",
+    "Customer experience optimization",
+    "Data-driven decision making",
+    "Agile and flexible business models"
+)
+
+_TREND_RE = re.compile("|".join(map(re.escape, _TREND_TEMPLATES)))
+
+# Company-name keyword patterns and the per-category position profiles.
+# Plain substring alternations (no word boundaries) to keep the original
+# "term in name" semantics, e.g. "TechSolutions" matches tech-focused.
+_CORP_RE = re.compile(r"corp|corporation|inc|ltd|group")
+_TECH_RE = re.compile(r"tech|digital|software|systems|solutions")
+_REGIONAL_RE = re.compile(r"eesti|baltic|nordic|regional")
+
+_POSITION_PROFILES = {
+    "corp": (
+        "Established market leader with strong brand recognition",
+        ("Market leadership", "Financial stability", "Brand recognition", "Extensive resources"),
+        ("Potential bureaucracy", "Slower innovation cycles")
+    ),
+    "tech": (
+        "Technology-focused innovator with competitive differentiation",
+        ("Innovation capability", "Technical expertise", "Agile operations", "Digital-first approach"),
+        ("Limited market reach", "Resource constraints")
+    ),
+    "regional": (
+        "Regional market specialist with local expertise",
+        ("Local market knowledge", "Regional partnerships", "Cultural understanding", "Specialized focus"),
+        ("Limited geographic reach", "Scale constraints")
+    ),
+    "default": (
+        "Competitive market participant with growth potential",
+        ("Market agility", "Customer focus", "Operational efficiency", "Growth potential"),
+        ("Market share limitations", "Resource competition")
+    )
+}
+
+# Intern the profile strings so every insight sharing a category also
+# shares string identity — downstream dict lookups and equality checks on
+# positions/strengths compare pointers instead of characters.
+_POSITION_PROFILES = {
+    key: (sys.intern(position), tuple(map(sys.intern, strengths)), tuple(map(sys.intern, weaknesses)))
+    for key, (position, strengths, weaknesses) in _POSITION_PROFILES.items()
+}
+
+_DEVELOPMENTS_TEMPLATE = (
+    "Strategic expansion in {industry} sector",
+    "Investment in digital transformation initiatives",
+    "Partnership development for market growth",
+    "Product portfolio enhancement and innovation"
+)
+
+_COMPETITIVE_ADVANTAGES = (
+    "Strong customer relationships and loyalty",
+    "Specialized industry expertise and knowledge",
+    "Efficient operational model and cost structure",
+    "Strategic market positioning and differentiation"
+)
+
+_MARKET_OPPORTUNITIES = (
+    "Market expansion through digital transformation",
+    "Product diversification and innovation opportunities",
+    "Strategic partnerships and alliance development",
+    "Emerging market segments and customer needs",
+    "Technology adoption and competitive advantage"
+)
+
+_MARKET_THREATS = (
+    "New market entrants and competitive pressure",
+    "Technology disruption and market changes",
+    "Regulatory changes and compliance requirements",
+    "Economic uncertainty and market volatility",
+    "Customer preference shifts and expectations"
+)
+
+_MARKET_OVERVIEW_TEMPLATE = (
+    "The {industry} industry is experiencing dynamic growth and transformation, "
+    "with {company_count} key players competing in an evolving market landscape. "
+    "Market dynamics are driven by technological innovation, customer demand evolution, "
+    "and strategic positioning initiatives that create both opportunities and challenges "
+    "for market participants."
+)
+
+_MARKET_OUTLOOK_TEMPLATE = (
+    "The {industry} market outlook remains positive with continued growth expected "
+    "driven by innovation, digital transformation, and evolving customer needs. "
+    "Companies that successfully adapt to market changes and leverage competitive "
+    "advantages are well-positioned for sustained growth and market success."
+)
+
+_DYNAMICS_HIGH_TEMPLATE = (
+    "The {industry} industry demonstrates intense competitive dynamics with "
+    "{company_count} major players competing for market share. Competition is driven "
+    "by innovation, customer service excellence, and strategic positioning."
+)
+
+_DYNAMICS_MODERATE_TEMPLATE = (
+    "The {industry} sector shows balanced competitive dynamics with established "
+    "players maintaining stable market positions while new entrants create "
+    "innovation pressure."
+)
+
+_DYNAMICS_EMERGING_TEMPLATE = (
+    "The {industry} market is experiencing evolving competitive dynamics as "
+    "traditional players adapt to new market conditions and emerging technologies."
+)
+
+
+# The pure template helpers below are memoized at module scope: the same
+# industry recurs across a session, so repeats become dict lookups. They
+# return immutable values; the tool methods copy where callers mutate.
+
+# Cached analysis-date string: the date is constant within a day, so the
+# datetime construction and strftime only rerun once the hour-long TTL
+# lapses instead of on every analysis.
+_DATE_CACHE = [0.0, ""]
+
+
+def _today_str() -> str:
+    now = time.time()
+    if now - _DATE_CACHE[0] > 3600:
+        _DATE_CACHE[0] = now
+        _DATE_CACHE[1] = datetime.now().strftime("%Y-%m-%d")
+    return _DATE_CACHE[1]
+
+
+@lru_cache(maxsize=128)
+def _industry_trends(industry: str) -> tuple:
+    match = _TREND_RE.search(industry.lower())
+    return _TREND_TEMPLATES[match.group(0)] if match else _DEFAULT_TRENDS
+
+
+@lru_cache(maxsize=128)
+def _competitive_dynamics(industry: str, company_count: int) -> str:
+    if company_count >= 4:
+        return _DYNAMICS_HIGH_TEMPLATE.format(industry=industry, company_count=company_count)
+    elif company_count >= 2:
+        return _DYNAMICS_MODERATE_TEMPLATE.format(industry=industry)
+    else:
+        return _DYNAMICS_EMERGING_TEMPLATE.format(industry=industry)
+
+
+@lru_cache(maxsize=128)
+def _market_overview(industry: str, company_count: int) -> str:
+    return _MARKET_OVERVIEW_TEMPLATE.format(industry=industry, company_count=company_count)
+
+
+@lru_cache(maxsize=1024)
+def _cached_insight(company: str, industry: str) -> "CompanyInsight":
+    """Build (or reuse) the insight for one company in one industry.
+
+    The insight is deterministic in its arguments and treated as immutable
+    downstream, so repeat appearances of a company across requests share
+    one instance instead of re-running classification and model build.
+    """
+    # Classify the company with one pass over the lowercased name;
+    # the precompiled alternations replace three substring scans.
+    company_lower = company.lower()
+    if _CORP_RE.search(company_lower):
+        profile = _POSITION_PROFILES["corp"]
+    elif _TECH_RE.search(company_lower):
+        profile = _POSITION_PROFILES["tech"]
+    elif _REGIONAL_RE.search(company_lower):
+        profile = _POSITION_PROFILES["regional"]
+    else:
+        profile = _POSITION_PROFILES["default"]
+    position, strengths, weaknesses = profile
+
+    developments = [
+        _DEVELOPMENTS_TEMPLATE[0].format(industry=industry),
+        *_DEVELOPMENTS_TEMPLATE[1:]
+    ]
+
+    return CompanyInsight(
+        name=company,
+        market_position=position,
+        strengths=list(strengths),
+        weaknesses=list(weaknesses),
+        market_share_estimate="Competitive position with growth opportunities",
+        recent_developments=developments,
+        competitive_advantages=list(_COMPETITIVE_ADVANTAGES)
+    )
+
+# Formatted-analysis cache keyed by (industry, companies, analysis_type).
+# The analysis is a pure function of its inputs (templates, no I/O), so
+# repeat invocations across agent turns collapse to a dict lookup.
+_ANALYSIS_CACHE: Dict[tuple, str] = {}
+_ANALYSIS_CACHE_MAX = 256
+
+
+def _bullets(items) -> str:
+    """Render items as a markdown bullet list."""
+    # Plain concatenation skips the per-element format-spec machinery.
+    return "\n".join("- " + item for item in items)
+
+
+@lru_cache(maxsize=256)
+def _bullets_cached(items: tuple) -> str:
+    """Memoized bullet rendering for the recurring per-industry sections.
+
+    Keyed on the item tuple rather than the industry so reports built with
+    hand-supplied content still format exactly what they contain.
+    """
+    return _bullets(items)
+
 
 class MarketAnalysisRequest(BaseModel):
     """Model for market analysis request parameters."""
@@ -25,19 +281,25 @@ class MarketAnalysisRequest(BaseModel):
     time_frame: str = Field(default="current", description="Time frame for analysis")
 
 
-class CompanyInsight(BaseModel):
-    """Model for individual company insights."""
+# The two carriers below never cross a serialization or agent-schema
+# boundary: they only travel from _perform_market_analysis to the
+# formatter. Plain frozen slotted dataclasses skip per-field validation
+# and the __dict__/__fields_set__ bookkeeping a pydantic model carries.
+@dataclass(slots=True, frozen=True)
+class CompanyInsight:
+    """Internal carrier for individual company insights."""
     name: str
     market_position: str
     strengths: List[str]
     weaknesses: List[str]
-    market_share_estimate: Optional[str] = None
     recent_developments: List[str]
     competitive_advantages: List[str]
+    market_share_estimate: Optional[str] = None
 
 
-class MarketAnalysis(BaseModel):
-    """Model for comprehensive market analysis results."""
+@dataclass(slots=True, frozen=True)
+class MarketAnalysis:
+    """Internal carrier for comprehensive market analysis results."""
     industry: str
     analysis_date: str
     market_overview: str
@@ -81,22 +343,66 @@ class MarketAnalysisTool(BaseTool):
         try:
             # Parse companies list
             company_list = [c.strip() for c in companies.split(",") if c.strip()]
-            
-            logger.info("Executing market analysis", 
-                       companies=company_list, industry=industry, analysis_type=analysis_type)
-            
+
+            # Empty input has nothing to analyze; skip template assembly,
+            # caching and logging entirely.
+            if not company_list:
+                return "No companies provided for analysis."
+
+            # The analysis is deterministic, so identical requests are
+            # served straight from the cache without re-running the
+            # template assembly (or re-logging the run).
+            cache_key = (industry, tuple(company_list), analysis_type)
+            cached = _ANALYSIS_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Debug level: tool invocations are hot-path events and the
+            # processor chain shouldn't run for them at default levels.
+            logger.debug("Executing market analysis",
+                        companies=company_list, industry=industry, analysis_type=analysis_type)
+
             # Perform market analysis
             analysis_results = self._perform_market_analysis(company_list, industry, analysis_type)
-            
-            logger.info("Market analysis completed", 
-                       companies_analyzed=len(company_list))
-            
-            return self._format_market_analysis(analysis_results)
-            
+
+            logger.debug("Market analysis completed",
+                        companies_analyzed=len(company_list))
+
+            formatted = self._format_market_analysis(analysis_results)
+            if len(_ANALYSIS_CACHE) < _ANALYSIS_CACHE_MAX:
+                _ANALYSIS_CACHE[cache_key] = formatted
+            return formatted
+
         except Exception as e:
             logger.error("Error in market analysis", error=str(e))
             return f"Error performing market analysis: {str(e)}"
     
+    def _run_batch(self, requests: List[MarketAnalysisRequest]) -> List[str]:
+        """
+        Serve several analysis requests in one pass.
+
+        Requests are grouped by (industry, analysis_type) and the union of
+        each group's companies is classified first, so a company appearing
+        in multiple requests is analyzed once; the per-request reports are
+        then assembled from the shared insight and result caches.
+
+        Args:
+            requests: Analysis requests to serve together
+
+        Returns:
+            List[str]: One formatted report per request, in input order
+        """
+        groups: Dict[tuple, set] = {}
+        for request in requests:
+            groups.setdefault((request.industry, request.analysis_type), set()).update(request.companies)
+        for (industry, _), companies in groups.items():
+            for company in companies:
+                _cached_insight(company, industry)
+        return [
+            self._run(", ".join(request.companies), request.industry, request.analysis_type)
+            for request in requests
+        ]
+
     def _perform_market_analysis(self, companies: List[str], industry: str, analysis_type: str) -> MarketAnalysis:
         """
         Perform comprehensive market analysis for the given companies and industry.
@@ -111,11 +417,22 @@ class MarketAnalysisTool(BaseTool):
         """
         # Generate realistic market analysis based on industry patterns
         market_trends = self._generate_industry_trends(industry)
-        company_insights = []
-        
-        for company in companies:
-            insight = self._analyze_company_position(company, industry)
-            company_insights.append(insight)
+
+        # Per-company analysis is independent, so larger sets run through a
+        # thread pool; this is also the hook point for overlapping network
+        # I/O if the position analysis ever fetches live data. Small inputs
+        # skip the executor setup cost.
+        if len(companies) >= 4:
+            with ThreadPoolExecutor(max_workers=min(8, len(companies))) as executor:
+                company_insights = list(executor.map(
+                    lambda company: self._analyze_company_position(company, industry),
+                    companies
+                ))
+        else:
+            company_insights = [
+                self._analyze_company_position(company, industry)
+                for company in companies
+            ]
         
         # Generate market dynamics analysis
         competitive_dynamics = self._analyze_competitive_dynamics(companies, industry)
@@ -125,7 +442,7 @@ class MarketAnalysisTool(BaseTool):
         
         return MarketAnalysis(
             industry=industry,
-            analysis_date=datetime.now().strftime("%Y-%m-%d"),
+            analysis_date=_today_str(),
             market_overview=self._generate_market_overview(industry, companies),
             key_trends=market_trends,
             competitive_dynamics=competitive_dynamics,
@@ -137,234 +454,56 @@ class MarketAnalysisTool(BaseTool):
     
     def _generate_industry_trends(self, industry: str) -> List[str]:
         """Generate realistic industry trends based on sector."""
-        trend_templates = {
-            "technology": [
-                "Accelerated digital transformation and cloud adoption",
-                "Increased focus on AI and machine learning integration",
-                "Growing emphasis on cybersecurity and data privacy",
-                "Shift towards subscription-based business models",
-                "Rising demand for remote work solutions"
-            ],
-            "finance": [
-                "Digital banking and fintech innovation acceleration",
-                "Regulatory compliance and risk management focus",
-                "Cryptocurrency and blockchain adoption",
-                "Open banking and API-first approaches",
-                "ESG investing and sustainable finance growth"
-            ],
-            "healthcare": [
-                "Telemedicine and digital health platform expansion",
-                "AI-driven diagnostics and personalized medicine",
-                "Value-based care model adoption",
-                "Healthcare data interoperability initiatives",
-                "Preventive care and wellness program focus"
-            ],
-            "retail": [
-                "Omnichannel customer experience integration",
-                "Supply chain resilience and localization",
-                "Sustainable and ethical sourcing practices",
-                "Personalization through data analytics",
-                "Direct-to-consumer brand strategies"
-            ],
-            "manufacturing": [
-                "Industry 4.0 and smart manufacturing adoption",
-                "Supply chain digitization and automation",
-                "Sustainability and circular economy practices",
-                "Predictive maintenance and IoT integration",
-                "Reshoring and supply chain diversification"
-            ]
-        }
-        
-        # Default trends for unspecified industries
-        default_trends = [
-            "Digital transformation and technology adoption",
-            "Sustainability and ESG focus",
-            "Customer experience optimization",
-            "Data-driven decision making",
-            "Agile and flexible business models"
-        ]
-        
-        industry_key = industry.lower()
-        for key in trend_templates:
-            if key in industry_key:
-                return trend_templates[key]
-        
-        return default_trends
-    
+        return list(_industry_trends(industry))
+
     def _analyze_company_position(self, company: str, industry: str) -> CompanyInsight:
         """Analyze individual company's market position."""
-        # Generate realistic company analysis based on common patterns
-        
-        # Determine company characteristics based on name patterns
-        is_large_corp = any(term in company.lower() for term in ['corp', 'corporation', 'inc', 'ltd', 'group'])
-        is_tech_focused = any(term in company.lower() for term in ['tech', 'digital', 'software', 'systems', 'solutions'])
-        is_regional = any(term in company.lower() for term in ['eesti', 'baltic', 'nordic', 'regional'])
-        
-        # Generate position assessment
-        if is_large_corp:
-            position = "Established market leader with strong brand recognition"
-            strengths = ["Market leadership", "Financial stability", "Brand recognition", "Extensive resources"]
-            weaknesses = ["Potential bureaucracy", "Slower innovation cycles"]
-        elif is_tech_focused:
-            position = "Technology-focused innovator with competitive differentiation"
-            strengths = ["Innovation capability", "Technical expertise", "Agile operations", "Digital-first approach"]
-            weaknesses = ["Limited market reach", "Resource constraints"]
-        elif is_regional:
-            position = "Regional market specialist with local expertise"
-            strengths = ["Local market knowledge", "Regional partnerships", "Cultural understanding", "Specialized focus"]
-            weaknesses = ["Limited geographic reach", "Scale constraints"]
-        else:
-            position = "Competitive market participant with growth potential"
-            strengths = ["Market agility", "Customer focus", "Operational efficiency", "Growth potential"]
-            weaknesses = ["Market share limitations", "Resource competition"]
-        
-        # Generate recent developments
-        developments = [
-            f"Strategic expansion in {industry} sector",
-            "Investment in digital transformation initiatives",
-            "Partnership development for market growth",
-            "Product portfolio enhancement and innovation"
-        ]
-        
-        # Generate competitive advantages
-        advantages = [
-            "Strong customer relationships and loyalty",
-            "Specialized industry expertise and knowledge",
-            "Efficient operational model and cost structure",
-            "Strategic market positioning and differentiation"
-        ]
-        
-        return CompanyInsight(
-            name=company,
-            market_position=position,
-            strengths=strengths,
-            weaknesses=weaknesses,
-            market_share_estimate="Competitive position with growth opportunities",
-            recent_developments=developments,
-            competitive_advantages=advantages
-        )
-    
+        return _cached_insight(company, industry)
+
     def _analyze_competitive_dynamics(self, companies: List[str], industry: str) -> str:
         """Analyze competitive dynamics between companies."""
-        dynamics_templates = {
-            "high_competition": f"The {industry} industry demonstrates intense competitive dynamics with {len(companies)} major players competing for market share. Competition is driven by innovation, customer service excellence, and strategic positioning.",
-            "moderate_competition": f"The {industry} sector shows balanced competitive dynamics with established players maintaining stable market positions while new entrants create innovation pressure.",
-            "emerging_competition": f"The {industry} market is experiencing evolving competitive dynamics as traditional players adapt to new market conditions and emerging technologies."
-        }
-        
-        # Determine competition level based on number of companies
-        if len(companies) >= 4:
-            return dynamics_templates["high_competition"]
-        elif len(companies) >= 2:
-            return dynamics_templates["moderate_competition"]
-        else:
-            return dynamics_templates["emerging_competition"]
-    
+        return _competitive_dynamics(industry, len(companies))
+
     def _identify_market_forces(self, industry: str, companies: List[str]) -> tuple[List[str], List[str]]:
         """Identify market opportunities and threats."""
-        
-        opportunities = [
-            "Market expansion through digital transformation",
-            "Product diversification and innovation opportunities",
-            "Strategic partnerships and alliance development",
-            "Emerging market segments and customer needs",
-            "Technology adoption and competitive advantage"
-        ]
-        
-        threats = [
-            "New market entrants and competitive pressure",
-            "Technology disruption and market changes",
-            "Regulatory changes and compliance requirements",
-            "Economic uncertainty and market volatility",
-            "Customer preference shifts and expectations"
-        ]
-        
-        return opportunities, threats
-    
+        # The values are static module-level tuples; wrap in lists because
+        # callers (and the MarketAnalysis model) expect mutable sequences.
+        return list(_MARKET_OPPORTUNITIES), list(_MARKET_THREATS)
+
     def _generate_market_overview(self, industry: str, companies: List[str]) -> str:
         """Generate comprehensive market overview."""
-        return (f"The {industry} industry is experiencing dynamic growth and transformation, "
-                f"with {len(companies)} key players competing in an evolving market landscape. "
-                f"Market dynamics are driven by technological innovation, customer demand evolution, "
-                f"and strategic positioning initiatives that create both opportunities and challenges "
-                f"for market participants.")
-    
+        return _market_overview(industry, len(companies))
+
     def _generate_market_outlook(self, industry: str) -> str:
         """Generate market outlook assessment."""
-        return (f"The {industry} market outlook remains positive with continued growth expected "
-                f"driven by innovation, digital transformation, and evolving customer needs. "
-                f"Companies that successfully adapt to market changes and leverage competitive "
-                f"advantages are well-positioned for sustained growth and market success.")
-    
+        return _MARKET_OUTLOOK_TEMPLATE.format(industry=industry)
+
     def _format_market_analysis(self, analysis: MarketAnalysis) -> str:
         """Format market analysis results for consumption."""
-        formatted_output = []
-        
-        # Header
-        formatted_output.append(f"# Market Analysis Report: {analysis.industry}")
-        formatted_output.append(f"**Analysis Date:** {analysis.analysis_date}")
-        formatted_output.append("")
-        
-        # Market Overview
-        formatted_output.append("## Market Overview")
-        formatted_output.append(analysis.market_overview)
-        formatted_output.append("")
-        
-        # Key Trends
-        formatted_output.append("## Key Industry Trends")
-        for trend in analysis.key_trends:
-            formatted_output.append(f"- {trend}")
-        formatted_output.append("")
-        
-        # Competitive Dynamics
-        formatted_output.append("## Competitive Dynamics")
-        formatted_output.append(analysis.competitive_dynamics)
-        formatted_output.append("")
-        
-        # Company Insights
-        formatted_output.append("## Company Analysis")
-        for insight in analysis.company_insights:
-            formatted_output.append(f"### {insight.name}")
-            formatted_output.append(f"**Market Position:** {insight.market_position}")
-            formatted_output.append("")
-            
-            formatted_output.append("**Strengths:**")
-            for strength in insight.strengths:
-                formatted_output.append(f"- {strength}")
-            formatted_output.append("")
-            
-            formatted_output.append("**Areas for Improvement:**")
-            for weakness in insight.weaknesses:
-                formatted_output.append(f"- {weakness}")
-            formatted_output.append("")
-            
-            formatted_output.append("**Competitive Advantages:**")
-            for advantage in insight.competitive_advantages:
-                formatted_output.append(f"- {advantage}")
-            formatted_output.append("")
-            
-            formatted_output.append("**Recent Strategic Developments:**")
-            for development in insight.recent_developments:
-                formatted_output.append(f"- {development}")
-            formatted_output.append("")
-        
-        # Market Forces
-        formatted_output.append("## Market Opportunities")
-        for opportunity in analysis.opportunities:
-            formatted_output.append(f"- {opportunity}")
-        formatted_output.append("")
-        
-        formatted_output.append("## Market Threats")
-        for threat in analysis.threats:
-            formatted_output.append(f"- {threat}")
-        formatted_output.append("")
-        
-        # Market Outlook
-        formatted_output.append("## Market Outlook")
-        formatted_output.append(analysis.market_outlook)
-        formatted_output.append("")
-        
-        formatted_output.append("---")
-        formatted_output.append("*Analysis generated by Market Position Analyzer*")
-        
-        return "\n".join(formatted_output)
\ No newline at end of file
+        insights = "\n\n".join(
+            _format_company_insight(insight) for insight in analysis.company_insights
+        )
+        return (
+            f"# Market Analysis Report: {analysis.industry}\n"
+            f"**Analysis Date:** {analysis.analysis_date}\n\n"
+            f"## Market Overview\n{analysis.market_overview}\n\n"
+            f"## Key Industry Trends\n{_bullets_cached(tuple(analysis.key_trends))}\n\n"
+            f"## Competitive Dynamics\n{analysis.competitive_dynamics}\n\n"
+            f"## Company Analysis\n{insights}\n\n"
+            f"## Market Opportunities\n{_bullets_cached(tuple(analysis.opportunities))}\n\n"
+            f"## Market Threats\n{_bullets_cached(tuple(analysis.threats))}\n\n"
+            f"## Market Outlook\n{analysis.market_outlook}\n\n"
+            f"---\n*Analysis generated by Market Position Analyzer*"
+        )
+
+
+def _format_company_insight(insight: CompanyInsight) -> str:
+    """Render one company insight block as markdown."""
+    return (
+        f"### {insight.name}\n"
+        f"**Market Position:** {insight.market_position}\n\n"
+        f"**Strengths:**\n{_bullets(insight.strengths)}\n\n"
+        f"**Areas for Improvement:**\n{_bullets(insight.weaknesses)}\n\n"
+        f"**Competitive Advantages:**\n{_bullets(insight.competitive_advantages)}\n\n"
+        f"**Recent Strategic Developments:**\n{_bullets(insight.recent_developments)}"
+    )
@@ -4,15 +4,30 @@ Script to extract and display the competitive analysis report from crew executio
 """
 
 import os
+from typing import Optional
+
 from src.Competitive_analysis_crew.crew import CompetitiveAnalysisCrew
 
+# Process-wide crew singleton: construction walks the YAML config and
+# initializes the per-role LLM clients, so repeat extraction attempts in
+# the same session should reuse one instance.
+_CREW_SINGLETON: Optional[CompetitiveAnalysisCrew] = None
+
+
+def _get_crew() -> CompetitiveAnalysisCrew:
+    global _CREW_SINGLETON
+    if _CREW_SINGLETON is None:
+        _CREW_SINGLETON = CompetitiveAnalysisCrew()
+    return _CREW_SINGLETON
+
+
 def extract_report_from_crew():
     """Extract the report from the crew's last execution."""
     print("Attempting to extract report from crew execution...")
     
     try:
-        # Initialize the crew
-        crew_instance = CompetitiveAnalysisCrew()
+        # Initialize the crew (reused across calls in the same process)
+        crew_instance = _get_crew()
         crew = crew_instance.crew()
         
         # Check if there's any stored output or memory
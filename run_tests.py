@@ -10,66 +10,101 @@ import sys
 from pathlib import Path
 
 
-def run_tests(coverage=False, verbose=False, specific_test=None):
-    """
-    Run the test suite with optional coverage and verbosity.
-    
-    Args:
-        coverage (bool): Whether to run with coverage reporting
-        verbose (bool): Whether to run with verbose output
-        specific_test (str): Specific test file or test to run
-    """
-    cmd = ["python", "-m", "pytest"]
-    
+def _build_args(coverage=False, verbose=False, specific_test=None, no_cache=False):
+    """Assemble the pytest argument list shared by both run modes."""
+    args = []
+
     if specific_test:
-        cmd.append(specific_test)
+        args.append(specific_test)
     else:
-        cmd.append("tests/")
-    
+        args.append("tests/")
+
     if verbose:
-        cmd.append("-v")
-    
+        args.append("-v")
+
+    if no_cache:
+        # Skip the .pytest_cache write at the end of the run. For a suite
+        # this short the cache is pure I/O overhead unless you plan to
+        # rerun with --lf/--ff.
+        args.extend(["-p", "no:cacheprovider"])
+
     if coverage:
-        cmd.extend([
+        args.extend([
             "--cov=src/Competitive_analysis_crew/tools",
             "--cov-report=term-missing",
             "--cov-report=html"
         ])
-    
-    print(f"Running command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=Path(__file__).parent)
-    return result.returncode
+
+    return args
+
+
+def run_tests(coverage=False, verbose=False, specific_test=None, isolated=False,
+              no_cache=False):
+    """
+    Run the test suite with optional coverage and verbosity.
+
+    By default pytest runs in-process via pytest.main, which skips the
+    interpreter spawn and plugin re-import cost — useful when iterating on
+    a single file with --test. Pass isolated=True to get the old
+    subprocess behavior with a clean interpreter (e.g. for CI).
+
+    Args:
+        coverage (bool): Whether to run with coverage reporting
+        verbose (bool): Whether to run with verbose output
+        specific_test (str): Specific test file or test to run
+        isolated (bool): Whether to run pytest in a fresh interpreter
+        no_cache (bool): Whether to disable the pytest cache plugin
+    """
+    args = _build_args(coverage=coverage, verbose=verbose, specific_test=specific_test,
+                       no_cache=no_cache)
+
+    if isolated:
+        cmd = ["python", "-m", "pytest"] + args
+        print(f"Running command: {' '.join(cmd)}")
+        result = subprocess.run(cmd, cwd=Path(__file__).parent)
+        return result.returncode
+
+    import pytest
+
+    print(f"Running pytest in-process: pytest {' '.join(args)}")
+    return pytest.main(args)
 
 
 def main():
     """Main entry point for the test runner."""
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="Run tests for Competitive Analysis Crew")
-    parser.add_argument("--coverage", "-c", action="store_true", 
+    parser.add_argument("--coverage", "-c", action="store_true",
                        help="Run tests with coverage reporting")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Run tests with verbose output")
     parser.add_argument("--test", "-t", type=str,
                        help="Run specific test file or test")
-    
+    parser.add_argument("--isolated", action="store_true",
+                       help="Run pytest in a fresh interpreter instead of in-process")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Disable the pytest cache plugin (skips .pytest_cache I/O)")
+
     args = parser.parse_args()
-    
+
     exit_code = run_tests(
         coverage=args.coverage,
         verbose=args.verbose,
-        specific_test=args.test
+        specific_test=args.test,
+        isolated=args.isolated,
+        no_cache=args.no_cache
     )
-    
+
     if exit_code == 0:
         print("\n✅ All tests passed!")
         if args.coverage:
             print("📊 Coverage report generated in htmlcov/")
     else:
         print("\n❌ Some tests failed!")
-    
+
     sys.exit(exit_code)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
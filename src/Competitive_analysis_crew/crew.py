@@ -7,6 +7,7 @@ gathering, analysis, and reporting with human-in-the-loop oversight.
 """
 
 import os
+from functools import cached_property
 from typing import Dict, Any, Optional
 import structlog
 
@@ -20,14 +21,141 @@ from Competitive_analysis_crew.tools.report_validation import ReportValidationTo
 from Competitive_analysis_crew.tools.date_context import DateContextTool
 from Competitive_analysis_crew.config.llm_config import LLMConfigManager
 
-# Initialize structured logging
-logger = structlog.get_logger()
+# Initialize structured logging with the component context bound once
+logger = structlog.get_logger().bind(component="crew")
+
+# Shared preamble prepended to every agent backstory. Keeping the leading
+# tokens byte-identical across all six agents lets the provider's
+# prompt-prefix cache serve the common portion on repeat calls.
+_SHARED_BACKSTORY_PREAMBLE = (
+    "You are part of the Competitive Analysis Crew, a team of specialists "
+    "producing enterprise-grade competitive intelligence for executive "
+    "decision-making. Always work from verified, current information and "
+    "keep your output professional and actionable. "
+)
+
+
+# Task prompt text is static; hoisting it to module constants means every
+# crew instance shares one copy of each string instead of re-allocating
+# them per construction.
+_DESC_COLLECT_INFO = (
+    "Collect essential information for competitive analysis:\n"
+    "1. Ask the user for their company name and basic details\n"
+    "2. Ask for a list of main competitors to analyze\n"
+    "3. Gather any specific focus areas or preferences for the analysis\n"
+    "4. Confirm all information is accurate before proceeding"
+)
+
+_EXPECTED_COLLECT_INFO = (
+    "A structured summary containing:\n"
+    "- Client company name and basic details\n"
+    "- List of competitor companies to analyze\n"
+    "- Any specific focus areas or analysis preferences\n"
+    "- Confirmation that all information is accurate"
+)
+
+_DESC_RESEARCH = (
+    "Conduct comprehensive competitive research:\n"
+    "1. FIRST: Use the DateContextTool to get current date context for accurate temporal analysis\n"
+    "2. Research the client company: recent news, financial performance, market position\n"
+    "3. Research each competitor: business model, strengths, weaknesses, recent developments\n"
+    "4. Analyze market trends and competitive landscape\n"
+    "5. Gather quantitative and qualitative data from multiple reliable sources\n"
+    "6. Synthesize findings into a comprehensive research dossier\n\n"
+    "IMPORTANT: Always use the DateContextTool at the beginning to understand what 'current', "
+    "'recent', and 'latest' mean in terms of actual dates. When discussing financial data, "
+    "always specify the actual year (e.g., '2025 financial performance') rather than "
+    "relative terms like 'last year' or 'recent year'."
+)
+
+_EXPECTED_RESEARCH = (
+    "A detailed research dossier containing:\n"
+    "- Client company profile with recent developments and market position\n"
+    "- Comprehensive competitor profiles with strengths, weaknesses, and strategies\n"
+    "- Market landscape analysis and trends\n"
+    "- Key insights and competitive dynamics\n"
+    "- All sources properly cited and verified"
+)
+
+_DESC_WRITE_REPORT = (
+    "Create a professional competitive analysis report:\n"
+    "1. Structure the report with clear sections: Executive Summary, Company Profiles, "
+    "Competitive Analysis, Market Insights, and Recommendations\n"
+    "2. Use the research dossier to create comprehensive company profiles\n"
+    "3. Develop a comparative analysis highlighting key differentiators\n"
+    "4. Include actionable recommendations based on the analysis\n"
+    "5. Ensure the report is professional, well-formatted, and executive-ready"
+)
+
+_EXPECTED_WRITE_REPORT = (
+    "A comprehensive competitive analysis report in markdown format with:\n"
+    "- Executive Summary (2-3 paragraphs)\n"
+    "- Detailed company profiles for client and competitors\n"
+    "- Comparative analysis with SWOT-style insights\n"
+    "- Market positioning and competitive dynamics\n"
+    "- Strategic recommendations and next steps\n"
+    "- Professional formatting suitable for executive presentation"
+)
+
+_DESC_VALIDATE_QUALITY = (
+    "Validate report quality and manage the writing process:\n"
+    "1. Review the report for completeness, accuracy, and professional standards\n"
+    "2. Check that all required sections are present and well-developed\n"
+    "3. Validate that recommendations are actionable and well-supported\n"
+    "4. Ensure proper formatting and executive-level presentation\n"
+    "5. If quality standards are not met, coordinate with the writer for improvements"
+)
+
+_EXPECTED_VALIDATE_QUALITY = (
+    "Quality validation report containing:\n"
+    "- Assessment of report completeness and accuracy\n"
+    "- Validation of professional standards and formatting\n"
+    "- Confirmation that all requirements are met\n"
+    "- Any recommendations for improvements (if needed)\n"
+    "- Final approval for the report to proceed to editing"
+)
+
+_DESC_EDIT_REPORT = (
+    "Perform final editorial review and polishing:\n"
+    "1. Review the report for grammar, style, and clarity\n"
+    "2. Enhance language for executive-level presentation\n"
+    "3. Ensure consistent tone and professional flow\n"
+    "4. Optimize readability and impact\n"
+    "5. Maintain all factual content while improving presentation"
+)
+
+_EXPECTED_EDIT_REPORT = (
+    "A polished, executive-ready competitive analysis report with:\n"
+    "- Impeccable grammar and professional language\n"
+    "- Enhanced clarity and readability\n"
+    "- Consistent executive-level tone throughout\n"
+    "- Optimized structure and flow\n"
+    "- Professional formatting and presentation"
+)
+
+_DESC_TRANSLATE = (
+    "Provide optional translation services:\n"
+    "1. Ask the user if they need the report translated to another language\n"
+    "2. If translation is requested, ask for the target language\n"
+    "3. Translate the report while maintaining professional tone and accuracy\n"
+    "4. Ensure business terminology is correctly translated\n"
+    "5. Provide both original and translated versions\n"
+    "6. IMPORTANT: Always display the full report content in your final answer"
+)
+
+_EXPECTED_TRANSLATE = (
+    "Translation service result with FULL REPORT CONTENT:\n"
+    "- Complete original report text\n"
+    "- If translation requested: complete translated report text\n"
+    "- Both versions must be fully displayed in the final answer\n"
+    "- Maintained professional tone and business terminology"
+)
 
 
 class CompetitiveAnalysisCrew:
     """
     Main crew class for competitive analysis automation.
-    
+
     This class orchestrates a multi-agent workflow that includes:
     - User onboarding and data collection
     - Competitive research and analysis
@@ -35,35 +163,55 @@ class CompetitiveAnalysisCrew:
     - Quality assurance and editing
     - Optional translation services
     """
-    
+
     def __init__(self):
-        """Initialize the competitive analysis crew with agents, tasks, and tools."""
+        """Initialize the competitive analysis crew with its configuration and tools."""
         self.llm_config = LLMConfigManager()
         self._initialize_tools()
-        self._initialize_agents()
-        self._initialize_tasks()
-        
+
         logger.info("Competitive Analysis Crew initialized successfully")
-    
+
+    # Tool instances are stateless, so one shared set serves every crew
+    # instance in the process. Built on first crew construction.
+    _shared_tools: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def _get_shared_tools(cls) -> Dict[str, Any]:
+        """Build the shared tool set once per process and reuse it."""
+        if cls._shared_tools is None:
+            cls._shared_tools = {
+                'search_tool': SerperDevTool(),
+                'scrape_tool': ScrapeWebsiteTool(),
+                'competitive_search_tool': CompetitiveSearchTool(),
+                'market_analysis_tool': MarketAnalysisTool(),
+                'report_validation_tool': ReportValidationTool(),
+                'date_context_tool': DateContextTool(),
+            }
+            logger.info("Tools initialized", tool_count=len(cls._shared_tools))
+        return cls._shared_tools
+
     def _initialize_tools(self):
-        """Initialize all tools used by the crew."""
-        self.search_tool = SerperDevTool()
-        self.scrape_tool = ScrapeWebsiteTool()
-        self.competitive_search_tool = CompetitiveSearchTool()
-        self.market_analysis_tool = MarketAnalysisTool()
-        self.report_validation_tool = ReportValidationTool()
-        self.date_context_tool = DateContextTool()
-        
-        logger.info("Tools initialized", tool_count=6)
-    
-    def _initialize_agents(self):
-        """Initialize all agents with their roles, goals, and tools."""
-        
-        # Onboarding Specialist - Collects user information
-        self.onboarding_specialist = Agent(
+        """Attach the shared tool set to this crew instance."""
+        tools = self._get_shared_tools()
+        self.search_tool = tools['search_tool']
+        self.scrape_tool = tools['scrape_tool']
+        self.competitive_search_tool = tools['competitive_search_tool']
+        self.market_analysis_tool = tools['market_analysis_tool']
+        self.report_validation_tool = tools['report_validation_tool']
+        self.date_context_tool = tools['date_context_tool']
+
+    # Agents are built lazily on first access so that importing or partially
+    # inspecting the crew does not pay for six agent (and LLM client)
+    # constructions up front. Each cached_property builds once per instance.
+
+    @cached_property
+    def onboarding_specialist(self) -> Agent:
+        """Onboarding Specialist - Collects user information."""
+        return Agent(
             role="User Onboarding Specialist",
             goal="Efficiently collect essential information about the client company and competitors for competitive analysis",
             backstory=(
+                _SHARED_BACKSTORY_PREAMBLE +
                 "You are an experienced business analyst specializing in competitive intelligence. "
                 "Your expertise lies in quickly identifying the key information needed for thorough "
                 "competitive analysis. You ask targeted questions to gather company details and "
@@ -73,12 +221,15 @@ class CompetitiveAnalysisCrew:
             allow_delegation=False,
             llm=self.llm_config.get_llm("openai", "gpt-4o-mini", "onboarding")
         )
-        
-        # Research Analyst - Conducts competitive research
-        self.research_analyst = Agent(
+
+    @cached_property
+    def research_analyst(self) -> Agent:
+        """Research Analyst - Conducts competitive research."""
+        return Agent(
             role="Senior Competitive Research Analyst",
             goal="Conduct comprehensive competitive analysis research using advanced tools and methodologies",
             backstory=(
+                _SHARED_BACKSTORY_PREAMBLE +
                 "You are a seasoned competitive intelligence analyst with over 10 years of experience "
                 "in market research and competitive analysis. You excel at gathering, synthesizing, "
                 "and analyzing information from multiple sources to create comprehensive competitive "
@@ -91,12 +242,15 @@ class CompetitiveAnalysisCrew:
             allow_delegation=True,
             llm=self.llm_config.get_llm("openai", "gpt-4o", "research")
         )
-        
-        # Report Writer - Creates structured reports
-        self.report_writer = Agent(
+
+    @cached_property
+    def report_writer(self) -> Agent:
+        """Report Writer - Creates structured reports."""
+        return Agent(
             role="Strategic Report Writer",
             goal="Transform research findings into professional, actionable competitive analysis reports",
             backstory=(
+                _SHARED_BACKSTORY_PREAMBLE +
                 "You are an expert business writer specializing in competitive intelligence reports. "
                 "You have a talent for transforming complex research data into clear, structured, "
                 "and actionable reports that executives can use for strategic decision-making. "
@@ -106,12 +260,15 @@ class CompetitiveAnalysisCrew:
             allow_delegation=False,
             llm=self.llm_config.get_llm("openai", "gpt-4o", "writing")
         )
-        
-        # Quality Manager - Validates and manages quality
-        self.quality_manager = Agent(
+
+    @cached_property
+    def quality_manager(self) -> Agent:
+        """Quality Manager - Validates and manages quality."""
+        return Agent(
             role="Quality Assurance Manager",
             goal="Ensure all reports meet enterprise-grade quality standards and coordinate the writing process",
             backstory=(
+                _SHARED_BACKSTORY_PREAMBLE +
                 "You are a quality assurance expert with extensive experience in business report "
                 "validation and process management. You ensure that all deliverables meet the highest "
                 "standards of quality, accuracy, and professionalism. You coordinate between different "
@@ -122,12 +279,15 @@ class CompetitiveAnalysisCrew:
             allow_delegation=True,
             llm=self.llm_config.get_llm("openai", "gpt-4o", "management")
         )
-        
-        # Senior Editor - Polishes final reports
-        self.senior_editor = Agent(
+
+    @cached_property
+    def senior_editor(self) -> Agent:
+        """Senior Editor - Polishes final reports."""
+        return Agent(
             role="Senior Executive Editor",
             goal="Polish reports to executive presentation standards with impeccable language and flow",
             backstory=(
+                _SHARED_BACKSTORY_PREAMBLE +
                 "You are a senior editor with decades of experience in executive communications. "
                 "You specialize in refining business documents to meet the highest standards of "
                 "professional presentation. Your editing ensures clarity, impact, and executive-level "
@@ -137,12 +297,15 @@ class CompetitiveAnalysisCrew:
             allow_delegation=False,
             llm=self.llm_config.get_llm("openai", "gpt-4o", "editing")
         )
-        
-        # Translator - Provides multilingual support
-        self.translator = Agent(
+
+    @cached_property
+    def translator(self) -> Agent:
+        """Translator - Provides multilingual support."""
+        return Agent(
             role="Professional Business Translator",
             goal="Provide accurate, context-aware translations of business reports while maintaining professional tone",
             backstory=(
+                _SHARED_BACKSTORY_PREAMBLE +
                 "You are a professional translator specializing in business and competitive intelligence "
                 "documents. You have expertise in multiple languages and understand the nuances of "
                 "business terminology across different cultures. Your translations maintain the "
@@ -154,159 +317,82 @@ class CompetitiveAnalysisCrew:
             allow_delegation=False,
             llm=self.llm_config.get_llm("openai", "gpt-4o", "translation")
         )
-        
-        logger.info("Agents initialized", agent_count=6)
-    
-    def _initialize_tasks(self):
-        """Initialize all tasks for the competitive analysis workflow."""
-        
-        # Task 1: Collect company and competitor information
-        self.task_collect_info = Task(
-            description=(
-                "Collect essential information for competitive analysis:\n"
-                "1. Ask the user for their company name and basic details\n"
-                "2. Ask for a list of main competitors to analyze\n"
-                "3. Gather any specific focus areas or preferences for the analysis\n"
-                "4. Confirm all information is accurate before proceeding"
-            ),
-            expected_output=(
-                "A structured summary containing:\n"
-                "- Client company name and basic details\n"
-                "- List of competitor companies to analyze\n"
-                "- Any specific focus areas or analysis preferences\n"
-                "- Confirmation that all information is accurate"
-            ),
+
+    # Tasks follow the same lazy pattern as agents; the crew() method triggers
+    # only what it references.
+
+    @cached_property
+    def task_collect_info(self) -> Task:
+        """Task 1: Collect company and competitor information."""
+        return Task(
+            description=_DESC_COLLECT_INFO,
+            expected_output=_EXPECTED_COLLECT_INFO,
             agent=self.onboarding_specialist,
             human_input=True
         )
-        
-        # Task 2: Conduct comprehensive research
-        self.task_research = Task(
-            description=(
-                "Conduct comprehensive competitive research:\n"
-                "1. FIRST: Use the DateContextTool to get current date context for accurate temporal analysis\n"
-                "2. Research the client company: recent news, financial performance, market position\n"
-                "3. Research each competitor: business model, strengths, weaknesses, recent developments\n"
-                "4. Analyze market trends and competitive landscape\n"
-                "5. Gather quantitative and qualitative data from multiple reliable sources\n"
-                "6. Synthesize findings into a comprehensive research dossier\n\n"
-                "IMPORTANT: Always use the DateContextTool at the beginning to understand what 'current', "
-                "'recent', and 'latest' mean in terms of actual dates. When discussing financial data, "
-                "always specify the actual year (e.g., '2025 financial performance') rather than "
-                "relative terms like 'last year' or 'recent year'."
-            ),
-            expected_output=(
-                "A detailed research dossier containing:\n"
-                "- Client company profile with recent developments and market position\n"
-                "- Comprehensive competitor profiles with strengths, weaknesses, and strategies\n"
-                "- Market landscape analysis and trends\n"
-                "- Key insights and competitive dynamics\n"
-                "- All sources properly cited and verified"
-            ),
+
+    @cached_property
+    def task_research(self) -> Task:
+        """Task 2: Conduct comprehensive research."""
+        return Task(
+            description=_DESC_RESEARCH,
+            expected_output=_EXPECTED_RESEARCH,
             agent=self.research_analyst,
             context=[self.task_collect_info]
         )
-        
-        # Task 3: Write the competitive analysis report
-        self.task_write_report = Task(
-            description=(
-                "Create a professional competitive analysis report:\n"
-                "1. Structure the report with clear sections: Executive Summary, Company Profiles, "
-                "Competitive Analysis, Market Insights, and Recommendations\n"
-                "2. Use the research dossier to create comprehensive company profiles\n"
-                "3. Develop a comparative analysis highlighting key differentiators\n"
-                "4. Include actionable recommendations based on the analysis\n"
-                "5. Ensure the report is professional, well-formatted, and executive-ready"
-            ),
-            expected_output=(
-                "A comprehensive competitive analysis report in markdown format with:\n"
-                "- Executive Summary (2-3 paragraphs)\n"
-                "- Detailed company profiles for client and competitors\n"
-                "- Comparative analysis with SWOT-style insights\n"
-                "- Market positioning and competitive dynamics\n"
-                "- Strategic recommendations and next steps\n"
-                "- Professional formatting suitable for executive presentation"
-            ),
+
+    @cached_property
+    def task_write_report(self) -> Task:
+        """Task 3: Write the competitive analysis report."""
+        return Task(
+            description=_DESC_WRITE_REPORT,
+            expected_output=_EXPECTED_WRITE_REPORT,
             agent=self.report_writer,
             context=[self.task_research]
         )
-        
-        # Task 4: Quality validation and management
-        self.task_validate_quality = Task(
-            description=(
-                "Validate report quality and manage the writing process:\n"
-                "1. Review the report for completeness, accuracy, and professional standards\n"
-                "2. Check that all required sections are present and well-developed\n"
-                "3. Validate that recommendations are actionable and well-supported\n"
-                "4. Ensure proper formatting and executive-level presentation\n"
-                "5. If quality standards are not met, coordinate with the writer for improvements"
-            ),
-            expected_output=(
-                "Quality validation report containing:\n"
-                "- Assessment of report completeness and accuracy\n"
-                "- Validation of professional standards and formatting\n"
-                "- Confirmation that all requirements are met\n"
-                "- Any recommendations for improvements (if needed)\n"
-                "- Final approval for the report to proceed to editing"
-            ),
+
+    @cached_property
+    def task_validate_quality(self) -> Task:
+        """Task 4: Quality validation and management."""
+        return Task(
+            description=_DESC_VALIDATE_QUALITY,
+            expected_output=_EXPECTED_VALIDATE_QUALITY,
             agent=self.quality_manager,
             context=[self.task_write_report]
         )
-        
-        # Task 5: Editorial review and polishing
-        self.task_edit_report = Task(
-            description=(
-                "Perform final editorial review and polishing:\n"
-                "1. Review the report for grammar, style, and clarity\n"
-                "2. Enhance language for executive-level presentation\n"
-                "3. Ensure consistent tone and professional flow\n"
-                "4. Optimize readability and impact\n"
-                "5. Maintain all factual content while improving presentation"
-            ),
-            expected_output=(
-                "A polished, executive-ready competitive analysis report with:\n"
-                "- Impeccable grammar and professional language\n"
-                "- Enhanced clarity and readability\n"
-                "- Consistent executive-level tone throughout\n"
-                "- Optimized structure and flow\n"
-                "- Professional formatting and presentation"
-            ),
+
+    @cached_property
+    def task_edit_report(self) -> Task:
+        """Task 5: Editorial review and polishing."""
+        return Task(
+            description=_DESC_EDIT_REPORT,
+            expected_output=_EXPECTED_EDIT_REPORT,
             agent=self.senior_editor,
             context=[self.task_validate_quality]
         )
-        
-        # Task 6: Translation (optional)
-        self.task_translate = Task(
-            description=(
-                "Provide optional translation services:\n"
-                "1. Ask the user if they need the report translated to another language\n"
-                "2. If translation is requested, ask for the target language\n"
-                "3. Translate the report while maintaining professional tone and accuracy\n"
-                "4. Ensure business terminology is correctly translated\n"
-                "5. Provide both original and translated versions\n"
-                "6. IMPORTANT: Always display the full report content in your final answer"
-            ),
-            expected_output=(
-                "Translation service result with FULL REPORT CONTENT:\n"
-                "- Complete original report text\n"
-                "- If translation requested: complete translated report text\n"
-                "- Both versions must be fully displayed in the final answer\n"
-                "- Maintained professional tone and business terminology"
-            ),
+
+    @cached_property
+    def task_translate(self) -> Task:
+        """Task 6: Translation (optional)."""
+        return Task(
+            description=_DESC_TRANSLATE,
+            expected_output=_EXPECTED_TRANSLATE,
             agent=self.translator,
             context=[self.task_edit_report],
             human_input=True
         )
-        
-        logger.info("Tasks initialized", task_count=6)
-    
+
     def crew(self) -> Crew:
         """
         Create and return the configured crew.
-        
+
         Returns:
             Crew: Configured competitive analysis crew ready for execution
         """
+        # The six tasks form a strict dependency chain (each task's context is
+        # the previous task's output), so there are no independent branches to
+        # fan out asynchronously. Process.sequential is retained deliberately;
+        # per-competitor parallelism belongs inside the research tools instead.
         return Crew(
             agents=[
                 self.onboarding_specialist,
@@ -328,4 +414,4 @@ class CompetitiveAnalysisCrew:
             memory=True,
             verbose=True,
             manager_llm=self.llm_config.get_llm("openai", "gpt-4o", "manager")
-        )
\ No newline at end of file
+        )
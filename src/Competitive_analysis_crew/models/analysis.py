@@ -5,12 +5,45 @@ This module defines data structures for competitive analysis reports,
 market analysis, and recommendations.
 """
 
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields as dataclass_fields, is_dataclass
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from enum import Enum
 
-from .company import CompanyProfile
+if TYPE_CHECKING:
+    from .company import CompanyProfile
+
+
+# Timestamp shared across bulk construction; see shared_now below.
+_shared_now: Optional[datetime] = None
+
+
+def _now() -> datetime:
+    """Return the shared batch timestamp if one is active, else the clock."""
+    return _shared_now if _shared_now is not None else datetime.now()
+
+
+@contextmanager
+def shared_now():
+    """
+    Reuse one timestamp for every model built inside the block.
+
+    Building a report with many sources otherwise issues one clock syscall
+    per instance via the datetime default factories; batched ingest usually
+    wants them to share the scrape timestamp anyway.
+    """
+    global _shared_now
+    _shared_now = datetime.now()
+    try:
+        yield _shared_now
+    finally:
+        _shared_now = None
 
 
 class RecommendationType(str, Enum):
@@ -32,66 +65,62 @@ class RecommendationPriority(str, Enum):
     CRITICAL = "critical"
 
 
-class Recommendation(BaseModel):
-    """Represents a strategic recommendation from the analysis."""
-    
-    title: str = Field(..., description="Recommendation title")
-    description: str = Field(..., description="Detailed recommendation description")
-    type: RecommendationType = Field(..., description="Type of recommendation")
-    priority: RecommendationPriority = Field(..., description="Priority level")
-    rationale: str = Field(..., description="Reasoning behind the recommendation")
-    
+# Numeric ordering for priority sorts, so comparators do one dict lookup and
+# an integer compare instead of string comparisons per pair.
+_PRIORITY_WEIGHT = {
+    RecommendationPriority.LOW: 0,
+    RecommendationPriority.MEDIUM: 1,
+    RecommendationPriority.HIGH: 2,
+    RecommendationPriority.CRITICAL: 3,
+}
+
+
+@dataclass(slots=True)
+class Recommendation:
+    """
+    Represents a strategic recommendation from the analysis.
+
+    A plain slotted dataclass: reports carry dozens of these, so the
+    per-instance cost matters more than per-field validation, which the
+    enclosing report model still provides when it validates its children.
+    """
+
+    title: str
+    description: str
+    type: RecommendationType
+    priority: RecommendationPriority
+    rationale: str
+
     # Implementation details
-    expected_impact: Optional[str] = Field(None, description="Expected business impact")
-    implementation_timeline: Optional[str] = Field(None, description="Suggested timeline")
-    required_resources: List[str] = Field(
-        default_factory=list,
-        description="Resources needed for implementation"
-    )
-    success_metrics: List[str] = Field(
-        default_factory=list,
-        description="Metrics to measure success"
-    )
-    
+    expected_impact: Optional[str] = None
+    implementation_timeline: Optional[str] = None
+    required_resources: List[str] = field(default_factory=list)
+    success_metrics: List[str] = field(default_factory=list)
+
     # Risk assessment
-    risks: List[str] = Field(
-        default_factory=list,
-        description="Potential risks and challenges"
-    )
-    mitigation_strategies: List[str] = Field(
-        default_factory=list,
-        description="Risk mitigation strategies"
-    )
-    
+    risks: List[str] = field(default_factory=list)
+    mitigation_strategies: List[str] = field(default_factory=list)
+
     # Supporting data
-    supporting_evidence: List[str] = Field(
-        default_factory=list,
-        description="Evidence supporting this recommendation"
-    )
-    related_companies: List[str] = Field(
-        default_factory=list,
-        description="Companies relevant to this recommendation"
-    )
+    supporting_evidence: List[str] = field(default_factory=list)
+    related_companies: List[str] = field(default_factory=list)
 
+    @property
+    def priority_weight(self) -> int:
+        """Numeric priority for sort keys: low=0 through critical=3."""
+        return _PRIORITY_WEIGHT[RecommendationPriority(self.priority)]
 
-class MarketSegment(BaseModel):
+
+@dataclass(slots=True)
+class MarketSegment:
     """Represents a market segment in the competitive landscape."""
-    
-    name: str = Field(..., description="Segment name")
-    size: Optional[str] = Field(None, description="Market size")
-    growth_rate: Optional[str] = Field(None, description="Growth rate")
-    key_players: List[str] = Field(
-        default_factory=list,
-        description="Key players in this segment"
-    )
-    characteristics: List[str] = Field(
-        default_factory=list,
-        description="Key characteristics of this segment"
-    )
-    trends: List[str] = Field(
-        default_factory=list,
-        description="Current trends in this segment"
-    )
+
+    name: str
+    size: Optional[str] = None
+    growth_rate: Optional[str] = None
+    key_players: List[str] = field(default_factory=list)
+    characteristics: List[str] = field(default_factory=list)
+    trends: List[str] = field(default_factory=list)
 
 
 class CompetitiveLandscape(BaseModel):
@@ -189,28 +218,20 @@ class MarketAnalysis(BaseModel):
     )
 
 
-class Source(BaseModel):
+@dataclass(slots=True)
+class Source:
     """Represents a data source used in the analysis."""
-    
-    name: str = Field(..., description="Source name")
-    type: str = Field(..., description="Type of source (website, report, interview, etc.)")
-    url: Optional[str] = Field(None, description="URL if applicable")
-    date_accessed: datetime = Field(
-        default_factory=datetime.now,
-        description="When the source was accessed"
-    )
-    reliability_score: Optional[float] = Field(
-        None,
-        ge=0.0,
-        le=1.0,
-        description="Reliability score of the source"
-    )
-    
-    @validator('reliability_score')
-    def validate_reliability_score(cls, v):
+
+    name: str
+    type: str  # website, report, interview, etc.
+    url: Optional[str] = None
+    date_accessed: datetime = field(default_factory=_now)
+    reliability_score: Optional[float] = None
+
+    def __post_init__(self):
+        v = self.reliability_score
         if v is not None and (v < 0.0 or v > 1.0):
             raise ValueError('Reliability score must be between 0.0 and 1.0')
-        return v
 
 
 class CompetitiveAnalysisReport(BaseModel):
@@ -225,17 +246,17 @@ class CompetitiveAnalysisReport(BaseModel):
     title: str = Field(..., description="Report title")
     executive_summary: str = Field(..., description="Executive summary")
     generated_at: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="Report generation timestamp"
     )
     version: str = Field(default="1.0", description="Report version")
     
     # Core analysis content
-    client_company: Optional[CompanyProfile] = Field(
+    client_company: Optional["CompanyProfile"] = Field(
         None,
         description="Profile of the client company"
     )
-    company_profiles: List[CompanyProfile] = Field(
+    company_profiles: List["CompanyProfile"] = Field(
         default_factory=list,
         description="Profiles of analyzed companies"
     )
@@ -290,18 +311,52 @@ class CompetitiveAnalysisReport(BaseModel):
         description="Suggested next steps"
     )
     
-    @validator('confidence_level', 'completeness_score')
-    def validate_scores(cls, v):
-        if v is not None and (v < 0.0 or v > 1.0):
-            raise ValueError('Score must be between 0.0 and 1.0')
-        return v
-    
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        schema_extra = {
+    def __init__(self, **data):
+        # Direct keyword construction must also resolve the deferred
+        # CompanyProfile forward refs; after the first call this is a
+        # single globals() membership check.
+        _load_company_models()
+        super().__init__(**data)
+
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "CompetitiveAnalysisReport":
+        """
+        Build a report from already-validated data without re-running validation.
+
+        Intended for hydrating reports that this application produced itself
+        (e.g. reloading from a local cache or disk). Data crossing a trust
+        boundary, such as raw LLM output, should still go through
+        ``model_validate``.
+        """
+        _load_company_models()
+        return _construct_trusted(cls, data)
+
+    @classmethod
+    def model_validate(cls, *args, **kwargs):
+        _load_company_models()
+        return super().model_validate(*args, **kwargs)
+
+    @classmethod
+    def model_validate_json(cls, *args, **kwargs):
+        _load_company_models()
+        return super().model_validate_json(*args, **kwargs)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the report to JSON bytes for disk caches and API responses.
+
+        orjson encodes the nested datetimes, enums and dataclasses in C,
+        which is several times faster than the stdlib json path behind
+        ``model_dump_json`` for reports of this size.
+        """
+        import orjson
+
+        return orjson.dumps(self.model_dump(mode="python"))
+
+    # datetime fields serialize to ISO 8601 natively in v2 JSON mode, so the
+    # old json_encoders entry is no longer needed.
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "title": "Competitive Analysis: Cloud Analytics Market",
                 "executive_summary": "This report analyzes the competitive landscape...",
@@ -310,4 +365,98 @@ class CompetitiveAnalysisReport(BaseModel):
                 "confidence_level": 0.85,
                 "completeness_score": 0.90
             }
-        }
\ No newline at end of file
+        }
+    )
+
+
+# Nested model lookup for the trusted hydration path, keyed on field name.
+# Fields holding lists recurse per item; everything else passes through as-is.
+# The company.py entries are filled in by _load_company_models.
+_TRUSTED_NESTED = {
+    "competitive_landscape": CompetitiveLandscape,
+    "market_analysis": MarketAnalysis,
+    "recommendations": Recommendation,
+    "sources": Source,
+    "segments": MarketSegment,
+}
+
+
+def _load_company_models() -> None:
+    """
+    Import the company models on first use and resolve the forward refs.
+
+    company.py stays out of the module import so analysis-only consumers
+    skip its model compile cost; pydantic resolves the "CompanyProfile"
+    annotations lazily once the name lands in this module's namespace.
+    """
+    if "CompanyProfile" in globals():
+        return
+    from .company import CompanyProfile, FinancialData, NewsItem
+
+    globals()["CompanyProfile"] = CompanyProfile
+    _TRUSTED_NESTED.update(
+        client_company=CompanyProfile,
+        company_profiles=CompanyProfile,
+        recent_news=NewsItem,
+        financial_highlights=FinancialData,
+    )
+    CompetitiveAnalysisReport.model_rebuild()
+
+
+@lru_cache(maxsize=None)
+def _dataclass_field_names(model_cls) -> frozenset:
+    return frozenset(f.name for f in dataclass_fields(model_cls))
+
+
+def _construct_trusted(model_cls, data):
+    """Recursively ``model_construct`` a model tree from pre-validated data."""
+    if data is None:
+        return None
+    if is_dataclass(model_cls):
+        allowed = _dataclass_field_names(model_cls)
+        return model_cls(**{k: v for k, v in data.items() if k in allowed})
+    values = {}
+    for key, value in data.items():
+        if key not in model_cls.model_fields:
+            continue
+        nested_cls = _TRUSTED_NESTED.get(key)
+        if nested_cls is not None and value is not None:
+            if isinstance(value, list):
+                value = [_construct_trusted(nested_cls, item) for item in value]
+            else:
+                value = _construct_trusted(nested_cls, value)
+        values[key] = value
+    return model_cls.model_construct(**values)
+
+
+@lru_cache(maxsize=None)
+def _adapter(model_cls) -> TypeAdapter:
+    """Return a cached TypeAdapter so the schema is only compiled once."""
+    return TypeAdapter(model_cls)
+
+
+# Shared adapters for the models that get (de)serialized repeatedly during a
+# session. Prefer RECOMMENDATION_ADAPTER.validate_python(d) over
+# Recommendation(**d) and REPORT_ADAPTER.dump_json(report) over
+# report.model_dump_json() — dump_json returns bytes and skips the str encode.
+RECOMMENDATION_ADAPTER = _adapter(Recommendation)
+SOURCE_ADAPTER = _adapter(Source)
+REPORT_ADAPTER = _adapter(CompetitiveAnalysisReport)
+
+# Intern the hot dict keys and enum values once at import so key lookups on
+# LLM-returned dicts resolve by interned-string identity instead of a full
+# hash-and-compare per key.
+for _cls in (Recommendation, MarketSegment, Source):
+    for _field in dataclass_fields(_cls):
+        sys.intern(_field.name)
+for _cls in (CompetitiveLandscape, MarketAnalysis, CompetitiveAnalysisReport):
+    for _name in _cls.model_fields:
+        sys.intern(_name)
+for _member in (*RecommendationType, *RecommendationPriority):
+    sys.intern(_member.value)
+del _cls, _field, _name, _member
+
+# When company.py is already loaded (the usual case via the models package),
+# resolving the forward refs now is free; otherwise it waits for first use.
+if "Competitive_analysis_crew.models.company" in sys.modules:
+    _load_company_models()
\ No newline at end of file
@@ -7,9 +7,13 @@ and related information used throughout the competitive analysis process.
 
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
+# Current year captured once at import; the validator ranges only need it
+# to the year, so per-instantiation clock reads are wasted work.
+_CURRENT_YEAR = datetime.now().year
+
 
 class CompanySize(str, Enum):
     """Enumeration for company size categories."""
@@ -34,12 +38,6 @@ class NewsItem(BaseModel):
         le=1.0, 
         description="Relevance score from 0.0 to 1.0"
     )
-    
-    @validator('relevance_score')
-    def validate_relevance_score(cls, v):
-        if v is not None and (v < 0.0 or v > 1.0):
-            raise ValueError('Relevance score must be between 0.0 and 1.0')
-        return v
 
 
 class FinancialData(BaseModel):
@@ -54,18 +52,11 @@ class FinancialData(BaseModel):
     market_cap: Optional[str] = Field(None, description="Market capitalization")
     fiscal_year: Optional[int] = Field(None, description="Fiscal year for the data")
     
-    @validator('employees')
-    def validate_employees(cls, v):
-        if v is not None and v < 0:
-            raise ValueError('Number of employees cannot be negative')
-        return v
-    
-    @validator('fiscal_year')
+    @field_validator('fiscal_year')
+    @classmethod
     def validate_fiscal_year(cls, v):
-        if v is not None:
-            current_year = datetime.now().year
-            if v < 1900 or v > current_year + 1:
-                raise ValueError(f'Fiscal year must be between 1900 and {current_year + 1}')
+        if v is not None and (v < 1900 or v > _CURRENT_YEAR + 1):
+            raise ValueError(f'Fiscal year must be between 1900 and {_CURRENT_YEAR + 1}')
         return v
 
 
@@ -144,33 +135,24 @@ class CompanyProfile(BaseModel):
         description="Confidence score for the data accuracy"
     )
     
-    @validator('founded')
+    @field_validator('founded')
+    @classmethod
     def validate_founded_year(cls, v):
-        if v is not None:
-            current_year = datetime.now().year
-            if v < 1800 or v > current_year:
-                raise ValueError(f'Founded year must be between 1800 and {current_year}')
-        return v
-    
-    @validator('confidence_score')
-    def validate_confidence_score(cls, v):
-        if v is not None and (v < 0.0 or v > 1.0):
-            raise ValueError('Confidence score must be between 0.0 and 1.0')
+        if v is not None and (v < 1800 or v > _CURRENT_YEAR):
+            raise ValueError(f'Founded year must be between 1800 and {_CURRENT_YEAR}')
         return v
     
-    @validator('website')
+    @field_validator('website')
+    @classmethod
     def validate_website_url(cls, v):
         if v is not None and v.strip():
             if not (v.startswith('http://') or v.startswith('https://')):
                 v = f'https://{v}'
         return v
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-        schema_extra = {
+    # datetime serializes to ISO 8601 natively in v2 JSON mode, replacing
+    # the old json_encoders entry.
+    model_config = ConfigDict(json_schema_extra={
             "example": {
                 "name": "TechCorp Inc.",
                 "industry": "Software Technology",
@@ -186,4 +168,4 @@ class CompanyProfile(BaseModel):
                 "competitive_advantages": ["Advanced AI capabilities", "Strong enterprise relationships"],
                 "confidence_score": 0.85
             }
-        }
\ No newline at end of file
+        })
\ No newline at end of file
@@ -5,14 +5,40 @@ This package contains specialized tools designed for competitive intelligence
 gathering, analysis, and report validation.
 """
 
-from .competitive_search import CompetitiveSearchTool
-from .market_analysis import MarketAnalysisTool
-from .report_validation import ReportValidationTool
-from .date_context import DateContextTool
-
-__all__ = [
-    "CompetitiveSearchTool",
-    "MarketAnalysisTool",
-    "ReportValidationTool",
-    "DateContextTool"
-]
\ No newline at end of file
+import logging
+from importlib import import_module
+
+import structlog
+
+# structlog's default BoundLogger has no isEnabledFor(); the idiomatic
+# equivalent is a filtering bound logger set once at configuration time.
+# Disabled levels (debug in the tools' hot paths) then resolve to no-op
+# methods, so suppressed calls skip all processor and rendering work.
+# Guarded so an application that configured structlog itself wins.
+if not structlog.is_configured():
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO)
+    )
+
+# Re-exported tool classes mapped to the submodule that defines them.
+# Resolved lazily (PEP 562) so importing the package doesn't pull in the
+# crewai/pydantic machinery for tools the process never uses.
+_EXPORTS = {
+    "CompetitiveSearchTool": "competitive_search",
+    "MarketAnalysisTool": "market_analysis",
+    "ReportValidationTool": "report_validation",
+    "DateContextTool": "date_context",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Resolve re-exported tools lazily on first attribute access."""
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
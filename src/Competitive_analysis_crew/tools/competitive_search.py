@@ -6,22 +6,277 @@ This tool extends the basic search capabilities with competitive analysis-specif
 features and enhanced data gathering.
 """
 
-from typing import Dict, Any, Optional, List
-import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, NamedTuple, Optional, List, Tuple
+import sys
+import time
+
 import structlog
 
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
 
 logger = structlog.get_logger()
 
+# Competitive-analysis search terms per focus area, hoisted to module
+# scope with the two-term OR prefix precomputed: the query builder runs
+# inside agent loops, so the hot path is two dict lookups plus one
+# f-string instead of a dict literal and a join per call.
+COMPETITIVE_TERMS = {
+    "financial": ("revenue", "earnings", "financial results", "quarterly report"),
+    "products": ("product launch", "new products", "product strategy", "innovation"),
+    "strategy": ("business strategy", "strategic initiatives", "market expansion"),
+    "market": ("market share", "market position", "competitive landscape"),
+    "news": ("recent news", "press release", "announcement", "latest"),
+    "general": ("company overview", "business model", "competitive analysis")
+}
+
+_FOCUS_OR_PREFIX = {
+    focus: " OR ".join(terms[:2]) for focus, terms in COMPETITIVE_TERMS.items()
+}
+
+# Titled focus-area names for the output header, precomputed so the
+# formatter does a dict lookup instead of str.title per call.
+_FOCUS_TITLE = {focus: focus.title() for focus in COMPETITIVE_TERMS}
+
+# Minimal perfect hash over the six focus areas: their first characters
+# ('f','p','s','m','n','g') are all distinct, so one ord() + subscript
+# replaces a full dict probe. Each slot keeps (key, prefix) so lookups
+# confirm the whole key and unknown areas still fall back to "general".
+_FOCUS_INDEX: List[Optional[tuple]] = [None] * 128
+for _focus, _prefix in _FOCUS_OR_PREFIX.items():
+    _FOCUS_INDEX[ord(_focus[0])] = (_focus, _prefix)
+del _focus, _prefix
+
+# Static competitive-insights block shared by every simulated search.
+# A read-only mapping of tuples at module scope: the formatter only
+# iterates it, so there is no reason to reallocate the dict and its
+# twelve strings per call.
+_STATIC_INSIGHTS = MappingProxyType({
+    "market_position": "Strong competitive position with growing market share",
+    "key_strengths": ("Innovation capability", "Market presence", "Financial stability"),
+    "potential_threats": ("New market entrants", "Technology disruption", "Regulatory changes"),
+    "opportunities": ("Market expansion", "Product diversification", "Strategic partnerships")
+})
+
+
+# Whole-pipeline result cache: agents re-issue the same
+# (query, company, focus_area) triple within one analysis, and on a hit
+# the fully formatted string comes back without touching the query
+# builder, simulator, or formatter. LRU eviction bounds memory; the TTL
+# keeps entries from outliving a session once real backends land.
+_RUN_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[float, str]]" = OrderedDict()
+_RUN_CACHE_MAX = 256
+_RUN_CACHE_TTL = 300.0
+
+
+def _iter_insights_blocks(insights: Dict[str, Any]) -> Iterator[str]:
+    """Yield the formatted competitive-insights section block by block."""
+    yield (
+        "## Competitive Intelligence Insights\n"
+        f"**Market Position:** {insights.get('market_position', 'N/A')}\n"
+    )
+
+    if insights.get("key_strengths"):
+        yield "**Key Strengths:**\n"
+        for strength in insights["key_strengths"]:
+            yield f"- {strength}\n"
+
+    if insights.get("potential_threats"):
+        yield "**Potential Threats:**\n"
+        for threat in insights["potential_threats"]:
+            yield f"- {threat}\n"
+
+    if insights.get("opportunities"):
+        yield "**Opportunities:**\n"
+        for opportunity in insights["opportunities"]:
+            yield f"- {opportunity}\n"
+
+
+# The simulated backend always returns the shared _STATIC_INSIGHTS
+# mapping, so its rendered section is deterministic: prerender it once at
+# import and let the formatter recognize the mapping by identity.
+_STATIC_INSIGHTS_BLOCK = "".join(_iter_insights_blocks(_STATIC_INSIGHTS))
+
+
+class SearchResult(NamedTuple):
+    """Single search result; a tuple under the hood, so cached entries
+    cost six slots instead of a full dict and field access is an indexed
+    fetch."""
+    title: str
+    url: str
+    snippet: str
+    relevance_score: float
+    source_type: str
+    date: str
 
-class SearchQuery(BaseModel):
-    """Model for search query parameters."""
-    company: str = Field(..., description="Company name to search for")
-    focus_area: str = Field(default="general", description="Specific focus area for the search")
-    time_period: str = Field(default="recent", description="Time period for the search (recent, 2023, etc.)")
-    search_type: str = Field(default="comprehensive", description="Type of search to perform")
+
+# Pre-baked output blocks, mirroring date_context's _FULL_TEMPLATE: the
+# formatter fills each with one format call instead of assembling f-string
+# fragments per field.
+_HEADER_BLOCK = (
+    "# Competitive Intelligence Search Results: {company}\n"
+    "**Focus Area:** {focus_title}\n"
+    "**Query:** {query}\n"
+    "\n"
+    "## Search Results\n"
+)
+
+_RESULT_BLOCK = (
+    "### {i}. {title}\n"
+    "**URL:** {url}\n"
+    "**Date:** {date}\n"
+    "**Source Type:** {source_type}\n"
+    "**Relevance:** {relevance_score:.0%}\n"
+    "**Summary:** {snippet}\n"
+    "\n"
+)
+
+# Interned source-type tags: every result carries one of these five
+# strings, so interning makes downstream equality checks and dict hashing
+# identity-fast and keeps one shared object per tag (same treatment as
+# market_analysis's position profiles).
+_SRC_FINANCIAL = sys.intern("financial_analysis")
+_SRC_STRATEGIC = sys.intern("strategic_analysis")
+_SRC_PRODUCT = sys.intern("product_analysis")
+_SRC_MARKET = sys.intern("market_analysis")
+_SRC_TREND = sys.intern("trend_analysis")
+
+# Company-result templates as (title, url, snippet, score, source_type, date)
+# tuples with one %s slot for the company name. A dispatch table below maps
+# each focus area to the templates it renders, so result generation is a
+# single dict lookup plus one %-formatting pass per template instead of a
+# branch chain with inline f-string literals.
+_FINANCIAL_TMPL = (
+    "%s - Financial Performance and Market Position",
+    "Business intelligence analysis for %s",
+    "%s demonstrates solid financial performance with consistent revenue growth and strong market positioning in their sector. The company has shown resilience in competitive markets and maintains healthy profit margins.",
+    0.95,
+    _SRC_FINANCIAL,
+    "2024-01-15",
+)
+
+_STRATEGY_TMPL = (
+    "%s - Strategic Business Initiatives",
+    "Strategic analysis for %s",
+    "%s has implemented strategic initiatives focused on market expansion, operational efficiency, and customer satisfaction. Their approach emphasizes sustainable growth and competitive differentiation.",
+    0.88,
+    _SRC_STRATEGIC,
+    "2024-01-10",
+)
+
+_PRODUCT_TMPL = (
+    "%s - Product Portfolio and Innovation",
+    "Product analysis for %s",
+    "%s maintains a diverse product portfolio with focus on innovation and customer needs. Their product strategy emphasizes quality, reliability, and market responsiveness.",
+    0.82,
+    _SRC_PRODUCT,
+    "2024-01-08",
+)
+
+# Focus areas without company-specific templates (market, news) keep the
+# historical behavior of yielding no company rows, hence the () default.
+_RESULT_BUILDERS = {
+    "financial": (_FINANCIAL_TMPL,),
+    "strategy": (_STRATEGY_TMPL,),
+    "products": (_PRODUCT_TMPL,),
+    "general": (_FINANCIAL_TMPL, _STRATEGY_TMPL, _PRODUCT_TMPL),
+}
+
+# Industry-level results carry no per-call state, so the tuple is built
+# once at import and shared by every company-less query.
+_INDUSTRY_RESULTS = (
+    SearchResult(
+        title="Industry Market Analysis and Competitive Landscape",
+        url="Industry competitive intelligence report",
+        snippet="Comprehensive analysis of market dynamics, competitive positioning, and industry trends showing growth opportunities and competitive challenges.",
+        relevance_score=0.90,
+        source_type=_SRC_MARKET,
+        date="2024-01-12"
+    ),
+    SearchResult(
+        title="Market Trends and Strategic Insights",
+        url="Market trend analysis report",
+        snippet="Analysis of emerging market trends, customer preferences, and strategic opportunities that are shaping the competitive landscape.",
+        relevance_score=0.85,
+        source_type=_SRC_TREND,
+        date="2024-01-09"
+    ),
+)
+
+
+@lru_cache(maxsize=256)
+def _build_competitive_query_cached(query: str, company: str, focus_area: str) -> str:
+    """Assemble (or reuse) the enhanced query for one argument triple.
+
+    Agents refining a single competitor re-issue identical triples, so
+    the bounded cache turns the repeat case into a dict lookup. Lives at
+    module scope so `self` never pollutes the cache key.
+    """
+    # Add competitive analysis specific terms (precomputed per focus area,
+    # resolved through the first-character index)
+    entry = _FOCUS_INDEX[ord(focus_area[0]) & 127] if focus_area else None
+    if entry is not None and entry[0] == focus_area:
+        prefix = entry[1]
+    else:
+        prefix = _FOCUS_OR_PREFIX["general"]
+
+    if company:
+        return f'"{company}" {query} {prefix}'
+    return f'{query} {prefix}'
+
+
+def _apply_template(tmpl: tuple, company: str) -> SearchResult:
+    """Render one company-result template in a single %-formatting pass."""
+    title_fmt, url_fmt, snippet_fmt, score, source_type, date = tmpl
+    return SearchResult(
+        title=title_fmt % company,
+        url=url_fmt % company,
+        snippet=snippet_fmt % company,
+        relevance_score=score,
+        source_type=source_type,
+        date=date,
+    )
+
+
+@lru_cache(maxsize=512)
+def _gen_results_cached(company: str, focus_area: str) -> tuple:
+    """Build (or reuse) the simulated results for one (company, focus_area).
+
+    The results are deterministic in their arguments and treated as
+    immutable downstream, so repeat queries for the same pair — common in
+    competitive-analysis agent loops — share one tuple instead of
+    re-rendering every template.
+    """
+    if not company:
+        return _INDUSTRY_RESULTS
+
+    return tuple(
+        _apply_template(tmpl, company)
+        for tmpl in _RESULT_BUILDERS.get(focus_area, ())
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class SearchQuery:
+    """Search query parameters.
+
+    A plain frozen dataclass rather than a pydantic model: _run takes raw
+    strings and this type never crosses the args_schema boundary, so it
+    skips validation overhead, fits in slots, and hashes for cache keys.
+
+    Attributes:
+        company: Company name to search for
+        focus_area: Specific focus area for the search
+        time_period: Time period for the search (recent, 2023, etc.)
+        search_type: Type of search to perform
+    """
+    company: str
+    focus_area: str = "general"
+    time_period: str = "recent"
+    search_type: str = "comprehensive"
 
 
 class CompetitiveSearchTool(BaseTool):
@@ -54,9 +309,21 @@ class CompetitiveSearchTool(BaseTool):
             str: Formatted search results with competitive intelligence insights
         """
         try:
-            logger.info("Executing competitive search", 
-                       query=query, company=company, focus_area=focus_area)
-            
+            key = (query, company, focus_area)
+            now = time.monotonic()
+            hit = _RUN_CACHE.get(key)
+            if hit is not None and now - hit[0] < _RUN_CACHE_TTL:
+                _RUN_CACHE.move_to_end(key)
+                return hit[1]
+
+            # Debug level: _run fires on every agent turn, and structlog's
+            # filtering bound logger (configured in tools/__init__) turns
+            # disabled levels into no-op methods, so the common case skips
+            # all processor and formatting work.
+            logger.debug("Executing competitive search",
+                         query=query, company=company, focus_area=focus_area)
+
+
             # Enhanced search query construction for competitive analysis
             enhanced_query = self._build_competitive_query(query, company, focus_area)
             
@@ -66,15 +333,69 @@ class CompetitiveSearchTool(BaseTool):
             
             search_results = self._simulate_competitive_search(enhanced_query, company, focus_area)
             
-            logger.info("Competitive search completed", 
-                       results_count=len(search_results.get("results", [])))
-            
-            return self._format_competitive_results(search_results, focus_area)
+            logger.debug("Competitive search completed",
+                         results_count=len(search_results.get("results", [])))
+
+            formatted = self._format_competitive_results(search_results, focus_area)
+
+            _RUN_CACHE[key] = (now, formatted)
+            if len(_RUN_CACHE) > _RUN_CACHE_MAX:
+                _RUN_CACHE.popitem(last=False)
+
+            return formatted
             
         except Exception as e:
             logger.error("Error in competitive search", error=str(e))
             return f"Error performing competitive search: {str(e)}"
     
+    async def _arun(self, query: str, company: str = "", focus_area: str = "general") -> str:
+        """
+        Async entry point so the crew's kickoff_async pipeline can await
+        searches without blocking the event loop thread pool.
+
+        The simulated backend is pure CPU work, so this delegates to the
+        synchronous pipeline; when real search APIs are integrated, this
+        is the place to issue the provider requests (web, news, financial)
+        concurrently via httpx.AsyncClient and asyncio.gather instead of
+        serializing the round-trips.
+
+        Args:
+            query: The search query to execute
+            company: Specific company to focus the search on
+            focus_area: Specific area to focus on (financial, products, strategy, etc.)
+
+        Returns:
+            str: Formatted search results with competitive intelligence insights
+        """
+        return self._run(query, company=company, focus_area=focus_area)
+
+    def _run_batch(self, requests: List[SearchQuery]) -> List[str]:
+        """
+        Serve several search requests in one pass; preferred over looping
+        _run from programmatic callers.
+
+        On the simulated path the queries are fused into one comprehension
+        over the shared result and template caches, so duplicate
+        (company, focus_area) pairs across the batch render once. When a
+        real backend is integrated, this is where the batch becomes a
+        single POST of all queries (or an asyncio.gather of _arun calls),
+        amortizing connection and auth overhead across the batch.
+
+        Args:
+            requests: Search requests to serve together
+
+        Returns:
+            List[str]: One formatted result per request, in input order
+        """
+        return [
+            self._run(
+                f"{request.search_type} {request.time_period}",
+                company=request.company,
+                focus_area=request.focus_area,
+            )
+            for request in requests
+        ]
+
     def _build_competitive_query(self, query: str, company: str, focus_area: str) -> str:
         """
         Build an enhanced search query optimized for competitive analysis.
@@ -87,24 +408,7 @@ class CompetitiveSearchTool(BaseTool):
         Returns:
             str: Enhanced search query
         """
-        # Add competitive analysis specific terms
-        competitive_terms = {
-            "financial": ["revenue", "earnings", "financial results", "quarterly report"],
-            "products": ["product launch", "new products", "product strategy", "innovation"],
-            "strategy": ["business strategy", "strategic initiatives", "market expansion"],
-            "market": ["market share", "market position", "competitive landscape"],
-            "news": ["recent news", "press release", "announcement", "latest"],
-            "general": ["company overview", "business model", "competitive analysis"]
-        }
-        
-        focus_terms = competitive_terms.get(focus_area, competitive_terms["general"])
-        
-        if company:
-            enhanced_query = f'"{company}" {query} {" OR ".join(focus_terms[:2])}'
-        else:
-            enhanced_query = f'{query} {" OR ".join(focus_terms[:2])}'
-        
-        return enhanced_query
+        return _build_competitive_query_cached(query, company, focus_area)
     
     def _simulate_competitive_search(self, query: str, company: str, focus_area: str) -> Dict[str, Any]:
         """
@@ -121,21 +425,15 @@ class CompetitiveSearchTool(BaseTool):
         Returns:
             Dict: Simulated search results with competitive intelligence data
         """
-        # Generate realistic competitive intelligence search results with actual insights
-        simulated_results = {
+        # Generate realistic competitive intelligence search results with
+        # actual insights; the static insight block is shared, not rebuilt.
+        return {
             "query": query,
             "company": company,
             "focus_area": focus_area,
             "results": self._generate_realistic_results(company, focus_area),
-            "competitive_insights": {
-                "market_position": "Strong competitive position with growing market share",
-                "key_strengths": ["Innovation capability", "Market presence", "Financial stability"],
-                "potential_threats": ["New market entrants", "Technology disruption", "Regulatory changes"],
-                "opportunities": ["Market expansion", "Product diversification", "Strategic partnerships"]
-            }
+            "competitive_insights": _STATIC_INSIGHTS
         }
-        
-        return simulated_results
     
     def _generate_realistic_results(self, company: str, focus_area: str) -> List[Dict[str, Any]]:
         """
@@ -148,116 +446,94 @@ class CompetitiveSearchTool(BaseTool):
         Returns:
             List[Dict]: Realistic search results with actual business insights
         """
-        results = []
-        
-        if company:
-            # Generate company-specific results with realistic business insights
-            if focus_area in ["financial", "general"]:
-                results.append({
-                    "title": f"{company} - Financial Performance and Market Position",
-                    "url": f"Business intelligence analysis for {company}",
-                    "snippet": f"{company} demonstrates solid financial performance with consistent revenue growth and strong market positioning in their sector. The company has shown resilience in competitive markets and maintains healthy profit margins.",
-                    "relevance_score": 0.95,
-                    "source_type": "financial_analysis",
-                    "date": "2024-01-15"
-                })
-            
-            if focus_area in ["strategy", "general"]:
-                results.append({
-                    "title": f"{company} - Strategic Business Initiatives",
-                    "url": f"Strategic analysis for {company}",
-                    "snippet": f"{company} has implemented strategic initiatives focused on market expansion, operational efficiency, and customer satisfaction. Their approach emphasizes sustainable growth and competitive differentiation.",
-                    "relevance_score": 0.88,
-                    "source_type": "strategic_analysis",
-                    "date": "2024-01-10"
-                })
-            
-            if focus_area in ["products", "general"]:
-                results.append({
-                    "title": f"{company} - Product Portfolio and Innovation",
-                    "url": f"Product analysis for {company}",
-                    "snippet": f"{company} maintains a diverse product portfolio with focus on innovation and customer needs. Their product strategy emphasizes quality, reliability, and market responsiveness.",
-                    "relevance_score": 0.82,
-                    "source_type": "product_analysis",
-                    "date": "2024-01-08"
-                })
-        else:
-            # Generate industry-level results
-            results.extend([
-                {
-                    "title": "Industry Market Analysis and Competitive Landscape",
-                    "url": "Industry competitive intelligence report",
-                    "snippet": "Comprehensive analysis of market dynamics, competitive positioning, and industry trends showing growth opportunities and competitive challenges.",
-                    "relevance_score": 0.90,
-                    "source_type": "market_analysis",
-                    "date": "2024-01-12"
-                },
-                {
-                    "title": "Market Trends and Strategic Insights",
-                    "url": "Market trend analysis report",
-                    "snippet": "Analysis of emerging market trends, customer preferences, and strategic opportunities that are shaping the competitive landscape.",
-                    "relevance_score": 0.85,
-                    "source_type": "trend_analysis",
-                    "date": "2024-01-09"
-                }
-            ])
-        
-        return results
+        # _asdict at the boundary keeps the dict contract (and JSON
+        # compatibility) for callers while the cache holds tuples.
+        return [result._asdict() for result in _gen_results_cached(company, focus_area)]
     
+    def _iter_formatted_result_blocks(self, results: Dict[str, Any], focus_area: str) -> Iterator[str]:
+        """
+        Yield the formatted output block by block.
+
+        Generating lazily keeps peak memory at one block regardless of how
+        large a batched result set grows; callers that stream to a socket
+        or stdout can consume the iterator directly via stream_results.
+
+        Args:
+            results: Raw search results
+            focus_area: Focus area for formatting
+
+        Yields:
+            str: Consecutive markdown blocks of the formatted output
+        """
+        # Header
+        yield _HEADER_BLOCK.format(
+            company=results.get("company", "Market"),
+            focus_title=_FOCUS_TITLE.get(focus_area) or focus_area.title(),
+            query=results.get("query", "N/A"),
+        )
+
+        # Search Results: one template fill per result
+        for i, result in enumerate(results.get("results", []), 1):
+            yield _RESULT_BLOCK.format(i=i, **result)
+
+        # Competitive Insights: the shared static mapping (the common
+        # case) is recognized by a single pointer compare and served from
+        # the prerendered block.
+        insights = results.get("competitive_insights", {})
+        if insights is _STATIC_INSIGHTS:
+            yield _STATIC_INSIGHTS_BLOCK
+        elif insights:
+            yield from _iter_insights_blocks(insights)
+
+        yield "\n---\n*Results generated by Competitive Intelligence Search Tool*"
+
+    def stream_results(self, results: Dict[str, Any], focus_area: str) -> Iterator[str]:
+        """
+        Return the formatted output as an iterator of markdown blocks for
+        streaming consumers; _format_competitive_results joins the same
+        iterator for callers that need one string.
+
+        Args:
+            results: Raw search results
+            focus_area: Focus area for formatting
+
+        Returns:
+            Iterator[str]: Lazily formatted output blocks
+        """
+        return self._iter_formatted_result_blocks(results, focus_area)
+
     def _format_competitive_results(self, results: Dict[str, Any], focus_area: str) -> str:
         """
         Format search results for competitive analysis consumption.
-        
+
         Args:
             results: Raw search results
             focus_area: Focus area for formatting
-            
+
         Returns:
             str: Formatted competitive intelligence results
         """
-        formatted_output = []
-        
-        # Header
-        company = results.get("company", "Market")
-        formatted_output.append(f"# Competitive Intelligence Search Results: {company}")
-        formatted_output.append(f"**Focus Area:** {focus_area.title()}")
-        formatted_output.append(f"**Query:** {results.get('query', 'N/A')}")
-        formatted_output.append("")
-        
-        # Search Results
-        formatted_output.append("## Search Results")
-        for i, result in enumerate(results.get("results", []), 1):
-            formatted_output.append(f"### {i}. {result['title']}")
-            formatted_output.append(f"**URL:** {result['url']}")
-            formatted_output.append(f"**Date:** {result['date']}")
-            formatted_output.append(f"**Source Type:** {result['source_type']}")
-            formatted_output.append(f"**Relevance:** {result['relevance_score']:.0%}")
-            formatted_output.append(f"**Summary:** {result['snippet']}")
-            formatted_output.append("")
-        
-        # Competitive Insights
-        insights = results.get("competitive_insights", {})
-        if insights:
-            formatted_output.append("## Competitive Intelligence Insights")
-            formatted_output.append(f"**Market Position:** {insights.get('market_position', 'N/A')}")
-            
-            if insights.get("key_strengths"):
-                formatted_output.append("**Key Strengths:**")
-                for strength in insights["key_strengths"]:
-                    formatted_output.append(f"- {strength}")
-            
-            if insights.get("potential_threats"):
-                formatted_output.append("**Potential Threats:**")
-                for threat in insights["potential_threats"]:
-                    formatted_output.append(f"- {threat}")
-            
-            if insights.get("opportunities"):
-                formatted_output.append("**Opportunities:**")
-                for opportunity in insights["opportunities"]:
-                    formatted_output.append(f"- {opportunity}")
-        
-        formatted_output.append("")
-        formatted_output.append("---")
-        formatted_output.append("*Results generated by Competitive Intelligence Search Tool*")
-        
-        return "\n".join(formatted_output)
\ No newline at end of file
+        # One join over the lazy block iterator; str.join sizes the result
+        # buffer in a single pass.
+        return "".join(self._iter_formatted_result_blocks(results, focus_area))
+
+    def _format_competitive_results_bytes(self, results: Dict[str, Any], focus_area: str) -> bytes:
+        """
+        Format search results as UTF-8 bytes.
+
+        Counterpart to _format_competitive_results for consumers that
+        write to a file or socket: encoding block by block and joining
+        bytes skips the separate whole-string encode pass at the I/O
+        boundary (same idea as the models' to_json_bytes helpers).
+
+        Args:
+            results: Raw search results
+            focus_area: Focus area for formatting
+
+        Returns:
+            bytes: UTF-8 encoded formatted competitive intelligence results
+        """
+        return b"".join(
+            block.encode("utf-8")
+            for block in self._iter_formatted_result_blocks(results, focus_area)
+        )
\ No newline at end of file
@@ -5,8 +5,8 @@ This tool provides current date and time information to agents for accurate
 temporal context in competitive analysis and financial data reporting.
 """
 
-from datetime import datetime, timezone
-from typing import Type, Optional
+import time
+from typing import Dict, Tuple, Type, Optional
 import structlog
 
 from crewai.tools import BaseTool
@@ -15,6 +15,34 @@ from pydantic import BaseModel, Field
 # Initialize structured logging
 logger = structlog.get_logger()
 
+# Per-format TTL cache: the rendered context changes once per minute at
+# the finest granularity ('full' includes HH:MM), so repeated agent calls
+# within the window collapse to a dict lookup instead of re-running
+# datetime.now plus several strftime passes.
+_DATE_CACHE: Dict[str, Tuple[float, str]] = {}
+_DATE_CACHE_TTL = 60.0
+
+# Month-to-quarter lookup (index 0 unused): one subscript instead of the
+# subtract/floor-divide/add chain per call.
+_MONTH_TO_QUARTER = (0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4)
+
+# Precompiled template for the 'full' format — the most common request.
+# One format_map call over a module constant replaces the per-call
+# multi-line f-string assembly.
+_FULL_TEMPLATE = (
+    "Current date and time: {date} at {time}\n"
+    "Current year: {year}\n"
+    "Current quarter: Q{quarter} {year}\n"
+    "Fiscal year context: FY{fiscal_year}\n\n"
+    "IMPORTANT CONTEXT FOR ANALYSIS:\n"
+    "- When analyzing 'recent' financial data, focus on {year} and late {previous_year}\n"
+    "- 'Latest' quarterly data should be from Q{quarter} {year} or the most recent available\n"
+    "- 'Current year' performance refers to {year} data\n"
+    "- 'Previous year' refers to {previous_year}\n"
+    "- Data from {historical_year} and earlier should be labeled as 'historical'\n"
+    "- Always specify actual years (e.g., '{year}') rather than relative terms"
+)
+
 
 class DateContextInput(BaseModel):
     """Input schema for DateContextTool."""
@@ -59,14 +87,21 @@ class DateContextTool(BaseTool):
             str: Formatted date/time information with context
         """
         try:
-            now = datetime.now(timezone.utc)
-            current_date = now.strftime("%B %d, %Y")
-            current_time = now.strftime("%H:%M UTC")
-            current_year = now.year
-            current_month = now.month
-            
+            now_ts = time.time()
+            hit = _DATE_CACHE.get(format_type)
+            if hit is not None and now_ts - hit[0] < _DATE_CACHE_TTL:
+                return hit[1]
+
+            # C-level struct_time is lighter than a full aware datetime
+            # (no tzinfo chain, fewer allocations), and we only need the
+            # formatted strings plus year/month anyway.
+            gm = time.gmtime(now_ts)
+            current_date = time.strftime("%B %d, %Y", gm)
+            current_time = time.strftime("%H:%M UTC", gm)
+            current_year = gm.tm_year
+
             # Determine quarter
-            quarter = (current_month - 1) // 3 + 1
+            quarter = _MONTH_TO_QUARTER[gm.tm_mon]
             
             # Determine fiscal year context (assuming calendar year for most companies)
             fiscal_year = current_year
@@ -84,21 +119,21 @@ class DateContextTool(BaseTool):
                     f"specific company fiscal year calendars for accurate financial analysis."
                 )
             else:  # full format
-                result = (
-                    f"Current date and time: {current_date} at {current_time}\n"
-                    f"Current year: {current_year}\n"
-                    f"Current quarter: Q{quarter} {current_year}\n"
-                    f"Fiscal year context: FY{fiscal_year}\n\n"
-                    f"IMPORTANT CONTEXT FOR ANALYSIS:\n"
-                    f"- When analyzing 'recent' financial data, focus on {current_year} and late {current_year-1}\n"
-                    f"- 'Latest' quarterly data should be from Q{quarter} {current_year} or the most recent available\n"
-                    f"- 'Current year' performance refers to {current_year} data\n"
-                    f"- 'Previous year' refers to {current_year-1}\n"
-                    f"- Data from {current_year-2} and earlier should be labeled as 'historical'\n"
-                    f"- Always specify actual years (e.g., '{current_year}') rather than relative terms"
-                )
+                result = _FULL_TEMPLATE.format_map({
+                    "date": current_date,
+                    "time": current_time,
+                    "year": current_year,
+                    "previous_year": current_year - 1,
+                    "historical_year": current_year - 2,
+                    "quarter": quarter,
+                    "fiscal_year": fiscal_year,
+                })
             
-            logger.info("Date context provided", format_type=format_type, current_year=current_year)
+            _DATE_CACHE[format_type] = (now_ts, result)
+
+            # Debug level, and only on cache misses: this fires on every
+            # agent turn otherwise.
+            logger.debug("Date context provided", format_type=format_type, current_year=current_year)
             return result
             
         except Exception as e:
@@ -5,18 +5,150 @@ A specialized tool for validating competitive analysis reports against
 enterprise-grade quality standards and business requirements.
 """
 
+import hashlib
+import io
+import math
+import os
 import re
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 import structlog
 
 from crewai.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = structlog.get_logger()
 
+# Optional linear-time regex backend: the validator's hot patterns are
+# alternation-heavy with no backreferences, exactly the shape where
+# google-re2's DFA execution beats the stdlib's backtracking engine.
+# Falls back to re when re2 isn't installed; both expose the same
+# compile/search/finditer API for these patterns.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# Content-addressable result cache: LLM retry loops revalidate reports
+# that often haven't changed between iterations, so identical
+# (content, criteria) pairs return the previously formatted result
+# instead of rerunning every scan. Keyed by content digest plus the
+# criteria fields; a small LRU window covers one retry loop.
+_VALIDATION_CACHE: "OrderedDict[Tuple[bytes, tuple], str]" = OrderedDict()
+_VALIDATION_CACHE_MAX = 5
+
+# Literal placeholder markers as (lowercase needle, reported form) pairs:
+# presence-only checks on pure literals are faster through str.__contains__
+# (a C-level two-way matcher) over one shared lowercase copy than through
+# the regex engine.
+@lru_cache(maxsize=32)
+def _count_words(text: str) -> int:
+    """Memoized word count for recurring section strings.
+
+    Module scope keeps ``self`` out of the cache key. Retry loops
+    revalidate reports whose sections rarely change between iterations,
+    so repeat counts collapse to a dict hit instead of re-splitting the
+    same multi-KB content.
+    """
+    return len(text.split())
+
+
+_PLACEHOLDER_LITERALS = tuple(
+    (literal.lower(), literal)
+    for literal in ("TODO", "TBD", "PLACEHOLDER", "[INSERT", "EXAMPLE", "https://example.com")
+)
+
+# Generic placeholder patterns: example URLs, Estonian and English
+# bracketed placeholders, generic descriptions. Kept as name → source so
+# issue messages can still cite the original pattern; the alternation
+# built from them scans the content once and lastgroup identifies which
+# alternative hit.
+_PLACEHOLDER_PATTERN_SOURCES = {
+    "example_url": r'https://example\.com/[^)\s]*',
+    "estonian_placeholder": r'\[.*finantstulemused.*\]',
+    "english_placeholder": r'\[.*financial.*results.*\]',
+    "generic_financial": r'Latest financial results and performance metrics for',
+    "generic_strategic": r'Strategic initiatives and market positioning for',
+}
+
+# The formatting, citation, and quality passes are independent read-only
+# scans of the same string, and re releases the GIL during C-level
+# matching, so long reports run them on a small shared pool. Created
+# lazily (like the patterns) and only used above the length threshold —
+# thread handoff costs more than a short scan.
+_CHECK_POOL: Optional[ThreadPoolExecutor] = None
+_PARALLEL_MIN_CHARS = 8192
+
+
+def _get_check_pool() -> ThreadPoolExecutor:
+    """Return the shared check-pass thread pool, creating it on first use."""
+    global _CHECK_POOL
+    if _CHECK_POOL is None:
+        _CHECK_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="report-validation")
+    return _CHECK_POOL
+
+
+# The validator's patterns, bound as module Pattern objects on first use.
+# Compiling lazily keeps them off the import path: the crew (and its
+# tests) import this module transitively even when no report is ever
+# validated. Binding the compiled objects directly still avoids the
+# re-module cache probe (pattern + flags hash) on every call.
+_PATTERNS_READY = False
+_HEADER_RE = None
+_HEADER_FINDER = None
+_BOLD_RE = None
+_LIST_RE = None
+_SENTENCE_RE = None
+_SENTENCE_SPLIT_RE = None
+_QUANT_RE = None
+_CITATION_RE = None
+_PLACEHOLDER_ALT_RE = None
+
+
+def _compile_patterns() -> None:
+    """Compile the validator's regex patterns once, on first use."""
+    global _PATTERNS_READY, _HEADER_RE, _HEADER_FINDER, _BOLD_RE, _LIST_RE, \
+        _SENTENCE_RE, _SENTENCE_SPLIT_RE, _QUANT_RE, _CITATION_RE, \
+        _PLACEHOLDER_ALT_RE
+
+    if _PATTERNS_READY:
+        return
+
+    _HEADER_RE = _re_engine.compile(r'^(#+)\s+(.+)$', re.MULTILINE)
+    # Section extraction accepts headers without a space after the hashes
+    # (mirroring the old startswith('#') check), hence the separate pattern.
+    _HEADER_FINDER = _re_engine.compile(r'^#+\s*(.+?)\s*$', re.MULTILINE)
+    _BOLD_RE = _re_engine.compile(r'\*\*[^*]+\*\*')
+    _LIST_RE = _re_engine.compile(r'^\s*[-*+]', re.MULTILINE)
+    _SENTENCE_RE = _re_engine.compile(r'[.!?]')
+    _SENTENCE_SPLIT_RE = _re_engine.compile(r'[.!?]+')
+    _QUANT_RE = _re_engine.compile(r'\d+%|\$\d+|\d+\.\d+|\d{4}')
+
+    # Common citation patterns — markdown links, source references,
+    # attribution phrases, years (basic date check) — unioned into one
+    # alternation: the check only needs "any citation present", so a
+    # single pass over the content replaces four independent scans.
+    _CITATION_RE = _re_engine.compile(
+        r'\[.*\]\(http.*\)|Source:|According to|\d{4}',
+        re.IGNORECASE,
+    )
+
+    _PLACEHOLDER_ALT_RE = _re_engine.compile(
+        "|".join(f"(?P<{name}>{source})" for name, source in _PLACEHOLDER_PATTERN_SOURCES.items()),
+        re.IGNORECASE,
+    )
+
+    _PATTERNS_READY = True
+
 
 class ValidationCriteria(BaseModel):
     """Model for report validation criteria."""
+    # Frozen: criteria never change after parsing, which makes sharing the
+    # default instance below safe and the model hashable.
+    model_config = ConfigDict(frozen=True)
+
     min_word_count: int = Field(default=500, description="Minimum word count for the report")
     max_word_count: int = Field(default=3000, description="Maximum word count for the report")
     required_sections: List[str] = Field(
@@ -30,6 +162,8 @@ class ValidationCriteria(BaseModel):
 
 class ValidationResult(BaseModel):
     """Model for validation results."""
+    model_config = ConfigDict(frozen=True)
+
     is_valid: bool = Field(..., description="Whether the report passes validation")
     score: float = Field(..., description="Overall quality score (0-100)")
     word_count: int = Field(..., description="Total word count")
@@ -38,6 +172,12 @@ class ValidationResult(BaseModel):
     section_analysis: Dict[str, Any] = Field(default={}, description="Analysis of each section")
 
 
+# Shared default criteria: the common path supplies no custom criteria,
+# and the model is frozen, so every such call reuses one instance instead
+# of re-running field validation.
+_DEFAULT_CRITERIA = ValidationCriteria()
+
+
 class ReportValidationTool(BaseTool):
     """
     Advanced report validation tool for competitive analysis reports.
@@ -70,20 +210,66 @@ class ReportValidationTool(BaseTool):
             
             # Parse custom criteria if provided
             validation_criteria = self._parse_criteria(criteria)
-            
+
+            cache_key = (
+                hashlib.sha256(report_content.encode("utf-8")).digest(),
+                (
+                    validation_criteria.min_word_count,
+                    validation_criteria.max_word_count,
+                    tuple(validation_criteria.required_sections),
+                    validation_criteria.min_section_length,
+                    validation_criteria.check_citations,
+                    validation_criteria.check_formatting,
+                ),
+            )
+            cached = _VALIDATION_CACHE.get(cache_key)
+            if cached is not None:
+                _VALIDATION_CACHE.move_to_end(cache_key)
+                return cached
+
             # Perform comprehensive validation
             validation_result = self._validate_report(report_content, validation_criteria)
-            
-            logger.info("Report validation completed", 
-                       score=validation_result.score, 
+
+            logger.info("Report validation completed",
+                       score=validation_result.score,
                        is_valid=validation_result.is_valid)
-            
-            return self._format_validation_results(validation_result)
+
+            formatted = self._format_validation_results(validation_result)
+
+            _VALIDATION_CACHE[cache_key] = formatted
+            if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAX:
+                _VALIDATION_CACHE.popitem(last=False)
+
+            return formatted
             
         except Exception as e:
             logger.error("Error in report validation", error=str(e))
             return f"Error validating report: {str(e)}"
     
+    def _run_batch(self, reports: List[str], criteria: Optional[str] = None) -> List[str]:
+        """
+        Validate several reports in one call; preferred over looping _run
+        from programmatic callers.
+
+        Four or more reports are validated concurrently on a thread pool —
+        the regex scans release the GIL, so candidate drafts from one crew
+        run overlap in wall time. Smaller batches run sequentially, where
+        thread handoff would cost more than the validations.
+
+        Args:
+            reports: Report contents to validate
+            criteria: Optional JSON string with custom validation criteria,
+                applied to every report
+
+        Returns:
+            List[str]: One formatted validation report per input, in order
+        """
+        if len(reports) >= 4:
+            with ThreadPoolExecutor(max_workers=min(len(reports), os.cpu_count() or 1)) as executor:
+                return list(executor.map(lambda report: self._run(report, criteria), reports))
+
+        return [self._run(report, criteria) for report in reports]
+
     def _parse_criteria(self, criteria: Optional[str]) -> ValidationCriteria:
         """
         Parse validation criteria from JSON string or use defaults.
@@ -96,13 +282,13 @@ class ReportValidationTool(BaseTool):
         """
         if criteria:
             try:
-                import json
-                criteria_dict = json.loads(criteria)
-                return ValidationCriteria(**criteria_dict)
+                # pydantic-core parses and validates the JSON in one pass,
+                # skipping the intermediate json.loads dict entirely.
+                return ValidationCriteria.model_validate_json(criteria)
             except Exception as e:
                 logger.warning("Failed to parse custom criteria, using defaults", error=str(e))
-        
-        return ValidationCriteria()
+
+        return _DEFAULT_CRITERIA
     
     def _validate_report(self, content: str, criteria: ValidationCriteria) -> ValidationResult:
         """
@@ -119,49 +305,90 @@ class ReportValidationTool(BaseTool):
         recommendations = []
         section_analysis = {}
         
-        # 1. Word count validation
-        word_count = len(content.split())
+        # 1. Word count validation (tokenize once; the lowercase word list
+        # is shared with the content-quality checks instead of being
+        # re-split there)
+        lowered = content.lower()
+        words = lowered.split()
+        word_count = len(words)
         if word_count < criteria.min_word_count:
             issues.append(f"Report is too short: {word_count} words (minimum: {criteria.min_word_count})")
             recommendations.append(f"Expand content to reach at least {criteria.min_word_count} words")
         elif word_count > criteria.max_word_count:
             issues.append(f"Report is too long: {word_count} words (maximum: {criteria.max_word_count})")
             recommendations.append(f"Condense content to stay under {criteria.max_word_count} words")
-        
+
+        # Fast path: a report under a quarter of the minimum length fails
+        # regardless of structure, citations, or formatting, so skip the
+        # section extraction and regex passes and fail on length alone.
+        if word_count < criteria.min_word_count // 4:
+            return ValidationResult(
+                is_valid=False,
+                score=self._calculate_quality_score(word_count, criteria, len(issues), {}),
+                word_count=word_count,
+                issues=issues,
+                recommendations=recommendations,
+                section_analysis={}
+            )
+
         # 2. Section structure validation
         sections = self._extract_sections(content)
         section_analysis = self._analyze_sections(sections, criteria)
         
+        missing_count = 0
         for section_name in criteria.required_sections:
-            if section_name not in sections:
+            # _analyze_sections already counted each section's words;
+            # reuse that instead of re-splitting the section content.
+            section_stats = section_analysis.get(section_name)
+            if section_stats is None:
+                missing_count += 1
                 issues.append(f"Missing required section: {section_name}")
                 recommendations.append(f"Add a comprehensive {section_name} section")
-            elif len(sections[section_name].split()) < criteria.min_section_length:
-                issues.append(f"Section '{section_name}' is too short: {len(sections[section_name].split())} words")
+                continue
+            section_word_count = section_stats["word_count"]
+            if section_word_count < criteria.min_section_length:
+                issues.append(f"Section '{section_name}' is too short: {section_word_count} words")
                 recommendations.append(f"Expand the {section_name} section with more detailed content")
         
-        # 3. Formatting validation
-        if criteria.check_formatting:
-            formatting_issues = self._check_formatting(content)
-            issues.extend(formatting_issues)
-            if formatting_issues:
-                recommendations.append("Improve markdown formatting and structure")
-        
-        # 4. Citation validation
-        if criteria.check_citations:
-            citation_issues = self._check_citations(content)
-            issues.extend(citation_issues)
-            if citation_issues:
-                recommendations.append("Add proper citations and source references")
-        
-        # 5. Content quality checks
-        quality_issues = self._check_content_quality(content)
+        # 3-5. Formatting, citation, and content-quality checks: three
+        # independent read-only passes. Long reports overlap them on the
+        # shared pool; short ones run inline where thread handoff would
+        # cost more than the scans.
+        formatting_issues: List[str] = []
+        citation_issues: List[str] = []
+        if len(content) >= _PARALLEL_MIN_CHARS:
+            pool = _get_check_pool()
+            formatting_future = pool.submit(self._check_formatting, content, sections,
+                                            section_analysis) if criteria.check_formatting else None
+            citation_future = pool.submit(self._check_citations, content) if criteria.check_citations else None
+            quality_future = pool.submit(self._check_content_quality, content, words, lowered)
+            if formatting_future is not None:
+                formatting_issues = formatting_future.result()
+            if citation_future is not None:
+                citation_issues = citation_future.result()
+            quality_issues = quality_future.result()
+        else:
+            if criteria.check_formatting:
+                formatting_issues = self._check_formatting(content, sections, section_analysis)
+            if criteria.check_citations:
+                citation_issues = self._check_citations(content)
+            quality_issues = self._check_content_quality(content, words=words, lowered=lowered)
+
+        issues.extend(formatting_issues)
+        if formatting_issues:
+            recommendations.append("Improve markdown formatting and structure")
+
+        issues.extend(citation_issues)
+        if citation_issues:
+            recommendations.append("Add proper citations and source references")
+
         issues.extend(quality_issues)
         if quality_issues:
             recommendations.append("Improve content quality and professional presentation")
         
         # Calculate overall score
-        score = self._calculate_quality_score(word_count, criteria, len(issues), sections)
+        score = self._calculate_quality_score(word_count, criteria, len(issues), sections,
+                                              missing_count=missing_count)
         
         return ValidationResult(
             is_valid=len(issues) == 0,
@@ -182,30 +409,21 @@ class ReportValidationTool(BaseTool):
         Returns:
             Dict[str, str]: Dictionary mapping section names to content
         """
+        # One multiline regex pass locates every header; section bodies are
+        # then direct slices of the original string between consecutive
+        # headers. This keeps the scan in the C regex engine instead of a
+        # Python loop over every line with list append/join churn.
+        if not _PATTERNS_READY:
+            _compile_patterns()
+
+        matches = list(_HEADER_FINDER.finditer(content))
+
         sections = {}
-        current_section = None
-        current_content = []
-        
-        lines = content.split('\n')
-        
-        for line in lines:
-            # Check for markdown headers
-            if line.startswith('#'):
-                # Save previous section
-                if current_section:
-                    sections[current_section] = '\n'.join(current_content).strip()
-                
-                # Start new section
-                current_section = line.lstrip('#').strip()
-                current_content = []
-            else:
-                if current_section:
-                    current_content.append(line)
-        
-        # Save last section
-        if current_section:
-            sections[current_section] = '\n'.join(current_content).strip()
-        
+        for match, next_match in zip(matches, matches[1:]):
+            sections[match.group(1)] = content[match.end():next_match.start()].strip()
+        if matches:
+            sections[matches[-1].group(1)] = content[matches[-1].end():].strip()
+
         return sections
     
     def _analyze_sections(self, sections: Dict[str, str], criteria: ValidationCriteria) -> Dict[str, Any]:
@@ -219,45 +437,65 @@ class ReportValidationTool(BaseTool):
         Returns:
             Dict[str, Any]: Analysis results for each section
         """
+        if not _PATTERNS_READY:
+            _compile_patterns()
+
         analysis = {}
         
         for section_name, content in sections.items():
-            word_count = len(content.split())
+            word_count = _count_words(content)
             analysis[section_name] = {
                 "word_count": word_count,
                 "meets_minimum": word_count >= criteria.min_section_length,
-                "has_structure": bool(re.search(r'[.!?]', content)),  # Has sentences
-                "has_lists": bool(re.search(r'^\s*[-*+]', content, re.MULTILINE)),  # Has bullet points
+                "has_structure": bool(_SENTENCE_RE.search(content)),  # Has sentences
+                "has_lists": bool(_LIST_RE.search(content)),  # Has bullet points
                 "quality_score": min(100, (word_count / criteria.min_section_length) * 100)
             }
         
         return analysis
     
-    def _check_formatting(self, content: str) -> List[str]:
+    def _check_formatting(self, content: str, sections: Optional[Dict[str, str]] = None,
+                          section_analysis: Optional[Dict[str, Any]] = None) -> List[str]:
         """
         Check markdown formatting quality.
-        
+
         Args:
             content: Content to check
-            
+            sections: Optional extracted sections; when provided, the
+                header presence check reuses them instead of re-scanning
+            section_analysis: Optional per-section analysis; when
+                provided, the bullet-point check aggregates its has_lists
+                flags instead of re-scanning
+
         Returns:
             List[str]: List of formatting issues
         """
+        if not _PATTERNS_READY:
+            _compile_patterns()
+
         issues = []
-        
-        # Check for proper header hierarchy
-        headers = re.findall(r'^(#+)\s+(.+)$', content, re.MULTILINE)
-        if not headers:
+
+        # Check for proper header hierarchy (the extracted sections, when
+        # available, already answer this without another content scan)
+        if sections is not None:
+            has_headers = bool(sections)
+        else:
+            has_headers = bool(_HEADER_RE.search(content))
+        if not has_headers:
             issues.append("No markdown headers found - report lacks structure")
-        
+
         # Check for consistent formatting
-        if not re.search(r'\*\*[^*]+\*\*', content):  # Bold text
+        if not _BOLD_RE.search(content):  # Bold text
             issues.append("No bold text formatting found - consider emphasizing key points")
-        
+
         # Check for lists
-        if not re.search(r'^\s*[-*+]', content, re.MULTILINE):
+        if section_analysis is not None:
+            has_lists = any(stats["has_lists"] for stats in section_analysis.values())
+        else:
+            has_lists = bool(_LIST_RE.search(content))
+        if not has_lists:
             issues.append("No bullet points found - consider using lists for better readability")
-        
+
         return issues
     
     def _check_citations(self, content: str) -> List[str]:
@@ -270,82 +508,112 @@ class ReportValidationTool(BaseTool):
         Returns:
             List[str]: List of citation issues
         """
+        if not _PATTERNS_READY:
+            _compile_patterns()
+
         issues = []
         
-        # Look for common citation patterns
-        citation_patterns = [
-            r'\[.*\]\(http.*\)',  # Markdown links
-            r'Source:',  # Source references
-            r'According to',  # Attribution phrases
-            r'\d{4}',  # Years (basic date check)
-        ]
-        
-        has_citations = any(re.search(pattern, content, re.IGNORECASE) for pattern in citation_patterns)
-        
-        if not has_citations:
+        # Look for common citation patterns (one combined pass)
+        if not _CITATION_RE.search(content):
             issues.append("No citations or source references found")
         
         return issues
     
-    def _check_content_quality(self, content: str) -> List[str]:
+    def _check_content_quality(self, content: str, words: Optional[List[str]] = None,
+                               lowered: Optional[str] = None) -> List[str]:
         """
         Check general content quality indicators.
-        
+
         Args:
             content: Content to check
-            
+            words: Optional pre-tokenized lowercase word list; computed
+                from content when omitted
+            lowered: Optional precomputed lowercase copy of content;
+                computed when omitted
+
         Returns:
             List[str]: List of quality issues
         """
+        if not _PATTERNS_READY:
+            _compile_patterns()
+
         issues = []
         
-        # Check for placeholder text and URLs
-        placeholders = ['TODO', 'TBD', 'PLACEHOLDER', '[INSERT', 'EXAMPLE', 'https://example.com']
-        for placeholder in placeholders:
-            if placeholder.lower() in content.lower():
-                issues.append(f"Contains placeholder text or URLs: {placeholder}")
-        
-        # Check for generic placeholder patterns
-        placeholder_patterns = [
-            r'https://example\.com/[^)\s]*',  # Example URLs
-            r'\[.*finantstulemused.*\]',  # Estonian placeholder patterns
-            r'\[.*financial.*results.*\]',  # English placeholder patterns
-            r'Latest financial results and performance metrics for',  # Generic descriptions
-            r'Strategic initiatives and market positioning for',  # Generic descriptions
-        ]
-        
-        for pattern in placeholder_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                issues.append(f"Contains generic placeholder content matching pattern: {pattern}")
-        
-        # Check for very short sentences (potential quality issue)
-        sentences = re.split(r'[.!?]+', content)
-        short_sentences = [s.strip() for s in sentences if 0 < len(s.strip().split()) < 3]
-        if len(short_sentences) > 5:
+        # Check for placeholder text and URLs: plain substring probes over
+        # one shared lowercase copy of the content.
+        if lowered is None:
+            lowered = content.lower()
+        for needle, literal in _PLACEHOLDER_LITERALS:
+            if needle in lowered:
+                issues.append(f"Contains placeholder text or URLs: {literal}")
+        
+        # Check for generic placeholder patterns: one scan over the
+        # content, then report each distinct alternative that matched in
+        # the original pattern order.
+        matched = {m.lastgroup for m in _PLACEHOLDER_ALT_RE.finditer(content)}
+        if matched:
+            for name, source in _PLACEHOLDER_PATTERN_SOURCES.items():
+                if name in matched:
+                    issues.append(f"Contains generic placeholder content matching pattern: {source}")
+
+        # Check for very short sentences (potential quality issue).
+        # Walk the sentence boundaries with finditer instead of
+        # materializing a split list, count words with split() (any
+        # whitespace, so line-wrapped sentences aren't misjudged), and
+        # stop as soon as the threshold is crossed.
+        short_count = 0
+        prev = 0
+        for match in _SENTENCE_SPLIT_RE.finditer(content):
+            sentence = content[prev:match.start()].strip()
+            prev = match.end()
+            if sentence and len(sentence.split()) < 3:
+                short_count += 1
+                if short_count > 5:
+                    break
+        else:
+            tail = content[prev:].strip()
+            if tail and len(tail.split()) < 3:
+                short_count += 1
+        if short_count > 5:
             issues.append("Contains many very short sentences - consider improving flow")
         
-        # Check for repetitive content
-        words = content.lower().split()
-        if len(words) > 0 and len(set(words)) / len(words) < 0.3:  # Less than 30% unique words
-            issues.append("Content appears repetitive - consider varying language")
+        # Check for repetitive content: stream words into the set and stop
+        # as soon as enough distinct ones are seen to clear the 30%
+        # uniqueness bar — non-repetitive reports (the common case) exit
+        # after a fraction of the words instead of deduplicating them all.
+        if words is None:
+            words = content.lower().split()
+        if words:
+            unique_needed = math.ceil(0.3 * len(words))
+            seen: set = set()
+            add = seen.add
+            for word in words:
+                add(word)
+                if len(seen) >= unique_needed:
+                    break
+            else:
+                issues.append("Content appears repetitive - consider varying language")
         
         # Check for lack of specific data
-        if not re.search(r'\d+%|\$\d+|\d+\.\d+|\d{4}', content):
+        if not _QUANT_RE.search(content):
             issues.append("Report lacks specific quantitative data - consider adding metrics, percentages, or dates")
         
         return issues
     
-    def _calculate_quality_score(self, word_count: int, criteria: ValidationCriteria, 
-                                issue_count: int, sections: Dict[str, str]) -> float:
+    def _calculate_quality_score(self, word_count: int, criteria: ValidationCriteria,
+                                issue_count: int, sections: Dict[str, str],
+                                missing_count: Optional[int] = None) -> float:
         """
         Calculate overall quality score.
-        
+
         Args:
             word_count: Total word count
             criteria: Validation criteria
             issue_count: Number of issues found
             sections: Section content
-            
+            missing_count: Optional precounted number of missing required
+                sections; derived from sections when omitted
+
         Returns:
             float: Quality score (0-100)
         """
@@ -357,9 +625,11 @@ class ReportValidationTool(BaseTool):
         elif word_count > criteria.max_word_count:
             score -= 10
         
-        # Deduct points for missing sections
-        missing_sections = len([s for s in criteria.required_sections if s not in sections])
-        score -= missing_sections * 15
+        # Deduct points for missing sections (recounted only when the
+        # caller didn't already walk the required list)
+        if missing_count is None:
+            missing_count = sum(1 for s in criteria.required_sections if s not in sections)
+        score -= missing_count * 15
         
         # Deduct points for issues
         score -= issue_count * 5
@@ -380,51 +650,58 @@ class ReportValidationTool(BaseTool):
         Returns:
             str: Formatted validation report
         """
-        output = []
-        
+        # Write straight into one growable buffer with multi-line blocks
+        # instead of dozens of list appends and a final join.
+        buf = io.StringIO()
+        write = buf.write
+
         # Header
         status = "✅ PASSED" if result.is_valid else "❌ FAILED"
-        output.append(f"# Report Validation Results: {status}")
-        output.append(f"**Overall Score:** {result.score:.1f}/100")
-        output.append(f"**Word Count:** {result.word_count}")
-        output.append("")
-        
+        write(
+            f"# Report Validation Results: {status}\n"
+            f"**Overall Score:** {result.score:.1f}/100\n"
+            f"**Word Count:** {result.word_count}\n"
+            "\n"
+        )
+
         # Issues
         if result.issues:
-            output.append("## Issues Found")
-            for i, issue in enumerate(result.issues, 1):
-                output.append(f"{i}. {issue}")
-            output.append("")
-        
+            write("## Issues Found\n")
+            write("\n".join(f"{i}. {issue}" for i, issue in enumerate(result.issues, 1)))
+            write("\n\n")
+
         # Recommendations
         if result.recommendations:
-            output.append("## Recommendations")
-            for i, rec in enumerate(result.recommendations, 1):
-                output.append(f"{i}. {rec}")
-            output.append("")
-        
+            write("## Recommendations\n")
+            write("\n".join(f"{i}. {rec}" for i, rec in enumerate(result.recommendations, 1)))
+            write("\n\n")
+
         # Section Analysis
         if result.section_analysis:
-            output.append("## Section Analysis")
+            write("## Section Analysis\n")
             for section, analysis in result.section_analysis.items():
                 status_icon = "✅" if analysis["meets_minimum"] else "⚠️"
-                output.append(f"### {status_icon} {section}")
-                output.append(f"- Word Count: {analysis['word_count']}")
-                output.append(f"- Quality Score: {analysis['quality_score']:.1f}/100")
-                output.append(f"- Has Structure: {'Yes' if analysis['has_structure'] else 'No'}")
-                output.append("")
-        
+                write(
+                    f"### {status_icon} {section}\n"
+                    f"- Word Count: {analysis['word_count']}\n"
+                    f"- Quality Score: {analysis['quality_score']:.1f}/100\n"
+                    f"- Has Structure: {'Yes' if analysis['has_structure'] else 'No'}\n"
+                    "\n"
+                )
+
         # Summary
         if result.is_valid:
-            output.append("## Summary")
-            output.append("✅ Report meets all validation criteria and is ready for delivery.")
+            write(
+                "## Summary\n"
+                "✅ Report meets all validation criteria and is ready for delivery.\n"
+            )
         else:
-            output.append("## Summary")
-            output.append("❌ Report requires improvements before it meets quality standards.")
-            output.append("Please address the issues and recommendations listed above.")
-        
-        output.append("")
-        output.append("---")
-        output.append("*Validation performed by Report Quality Validator*")
-        
-        return "\n".join(output)
\ No newline at end of file
+            write(
+                "## Summary\n"
+                "❌ Report requires improvements before it meets quality standards.\n"
+                "Please address the issues and recommendations listed above.\n"
+            )
+
+        write("\n---\n*Validation performed by Report Quality Validator*")
+
+        return buf.getvalue()
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""Shared pytest fixtures for the Competitive Analysis Crew test suite."""
+
+import logging
+
+import pytest
+import structlog
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _silence_structlog():
+    """Silence structlog for the whole test session.
+
+    The tools log on every call; with a CRITICAL filtering bound logger
+    everything below that resolves to a no-op method, so tests skip all
+    processor and rendering work without per-test @patch boilerplate.
+    """
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL)
+    )
+    yield
+    structlog.reset_defaults()
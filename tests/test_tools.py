@@ -8,29 +8,200 @@ This module contains comprehensive unit tests for all custom tools:
 """
 
 import pytest
-import json
-from unittest.mock import patch, MagicMock
+import sys
+from functools import lru_cache
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from Competitive_analysis_crew.tools.competitive_search import CompetitiveSearchTool, SearchQuery
-from Competitive_analysis_crew.tools.market_analysis import MarketAnalysisTool, MarketAnalysisRequest, CompanyInsight
+from Competitive_analysis_crew.tools.market_analysis import (
+    MarketAnalysis,
+    MarketAnalysisTool,
+    MarketAnalysisRequest,
+    CompanyInsight,
+)
 from Competitive_analysis_crew.tools.report_validation import ReportValidationTool, ValidationCriteria, ValidationResult
 
+# Sample reports shared by the validation tests. Module constants are
+# built once at import instead of re-assembled in per-test setup, and
+# interned so repeat lookups in the tool's memoized helpers hash the
+# same string object.
+VALID_REPORT = sys.intern("""
+# Executive Summary
+This is a comprehensive competitive analysis report that provides detailed insights into the market landscape and competitive positioning.
+
+## Analysis
+The market analysis reveals significant opportunities for growth and competitive advantage through strategic positioning and innovation.
+
+### Market Trends
+- Digital transformation acceleration
+- Increased focus on customer experience
+- Growing emphasis on sustainability
+
+## Recommendations
+Based on our analysis, we recommend the following strategic initiatives:
+1. Invest in digital capabilities
+2. Enhance customer experience programs
+3. Develop sustainable business practices
+
+## Conclusion
+The competitive landscape presents both challenges and opportunities for strategic growth.
+""")
+
+INVALID_REPORT = sys.intern("""
+# Short Report
+This is too short.
+""")
+
+# Pre-serialized criteria payload: the test exercises JSON *parsing*, so
+# there is no need to re-encode the dict on every run.
+CUSTOM_CRITERIA_JSON = '{"min_word_count": 300, "required_sections": ["Summary", "Analysis"]}'
+
+
+
+@lru_cache(maxsize=None)
+def _mk_criteria(min_word_count=500, max_word_count=3000, required_sections=None):
+    """Memoized ValidationCriteria constructor.
+
+    The model is frozen, so instances are safe to share; passing sections
+    as a tuple keeps the arguments hashable and repeat constructions
+    collapse to a cache hit instead of re-running pydantic validation.
+    """
+    kwargs = {"min_word_count": min_word_count, "max_word_count": max_word_count}
+    if required_sections is not None:
+        kwargs["required_sections"] = list(required_sections)
+    return ValidationCriteria(**kwargs)
+
+
+@pytest.fixture(scope="module")
+def default_criteria():
+    """Default ValidationCriteria, built once per module."""
+    return ValidationCriteria()
+
+
+@pytest.fixture(scope="session")
+def lowered():
+    """Factory pairing a tool output with its lowercase form.
+
+    Assertions that mix exact and case-insensitive substring checks can
+    scan `.lower` without re-lowercasing a multi-KB report per check.
+    """
+    def _lowered(text):
+        return SimpleNamespace(text=text, lower=text.lower())
+
+    return _lowered
+
+
+@pytest.fixture(scope="module")
+def precompiled_validation_patterns():
+    """Guard that the validation regexes are compiled once and reused.
+
+    The tool compiles its patterns lazily on first use; after a priming
+    call, repeated helper invocations must hit the same compiled objects
+    rather than recompiling per call.
+    """
+    from Competitive_analysis_crew.tools import report_validation
+
+    tool = ReportValidationTool()
+    tool._extract_sections(VALID_REPORT)  # primes _compile_patterns()
+    first = (
+        report_validation._HEADER_FINDER,
+        report_validation._BOLD_RE,
+        report_validation._LIST_RE,
+        report_validation._CITATION_RE,
+    )
+    tool._check_formatting(VALID_REPORT)
+    tool._check_citations(VALID_REPORT)
+    second = (
+        report_validation._HEADER_FINDER,
+        report_validation._BOLD_RE,
+        report_validation._LIST_RE,
+        report_validation._CITATION_RE,
+    )
+    assert all(a is b for a, b in zip(first, second))
+    return second
+
+
+@pytest.fixture(scope="module")
+def parsed_valid_sections():
+    """Sections extracted from VALID_REPORT, parsed once per module."""
+    return ReportValidationTool()._extract_sections(VALID_REPORT)
+
+
+@pytest.fixture(scope="module")
+def mock_market_analysis():
+    """Canned MarketAnalysis used by the formatting tests, built once."""
+    return MarketAnalysis(
+        industry="technology",
+        analysis_date="2024-01-01",
+        market_overview="Test overview",
+        key_trends=["Trend 1", "Trend 2"],
+        competitive_dynamics="Test dynamics",
+        company_insights=[
+            CompanyInsight(
+                name="TestCorp",
+                market_position="Strong position",
+                strengths=["Innovation"],
+                weaknesses=["Scale"],
+                recent_developments=["Development 1"],
+                competitive_advantages=["Advantage 1"]
+            )
+        ],
+        opportunities=["Opportunity 1"],
+        threats=["Threat 1"],
+        market_outlook="Positive outlook"
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_validation_result():
+    """Canned ValidationResult used by the formatting tests, built once."""
+    return ValidationResult(
+        is_valid=True,
+        score=85.5,
+        word_count=750,
+        issues=["Minor issue"],
+        recommendations=["Improve formatting"],
+        section_analysis={
+            "Executive Summary": {
+                "word_count": 100,
+                "meets_minimum": True,
+                "has_structure": True,
+                "quality_score": 90.0
+            }
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def valid_validation_result():
+    """Full validation of VALID_REPORT, run once per module."""
+    criteria = _mk_criteria(
+        min_word_count=50,  # Lower threshold for test
+        required_sections=("Executive Summary", "Analysis")
+    )
+    return ReportValidationTool()._validate_report(VALID_REPORT, criteria)
+
 
 class TestCompetitiveSearchTool:
     """Test cases for CompetitiveSearchTool."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.tool = CompetitiveSearchTool()
+    @staticmethod
+    @pytest.fixture(scope="class")
+    def tool():
+        """Single tool instance shared across the class — the tool is
+        stateless, so per-test construction only re-runs pydantic model
+        setup."""
+        return CompetitiveSearchTool()
     
-    def test_tool_initialization(self):
+    def test_tool_initialization(self, tool):
         """Test that the tool initializes correctly."""
-        assert self.tool.name == "Competitive Intelligence Search"
-        assert "competitive analysis research" in self.tool.description.lower()
+        assert tool.name == "Competitive Intelligence Search"
+        assert "competitive analysis research" in tool.description.lower()
     
-    def test_basic_search_execution(self):
+    def test_basic_search_execution(self, tool):
         """Test basic search functionality."""
-        result = self.tool._run(
+        result = tool._run(
             query="financial performance",
             company="TechCorp",
             focus_area="financial"
@@ -41,9 +212,9 @@ class TestCompetitiveSearchTool:
         assert "Financial Performance" in result
         assert "Competitive Intelligence Search Results" in result
     
-    def test_search_without_company(self):
+    def test_search_without_company(self, tool):
         """Test search functionality without specific company."""
-        result = self.tool._run(
+        result = tool._run(
             query="market trends",
             company="",
             focus_area="market"
@@ -53,9 +224,9 @@ class TestCompetitiveSearchTool:
         assert "Market" in result
         assert "Industry Market Analysis" in result
     
-    def test_build_competitive_query(self):
+    def test_build_competitive_query(self, tool):
         """Test query enhancement functionality."""
-        enhanced_query = self.tool._build_competitive_query(
+        enhanced_query = tool._build_competitive_query(
             query="performance analysis",
             company="TestCorp",
             focus_area="financial"
@@ -65,9 +236,9 @@ class TestCompetitiveSearchTool:
         assert "performance analysis" in enhanced_query
         assert any(term in enhanced_query for term in ["revenue", "earnings"])
     
-    def test_generate_realistic_results(self):
+    def test_generate_realistic_results(self, tool):
         """Test realistic result generation."""
-        results = self.tool._generate_realistic_results("TechCorp", "financial")
+        results = tool._generate_realistic_results("TechCorp", "financial")
         
         assert isinstance(results, list)
         assert len(results) > 0
@@ -78,20 +249,20 @@ class TestCompetitiveSearchTool:
             assert "relevance_score" in result
             assert "TechCorp" in result["title"]
     
-    def test_different_focus_areas(self):
+    @pytest.mark.parametrize(
+        "focus_area", ["financial", "products", "strategy", "market", "general"]
+    )
+    def test_different_focus_areas(self, tool, focus_area):
         """Test search with different focus areas."""
-        focus_areas = ["financial", "products", "strategy", "market", "general"]
-        
-        for focus_area in focus_areas:
-            result = self.tool._run(
-                query="analysis",
-                company="TestCorp",
-                focus_area=focus_area
-            )
-            assert isinstance(result, str)
-            assert focus_area.title() in result
+        result = tool._run(
+            query="analysis",
+            company="TestCorp",
+            focus_area=focus_area
+        )
+        assert isinstance(result, str)
+        assert focus_area.title() in result
     
-    def test_format_competitive_results(self):
+    def test_format_competitive_results(self, tool):
         """Test result formatting functionality."""
         mock_results = {
             "company": "TestCorp",
@@ -114,79 +285,78 @@ class TestCompetitiveSearchTool:
             }
         }
         
-        formatted = self.tool._format_competitive_results(mock_results, "general")
+        formatted = tool._format_competitive_results(mock_results, "general")
         
         assert "TestCorp" in formatted
         assert "Test Result" in formatted
         assert "Strong position" in formatted
         assert "Innovation" in formatted
     
-    @patch('structlog.get_logger')
-    def test_error_handling(self, mock_logger):
+    def test_error_handling(self, tool):
         """Test error handling in search execution."""
-        # Mock logger to avoid actual logging during tests
-        mock_logger.return_value = MagicMock()
-        
         # Test with invalid input that might cause an error
-        with patch.object(self.tool, '_simulate_competitive_search', side_effect=Exception("Test error")):
-            result = self.tool._run("test query", "TestCorp", "general")
+        with patch.object(tool, '_simulate_competitive_search', side_effect=Exception("Test error")):
+            result = tool._run("test query", "TestCorp", "general")
             assert "Error performing competitive search" in result
 
 
 class TestMarketAnalysisTool:
     """Test cases for MarketAnalysisTool."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.tool = MarketAnalysisTool()
+    @staticmethod
+    @pytest.fixture(scope="class")
+    def tool():
+        """Single tool instance shared across the class."""
+        return MarketAnalysisTool()
     
-    def test_tool_initialization(self):
+    def test_tool_initialization(self, tool):
         """Test that the tool initializes correctly."""
-        assert self.tool.name == "Market Position Analyzer"
-        assert "market analysis" in self.tool.description.lower()
+        assert tool.name == "Market Position Analyzer"
+        assert "market analysis" in tool.description.lower()
     
-    def test_basic_market_analysis(self):
+    def test_basic_market_analysis(self, tool, lowered):
         """Test basic market analysis functionality."""
-        result = self.tool._run(
+        report = lowered(tool._run(
             companies="TechCorp, InnovaCorp",
             industry="technology",
             analysis_type="competitive_positioning"
-        )
-        
-        assert isinstance(result, str)
-        assert "Market Analysis Report" in result
-        assert "TechCorp" in result
-        assert "InnovaCorp" in result
-        assert "technology" in result.lower()
-    
-    def test_single_company_analysis(self):
+        ))
+
+        assert isinstance(report.text, str)
+        assert "Market Analysis Report" in report.text
+        assert "TechCorp" in report.text
+        assert "InnovaCorp" in report.text
+        assert "technology" in report.lower
+
+    def test_single_company_analysis(self, tool, lowered):
         """Test analysis with single company."""
-        result = self.tool._run(
+        report = lowered(tool._run(
             companies="SingleCorp",
             industry="finance",
             analysis_type="competitive_positioning"
-        )
-        
-        assert isinstance(result, str)
-        assert "SingleCorp" in result
-        assert "finance" in result.lower()
-    
-    def test_generate_industry_trends(self):
+        ))
+
+        assert isinstance(report.text, str)
+        assert "SingleCorp" in report.text
+        assert "finance" in report.lower
+
+    def test_generate_industry_trends(self, tool):
         """Test industry trend generation."""
         # Test known industry
-        tech_trends = self.tool._generate_industry_trends("technology")
+        tech_trends = tool._generate_industry_trends("technology")
+        lower_trends = [trend.lower() for trend in tech_trends]
         assert isinstance(tech_trends, list)
         assert len(tech_trends) > 0
-        assert any("digital transformation" in trend.lower() for trend in tech_trends)
+        assert any("digital transformation" in trend for trend in lower_trends)
         
         # Test unknown industry (should return default trends)
-        unknown_trends = self.tool._generate_industry_trends("unknown_industry")
+        unknown_trends = tool._generate_industry_trends("unknown_industry")
         assert isinstance(unknown_trends, list)
         assert len(unknown_trends) > 0
     
-    def test_analyze_company_position(self):
+    def test_analyze_company_position(self, tool):
         """Test individual company position analysis."""
-        insight = self.tool._analyze_company_position("TechCorp Inc", "technology")
+        insight = tool._analyze_company_position("TechCorp Inc", "technology")
         
         assert isinstance(insight, CompanyInsight)
         assert insight.name == "TechCorp Inc"
@@ -195,48 +365,45 @@ class TestMarketAnalysisTool:
         assert isinstance(insight.competitive_advantages, list)
         assert len(insight.strengths) > 0
     
-    def test_company_type_detection(self):
+    @pytest.mark.parametrize(
+        "company_name, expected_position",
+        [
+            ("BigCorp Inc", "market leader"),      # large corporation
+            ("TechSolutions", "innovator"),        # tech-focused company
+            ("Nordic Services", "regional"),       # regional company
+        ],
+    )
+    def test_company_type_detection(self, tool, company_name, expected_position):
         """Test company type detection in analysis."""
-        # Test large corporation
-        large_corp = self.tool._analyze_company_position("BigCorp Inc", "technology")
-        assert "market leader" in large_corp.market_position.lower()
-        
-        # Test tech-focused company
-        tech_company = self.tool._analyze_company_position("TechSolutions", "technology")
-        assert "innovator" in tech_company.market_position.lower()
-        
-        # Test regional company
-        regional_company = self.tool._analyze_company_position("Nordic Services", "technology")
-        assert "regional" in regional_company.market_position.lower()
-    
-    def test_analyze_competitive_dynamics(self):
+        insight = tool._analyze_company_position(company_name, "technology")
+        assert expected_position in insight.market_position.lower()
+    
+    @pytest.mark.parametrize(
+        "companies, expected_dynamics",
+        [
+            # High competition scenario
+            (["Corp1", "Corp2", "Corp3", "Corp4"], "intense competitive dynamics"),
+            # Moderate competition scenario
+            (["Corp1", "Corp2"], "balanced competitive dynamics"),
+        ],
+    )
+    def test_analyze_competitive_dynamics(self, tool, companies, expected_dynamics):
         """Test competitive dynamics analysis."""
-        # High competition scenario
-        high_comp = self.tool._analyze_competitive_dynamics(
-            ["Corp1", "Corp2", "Corp3", "Corp4"], "technology"
-        )
-        assert "intense competitive dynamics" in high_comp.lower()
-        
-        # Moderate competition scenario
-        mod_comp = self.tool._analyze_competitive_dynamics(
-            ["Corp1", "Corp2"], "technology"
-        )
-        assert "balanced competitive dynamics" in mod_comp.lower()
+        dynamics = tool._analyze_competitive_dynamics(companies, "technology")
+        assert expected_dynamics in dynamics.lower()
     
-    def test_identify_market_forces(self):
+    def test_identify_market_forces(self, tool):
         """Test market forces identification."""
-        opportunities, threats = self.tool._identify_market_forces("technology", ["Corp1", "Corp2"])
+        opportunities, threats = tool._identify_market_forces("technology", ["Corp1", "Corp2"])
         
         assert isinstance(opportunities, list)
         assert isinstance(threats, list)
         assert len(opportunities) > 0
         assert len(threats) > 0
     
-    def test_perform_market_analysis(self):
+    def test_perform_market_analysis(self, tool):
         """Test comprehensive market analysis."""
-        from Competitive_analysis_crew.tools.market_analysis import MarketAnalysis
-        
-        analysis = self.tool._perform_market_analysis(
+        analysis = tool._perform_market_analysis(
             ["TechCorp", "InnovaCorp"], "technology", "competitive_positioning"
         )
         
@@ -247,155 +414,102 @@ class TestMarketAnalysisTool:
         assert len(analysis.opportunities) > 0
         assert len(analysis.threats) > 0
     
-    def test_format_market_analysis(self):
+    def test_format_market_analysis(self, tool, mock_market_analysis):
         """Test market analysis formatting."""
-        from Competitive_analysis_crew.tools.market_analysis import MarketAnalysis, CompanyInsight
-        
-        mock_analysis = MarketAnalysis(
-            industry="technology",
-            analysis_date="2024-01-01",
-            market_overview="Test overview",
-            key_trends=["Trend 1", "Trend 2"],
-            competitive_dynamics="Test dynamics",
-            company_insights=[
-                CompanyInsight(
-                    name="TestCorp",
-                    market_position="Strong position",
-                    strengths=["Innovation"],
-                    weaknesses=["Scale"],
-                    recent_developments=["Development 1"],
-                    competitive_advantages=["Advantage 1"]
-                )
-            ],
-            opportunities=["Opportunity 1"],
-            threats=["Threat 1"],
-            market_outlook="Positive outlook"
-        )
-        
-        formatted = self.tool._format_market_analysis(mock_analysis)
-        
+        formatted = tool._format_market_analysis(mock_market_analysis)
+
         assert "Market Analysis Report: technology" in formatted
         assert "TestCorp" in formatted
         assert "Strong position" in formatted
         assert "Innovation" in formatted
     
-    @patch('structlog.get_logger')
-    def test_error_handling(self, mock_logger):
+    def test_error_handling(self, tool):
         """Test error handling in market analysis."""
-        mock_logger.return_value = MagicMock()
-        
         # Test with invalid input
-        with patch.object(self.tool, '_perform_market_analysis', side_effect=Exception("Test error")):
-            result = self.tool._run("TestCorp", "technology")
+        with patch.object(tool, '_perform_market_analysis', side_effect=Exception("Test error")):
+            result = tool._run("TestCorp", "technology")
             assert "Error performing market analysis" in result
 
 
 class TestReportValidationTool:
     """Test cases for ReportValidationTool."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.tool = ReportValidationTool()
-        
-        # Sample valid report for testing
-        self.valid_report = """
-# Executive Summary
-This is a comprehensive competitive analysis report that provides detailed insights into the market landscape and competitive positioning.
-
-## Analysis
-The market analysis reveals significant opportunities for growth and competitive advantage through strategic positioning and innovation.
-
-### Market Trends
-- Digital transformation acceleration
-- Increased focus on customer experience
-- Growing emphasis on sustainability
-
-## Recommendations
-Based on our analysis, we recommend the following strategic initiatives:
-1. Invest in digital capabilities
-2. Enhance customer experience programs
-3. Develop sustainable business practices
+    @staticmethod
+    @pytest.fixture(scope="class")
+    def tool():
+        """Single tool instance shared across the class."""
+        return ReportValidationTool()
 
-## Conclusion
-The competitive landscape presents both challenges and opportunities for strategic growth.
-"""
-        
-        # Sample invalid report for testing
-        self.invalid_report = """
-# Short Report
-This is too short.
-"""
     
-    def test_tool_initialization(self):
+    def test_tool_initialization(self, tool):
         """Test that the tool initializes correctly."""
-        assert self.tool.name == "Report Quality Validator"
-        assert "validates" in self.tool.description.lower()
+        assert tool.name == "Report Quality Validator"
+        assert "validates" in tool.description.lower()
     
-    def test_valid_report_validation(self):
+    def test_valid_report_validation(self, tool):
         """Test validation of a valid report."""
-        result = self.tool._run(self.valid_report)
-        
-        assert isinstance(result, str)
-        assert "PASSED" in result or "score" in result.lower()
+        # Call _validate_report directly for the structured result; the
+        # formatting pass is covered by the invalid-report smoke test
+        # below and by test_format_validation_results.
+        result = tool._validate_report(VALID_REPORT, tool._parse_criteria(None))
+
+        assert isinstance(result, ValidationResult)
+        assert result.score > 0
+        assert result.word_count > 0
     
-    def test_invalid_report_validation(self):
+    def test_invalid_report_validation(self, tool, lowered):
         """Test validation of an invalid report."""
-        result = self.tool._run(self.invalid_report)
-        
-        assert isinstance(result, str)
-        assert ("FAILED" in result or "too short" in result.lower() or 
-                "issues found" in result.lower())
+        result = lowered(tool._run(INVALID_REPORT))
+
+        assert isinstance(result.text, str)
+        assert ("FAILED" in result.text or "too short" in result.lower or
+                "issues found" in result.lower)
     
-    def test_parse_criteria_default(self):
+    def test_parse_criteria_default(self, tool):
         """Test parsing of default validation criteria."""
-        criteria = self.tool._parse_criteria(None)
+        criteria = tool._parse_criteria(None)
         
         assert isinstance(criteria, ValidationCriteria)
         assert criteria.min_word_count == 500
         assert "Executive Summary" in criteria.required_sections
     
-    def test_parse_criteria_custom(self):
+    def test_parse_criteria_custom(self, tool):
         """Test parsing of custom validation criteria."""
-        custom_criteria = json.dumps({
-            "min_word_count": 300,
-            "required_sections": ["Summary", "Analysis"]
-        })
-        
-        criteria = self.tool._parse_criteria(custom_criteria)
-        
+        criteria = tool._parse_criteria(CUSTOM_CRITERIA_JSON)
+
         assert criteria.min_word_count == 300
         assert "Summary" in criteria.required_sections
     
-    def test_parse_criteria_invalid_json(self):
+    def test_parse_criteria_invalid_json(self, tool):
         """Test parsing of invalid JSON criteria (should use defaults)."""
-        criteria = self.tool._parse_criteria("invalid json")
+        criteria = tool._parse_criteria("invalid json")
         
         assert isinstance(criteria, ValidationCriteria)
         assert criteria.min_word_count == 500  # Default value
     
-    def test_extract_sections(self):
+    def test_extract_sections(self, parsed_valid_sections):
         """Test section extraction from markdown."""
-        sections = self.tool._extract_sections(self.valid_report)
-        
+        sections = parsed_valid_sections
+
         assert isinstance(sections, dict)
         assert "Executive Summary" in sections
         assert "Analysis" in sections
         assert "Recommendations" in sections
-    
-    def test_analyze_sections(self):
+
+    def test_analyze_sections(self, tool, parsed_valid_sections, default_criteria):
         """Test section analysis functionality."""
-        sections = self.tool._extract_sections(self.valid_report)
-        criteria = ValidationCriteria()
-        
-        analysis = self.tool._analyze_sections(sections, criteria)
-        
+        sections = parsed_valid_sections
+
+        analysis = tool._analyze_sections(sections, default_criteria)
+
         assert isinstance(analysis, dict)
-        for section_name in sections.keys():
-            assert section_name in analysis
-            assert "word_count" in analysis[section_name]
-            assert "meets_minimum" in analysis[section_name]
+        # Set algebra instead of a per-section loop: one comparison each,
+        # and a failure shows the full diff of missing names/keys at once.
+        assert analysis.keys() >= sections.keys()
+        required_keys = {"word_count", "meets_minimum"}
+        assert all(required_keys <= stats.keys() for stats in analysis.values())
     
-    def test_check_formatting(self):
+    def test_check_formatting(self, tool):
         """Test formatting validation."""
         # Test content with good formatting
         good_content = """
@@ -404,15 +518,15 @@ This is too short.
 - Bullet point 1
 - Bullet point 2
 """
-        issues = self.tool._check_formatting(good_content)
+        issues = tool._check_formatting(good_content)
         assert len(issues) == 0
         
         # Test content with poor formatting
         poor_content = "Just plain text with no formatting"
-        issues = self.tool._check_formatting(poor_content)
+        issues = tool._check_formatting(poor_content)
         assert len(issues) > 0
     
-    def test_check_citations(self):
+    def test_check_citations(self, tool):
         """Test citation validation."""
         # Test content with citations
         cited_content = """
@@ -420,15 +534,19 @@ According to recent studies, the market is growing.
 Source: Market Research Report 2024
 [Link](http://example.com)
 """
-        issues = self.tool._check_citations(cited_content)
+        issues = tool._check_citations(cited_content)
         assert len(issues) == 0
         
         # Test content without citations
         uncited_content = "This is content without any citations or sources."
-        issues = self.tool._check_citations(uncited_content)
+        issues = tool._check_citations(uncited_content)
         assert len(issues) > 0
     
-    def test_check_content_quality(self):
+    def test_patterns_precompiled(self, precompiled_validation_patterns):
+        """Test that the validation regexes are compiled once and reused."""
+        assert all(pattern is not None for pattern in precompiled_validation_patterns)
+
+    def test_check_content_quality(self, tool):
         """Test content quality validation."""
         # Test content with quality issues
         poor_content = """
@@ -436,7 +554,7 @@ TODO: Add content here.
 This is example.com/placeholder content.
 Very short. Too short. Bad.
 """
-        issues = self.tool._check_content_quality(poor_content)
+        issues = tool._check_content_quality(poor_content)
         assert len(issues) > 0
         assert any("placeholder" in issue.lower() for issue in issues)
         
@@ -447,32 +565,30 @@ The research methodology included quantitative analysis of 25% market share data
 Financial performance metrics indicate strong growth with $2.5M revenue in 2024.
 Strategic recommendations focus on sustainable competitive advantages.
 """
-        issues = self.tool._check_content_quality(good_content)
+        issues = tool._check_content_quality(good_content)
         # Should have fewer or no issues
         assert len(issues) <= 1  # Allow for minor issues
     
-    def test_calculate_quality_score(self):
+    def test_calculate_quality_score(self, tool):
         """Test quality score calculation."""
-        criteria = ValidationCriteria(min_word_count=100, max_word_count=1000)
+        criteria = _mk_criteria(min_word_count=100, max_word_count=1000)
         sections = {"Executive Summary": "content", "Analysis": "content"}
         
+        # Scores land on whole-point boundaries, so comparing through
+        # int() keeps the semantics while avoiding float compares in
+        # repeated runs.
         # Test good score
-        score = self.tool._calculate_quality_score(500, criteria, 0, sections)
-        assert score >= 90
-        
+        score = tool._calculate_quality_score(500, criteria, 0, sections)
+        assert int(score) >= 90
+
         # Test poor score with issues
-        score = self.tool._calculate_quality_score(50, criteria, 5, {})
-        assert score < 50
+        score = tool._calculate_quality_score(50, criteria, 5, {})
+        assert int(score) < 50
     
-    def test_validate_report_comprehensive(self):
+    def test_validate_report_comprehensive(self, valid_validation_result):
         """Test comprehensive report validation."""
-        criteria = ValidationCriteria(
-            min_word_count=50,  # Lower threshold for test
-            required_sections=["Executive Summary", "Analysis"]
-        )
-        
-        result = self.tool._validate_report(self.valid_report, criteria)
-        
+        result = valid_validation_result
+
         assert isinstance(result, ValidationResult)
         assert isinstance(result.is_valid, bool)
         assert isinstance(result.score, float)
@@ -481,45 +597,47 @@ Strategic recommendations focus on sustainable competitive advantages.
         assert isinstance(result.issues, list)
         assert isinstance(result.recommendations, list)
     
-    def test_format_validation_results(self):
+    def test_format_validation_results(self, tool, mock_validation_result):
         """Test validation result formatting."""
-        mock_result = ValidationResult(
-            is_valid=True,
-            score=85.5,
-            word_count=750,
-            issues=["Minor issue"],
-            recommendations=["Improve formatting"],
-            section_analysis={
-                "Executive Summary": {
-                    "word_count": 100,
-                    "meets_minimum": True,
-                    "has_structure": True,
-                    "quality_score": 90.0
-                }
-            }
-        )
-        
-        formatted = self.tool._format_validation_results(mock_result)
-        
+        formatted = tool._format_validation_results(mock_validation_result)
+
         assert "85.5/100" in formatted
         assert "750" in formatted
         assert "Minor issue" in formatted
         assert "Executive Summary" in formatted
     
-    @patch('structlog.get_logger')
-    def test_error_handling(self, mock_logger):
+    def test_error_handling(self, tool):
         """Test error handling in report validation."""
-        mock_logger.return_value = MagicMock()
-        
         # Test with invalid input that might cause an error
-        with patch.object(self.tool, '_validate_report', side_effect=Exception("Test error")):
-            result = self.tool._run("test content")
+        with patch.object(tool, '_validate_report', side_effect=Exception("Test error")):
+            result = tool._run("test content")
             assert "Error validating report" in result
 
 
+@pytest.fixture(scope="module")
+def search_output():
+    """Search tool output shared by the integration workflow tests."""
+    return CompetitiveSearchTool()._run("financial analysis", "TechCorp", "financial")
+
+
+@pytest.fixture(scope="module")
+def market_output():
+    """Market analysis output shared by the integration workflow tests."""
+    return MarketAnalysisTool()._run("TechCorp, InnovaCorp", "technology")
+
+
+@pytest.mark.slow
+@pytest.mark.integration
+@pytest.mark.xdist_group("integration")
 class TestToolIntegration:
-    """Integration tests for tool interactions."""
-    
+    """Integration tests for tool interactions.
+
+    The slow marker keeps these out of `pytest -m "not slow"` inner-loop
+    runs; the xdist_group pins them to one worker under
+    `pytest -n auto --dist=loadgroup` so the full pipelines don't skew
+    worker balance mid-run.
+    """
+
     def test_tools_can_be_instantiated_together(self):
         """Test that all tools can be instantiated without conflicts."""
         search_tool = CompetitiveSearchTool()
@@ -529,37 +647,28 @@ class TestToolIntegration:
         assert search_tool.name != market_tool.name != validation_tool.name
         assert all(hasattr(tool, '_run') for tool in [search_tool, market_tool, validation_tool])
     
-    def test_search_to_validation_workflow(self):
-        """Test workflow from search results to validation."""
-        search_tool = CompetitiveSearchTool()
-        validation_tool = ReportValidationTool()
-        
-        # Get search results
-        search_results = search_tool._run("financial analysis", "TechCorp", "financial")
-        
-        # Validate the search results as a report
-        validation_results = validation_tool._run(search_results)
-        
-        assert isinstance(search_results, str)
+    @pytest.mark.parametrize(
+        "output_fixture, expected_marker",
+        [
+            ("search_output", "Competitive Intelligence Search Results"),
+            ("market_output", "Market Analysis Report"),
+        ],
+    )
+    def test_output_to_validation_workflow(self, request, output_fixture, expected_marker):
+        """Test workflow from an upstream tool's output to validation."""
+        # Upstream outputs come from module-scoped fixtures so each tool
+        # runs once for the whole file, not once per workflow test.
+        upstream_results = request.getfixturevalue(output_fixture)
+
+        # Validate the upstream output as a report
+        validation_results = ReportValidationTool()._run(upstream_results)
+
+        assert isinstance(upstream_results, str)
         assert isinstance(validation_results, str)
-        assert len(search_results) > 0
+        assert len(upstream_results) > 0
         assert len(validation_results) > 0
-    
-    def test_market_analysis_to_validation_workflow(self):
-        """Test workflow from market analysis to validation."""
-        market_tool = MarketAnalysisTool()
-        validation_tool = ReportValidationTool()
-        
-        # Get market analysis
-        market_results = market_tool._run("TechCorp, InnovaCorp", "technology")
-        
-        # Validate the market analysis as a report
-        validation_results = validation_tool._run(market_results)
-        
-        assert isinstance(market_results, str)
-        assert isinstance(validation_results, str)
-        assert "Market Analysis Report" in market_results
-        assert ("PASSED" in validation_results or "FAILED" in validation_results or 
+        assert expected_marker in upstream_results
+        assert ("PASSED" in validation_results or "FAILED" in validation_results or
                 "score" in validation_results.lower())
 
 